@@ -1,5 +1,5 @@
 from src.animations_sprites.crop_svg_sprite import get_all_cropped_poses, get_cropped_poses
-from src.utils.config import SPRITES_SHEETS_DIR
+from src.utils.config import SPRITES_SHEETS_DIR, ensure_directories
 from pathlib import Path
 
 def get_poses_recursively() -> Path:
@@ -17,6 +17,7 @@ def get_poses_recursively() -> Path:
         return get_poses_recursively()  # Ask again
 
 if __name__ == "__main__":
+    ensure_directories()
     # Ask user for the type of cropping
     print("Make sure you have uploaded the SVG file(s) of sheet to the `assets/sprites_sheets` directory!!!")
     while True:
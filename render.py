@@ -1,40 +1,44 @@
 import os
+import sys
+import time
+import subprocess
+import threading
 import argparse
+from typing import Callable
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# NOTE: keep the imports of this module light (no manim, numpy, ...),
+# the host-side CLI must start fast. Check with `python -m src.utils.import_budget`.
 from src.utils.env_manager import ensure_venv_active
-from src.utils.config import SOURCES_DIR
+from src.utils.config import MANIM_DOCKER_IMAGE, PREWARMED_DOCKER_IMAGE, QUALITIES, SOURCES_DIR, ensure_directories
 from src.utils.docker_manager import ensure_docker_running
+from src.utils.ffmpeg import transcode_video
+from src.utils.alpha_output import ALPHA_PROFILES, DEFAULT_ALPHA_PROFILE, compare_alpha_profiles, encode_alpha
+from src.utils.parallel_render import render_in_ranges
+from src.utils.render_image import build_prewarmed_image, get_render_image, report_startup_saving
+from src.utils.render_backend import BACKENDS, DOCKER_BACKEND, pick_backend, render_command, render_env
+from src.utils.render_process import RenderCancelledError, run_render_process
+from src.utils.render_progress import RenderDashboard
+from src.utils.sections import CHECKPOINTS_ENV, SECTIONS_ENV, get_scene_sections, sections_output_name
+from src.utils.render_queue import DONE, RenderJob, RenderQueue, drain_queue, format_seconds, predict_makespan
+from src.utils.manim_scenes_finder import get_all_scenes, find_scene_by_name, scene_media_name
 
-# Ensure virtual environment is active
-if not ensure_venv_active():
-    print("❌ Cannot proceed without an active virtual environment.")
-    print("Please check the README file to set up the environment.")
-    print("Run the following commands manually:")
-    print("  uv sync")
-    print("  .venv\\Scripts\\activate  # Windows")
-    print("  source .venv/bin/activate  # Linux/Mac")
-    raise SystemExit(1)
 
-from src.utils.manim_scenes_finder import get_all_scenes, find_scene_by_name
+LAST_BATCH = "last"  # `--resume` without a batch id
+# what a render leaves in its quality folder: manim's .mp4 (.mov with -t), or an alpha profile encode
+VIDEO_SUFFIXES = {".mp4", *(suffix for suffix, _ in ALPHA_PROFILES.values())}
 
 
 def _get_quality_folder(quality: str) -> str:
     """Map quality flag to output folder name"""
-    quality_mapping = {
-        "ql": "480p15",
-        "qm": "720p30",
-        "qh": "1080p60",
-        "qp": "1440p60",
-        "qk": "2160p60"
-    }
-    return quality_mapping.get(quality, "480p15")
+    _, height, fps = QUALITIES.get(quality, QUALITIES["ql"])
+    return f"{height}p{fps}"
 
 
 def _build_expected_video_path(module_path: str, class_name: str, quality: str) -> tuple[Path, Path]:
-    """Build expected local video path"""
-    # Convert module_path to module_name (e.g., "src/animations_sprites/manim_sprites" -> "animations_sprites.manim_sprites")
-    module_name = Path(module_path).stem if "." not in module_path else module_path.split(".")[-1]
+    """Build expected local video path (as `.mp4`, see `_find_rendered_video` for the actual file)"""
+    module_name = scene_media_name(module_path)
     quality_folder = _get_quality_folder(quality)
     media_dir = Path("media")
     video_path = media_dir / "videos" / module_name / quality_folder / f"{class_name}.mp4"
@@ -42,8 +46,120 @@ def _build_expected_video_path(module_path: str, class_name: str, quality: str)
     return video_path, image_path
 
 
-def render_scene(scene_name: str, quality: str, project_dir: Path, transparent: bool = False) -> bool:
-    """Render a single scene."""
+def _pick_render_quality(qualities: list[str]) -> str:
+    """Pick the highest quality (pixels per second) from the requested ones"""
+    return max(qualities, key=lambda q: QUALITIES[q][0] * QUALITIES[q][1] * QUALITIES[q][2])
+
+
+def derive_qualities(
+    video_path: Path,
+    module_path: str,
+    class_name: str,
+    qualities: list[str],
+    project_dir: Path,
+    image: str | None = MANIM_DOCKER_IMAGE,
+    alpha_profile: str | None = None,
+) -> list[Path]:
+    """
+    Produce lower qualities of a rendered scene by transcoding instead of re-rendering.
+
+    Args:
+        video_path (Path): The rendered (highest quality) video.
+        module_path (str): Module path of the scene (as returned by find_scene_by_name).
+        class_name (str): The scene class name (the output name of a `--sections` render).
+        qualities (list[str]): Quality flags to derive (e.g. ["ql", "qm"]).
+        project_dir (Path): The project root.
+        image (str, optional): Render image used when ffmpeg is not installed locally.
+        alpha_profile (str | None, optional): For a transparent render (manim's `.mov`), the
+            alpha profile to encode the derived videos into. Defaults to None.
+
+    Returns:
+        list[Path]: The derived videos, in the same `media/videos/<module>/<quality>/` layout.
+    """
+    derived = []
+    with ThreadPoolExecutor(max_workers=max(1, min(len(qualities), os.cpu_count() or 1))) as pool:
+        futures = {}
+        for quality in qualities:
+            width, height, fps = QUALITIES[quality]
+            target_path, _ = _build_expected_video_path(module_path, class_name, quality)
+            target_path = target_path.with_suffix(video_path.suffix)
+            future = pool.submit(
+                _derive_quality, video_path, target_path, width, height, fps, project_dir, image, alpha_profile
+            )
+            futures[future] = (quality, target_path, time.perf_counter())
+
+        for future in as_completed(futures):
+            quality, target_path, start = futures[future]
+            try:
+                target_path = future.result()
+            except RuntimeError as e:
+                print(f"⚠️  Failed to derive -{quality}: {str(e)[-500:]}")
+                continue
+            print(f"📹 Derived -{quality} in {time.perf_counter() - start:.1f}s: {target_path}")
+            derived.append(target_path)
+    return derived
+
+
+def _derive_quality(
+    video_path: Path,
+    target_path: Path,
+    width: int,
+    height: int,
+    fps: int,
+    project_dir: Path,
+    image: str | None,
+    alpha_profile: str | None = None,
+) -> Path:
+    """Transcode one quality (then encode it into the alpha profile), raise RuntimeError on failure"""
+    result = transcode_video(video_path, target_path, width, height, fps, project_dir, image)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    if alpha_profile is not None and alpha_profile != DEFAULT_ALPHA_PROFILE:
+        return encode_alpha(target_path, alpha_profile, project_dir, image)
+    return target_path
+
+
+def _find_rendered_video(module_path: str, class_name: str, quality: str) -> Path | None:
+    """
+    Return the newest `<class_name>.*` video of the quality folder (manim's `.mp4` or `.mov`,
+    or the encode of an alpha profile), whatever the options it was rendered with; None if
+    there is none.
+    """
+    expected_path, _ = _build_expected_video_path(module_path, class_name, quality)
+    videos = [
+        path for path in expected_path.parent.glob("*.*")
+        if path.stem == class_name and path.suffix in VIDEO_SUFFIXES and path.is_file()
+    ]
+    return max(videos, key=lambda path: path.stat().st_mtime, default=None)
+
+
+def render_scene(
+    scene_name: str,
+    quality: str,
+    project_dir: Path,
+    transparent: bool = False,
+    image: str | None = MANIM_DOCKER_IMAGE,
+    derive: list[str] | None = None,
+    parallel: int = 1,
+    sections: list[str] | None = None,
+    checkpoints: bool = False,
+    timeout: float | None = None,
+    cancel_event: threading.Event | None = None,
+    interactive: bool = True,
+    alpha_profile: str | None = None,
+    alpha_report: bool = False,
+    output: Callable[[str], None] | None = None,
+) -> bool:
+    """
+    Render a single scene (split into `parallel` animation ranges if > 1),
+    only its given `sections` if any, into `<Scene>_sections_<names>` (the others are
+    fast-forwarded, or restored from a checkpoint with `checkpoints`). `image` None renders in the project venv (local backend).
+    A transparent render is encoded into `alpha_profile` (`alpha_report`: compared in all of them).
+    `output` receives manim's output lines instead of the terminal (see `run_render_process`).
+
+    Raises:
+        RenderCancelledError: If `cancel_event` is set while rendering.
+    """
     print(f"Rendering scene: {scene_name} with quality: {quality}")
 
     module_path, class_name = find_scene_by_name(scene_name)
@@ -63,31 +179,66 @@ def render_scene(scene_name: str, quality: str, project_dir: Path, transparent:
 
     print(f"\n🎬 Rendering scene: {class_name} with quality: {quality}")
 
-    transparent_flag = "-t" if transparent else ""
-
-    command = (
-        f'docker run -it --rm -v "{project_dir}:/manim" -w /manim '
-        f"-e PYTHONPATH=/manim "
-        f"manimcommunity/manim manim {file_name} {class_name} -{quality} {transparent_flag}"
+    manim_command = ["manim", file_name, class_name, f"-{quality}"] + (["-t"] if transparent else [])
+    # named, so that a timed out or cancelled render can be killed
+    container_name = f"kse-render-{class_name.lower()}-{os.getpid()}-{threading.get_ident()}"
+    env = {}
+    output_name = class_name
+    if sections:
+        env[SECTIONS_ENV] = ",".join(sections)
+        # its own video: the full render of the scene stays what lectures, packages and the queue use
+        output_name = sections_output_name(class_name, sections)
+        manim_command += ["-o", output_name]
+    if checkpoints:
+        env[CHECKPOINTS_ENV] = "1"
+    command = render_command(
+        project_dir, image, manim_command, env=env, name=container_name, tty=interactive and sys.stdin.isatty()
     )
-    print(f"🐳 Running command: {command}")
 
     try:
-        exit_code = os.system(command)
+        if parallel > 1:
+            expected_path, _ = _build_expected_video_path(module_path, class_name, quality)
+            render_in_ranges(
+                file_name, class_name, quality, expected_path, project_dir, image, parallel, transparent,
+                timeout=timeout,
+                cancel_event=cancel_event,
+                container_name=container_name if image else None,
+                output=output,
+            )
+            exit_code = 0
+        else:
+            print(f"{'🐳' if image else '🖥️ '} Running command: {' '.join(command)}")
+            exit_code = run_render_process(
+                command,
+                container_name if image else None,
+                timeout,
+                cancel_event,
+                env=render_env(project_dir, image, env),
+                cwd=str(project_dir),
+                output=output,
+            )
 
         if exit_code == 0:
             print("\n✅ Rendering completed!")
-            expected_path, image_path = _build_expected_video_path(
-                module_path, class_name, quality)
-            if expected_path.exists():
-                print(f"📹 Video file ready at: {expected_path}")
+            _, image_path = _build_expected_video_path(module_path, output_name, quality)
+            # manim's own output: the .mp4, or the .mov of a transparent render
+            video_path = _find_rendered_video(module_path, output_name, quality)
+            if video_path is not None:
+                print(f"📹 Video file ready at: {video_path}")
             else:
-                # try to change .mp4 to .mov
-                alt_path = expected_path.with_suffix(".mov")
-                if alt_path.exists():
-                    print(f"📹 Video file ready at: {alt_path}")
-                else:
-                    print("⚠️  Video file not found at expected location.")
+                print("⚠️  Video file not found at expected location.")
+
+            if derive and video_path is not None:
+                derive_qualities(
+                    video_path, module_path, output_name, derive, project_dir, image, alpha_profile if transparent else None
+                )
+            if transparent and video_path is not None:
+                if alpha_report:
+                    compare_alpha_profiles(video_path, project_dir, image)
+                if alpha_profile and alpha_profile != DEFAULT_ALPHA_PROFILE:
+                    start = time.perf_counter()
+                    video_path = encode_alpha(video_path, alpha_profile, project_dir, image)
+                    print(f"📹 Encoded as {alpha_profile} in {time.perf_counter() - start:.1f}s: {video_path}")
 
             if image_path.exists():
                 print(f"🖼️ Image file ready at: {image_path}")
@@ -98,11 +249,218 @@ def render_scene(scene_name: str, quality: str, project_dir: Path, transparent:
             print(f"\n❌ Rendering failed with exit code: {exit_code}")
             return False
 
+    except RenderCancelledError:
+        print(f"🛑 Rendering of {class_name} cancelled")
+        raise
     except Exception as e:
         print(f"❌ Error during rendering: {e}")
         return False
 
 
+def render_batch(
+    queue: RenderQueue,
+    batch: str,
+    project_dir: Path,
+    image: str | None,
+    jobs: int = 1,
+    timeout: float | None = None,
+) -> list[RenderJob]:
+    """
+    Drain a batch of the render queue with `jobs` concurrent renders.
+    With several, their output is summarized in a dashboard with the ETA of the batch
+    (and logged as events to `.cache/render_events.jsonl`).
+
+    Returns:
+        list[RenderJob]: All the jobs of the batch, with their final status.
+    """
+    dashboard = RenderDashboard(batch, queue.jobs(batch), jobs) if jobs > 1 else None
+
+    def render_job(job: RenderJob, cancel_event: threading.Event) -> Path | None:
+        if dashboard is not None:
+            dashboard.started(job)
+        ok = False
+        try:
+            ok = render_scene(
+                job.scene,
+                job.quality,
+                project_dir,
+                job.transparent,
+                image,
+                job.options.get("derive"),
+                job.options.get("parallel", 1),
+                job.options.get("sections"),
+                job.options.get("checkpoints", False),
+                timeout=timeout,
+                cancel_event=cancel_event,
+                interactive=jobs == 1,
+                alpha_profile=job.options.get("alpha_profile"),
+                alpha_report=job.options.get("alpha_report", False),
+                output=dashboard.output(job) if dashboard is not None else None,
+            )
+        finally:
+            if dashboard is not None and not cancel_event.is_set():
+                dashboard.finished(job, ok)
+        if not ok:
+            raise RuntimeError(f"rendering of {job.scene} failed")
+        module_path, class_name = find_scene_by_name(job.scene)
+        sections = job.options.get("sections")
+        output_name = sections_output_name(class_name, sections) if sections else class_name
+        return _find_rendered_video(module_path, output_name, job.quality)
+
+    predicted = _predict_batch(queue.jobs(batch), jobs)
+    start = time.perf_counter()
+    if dashboard is not None:
+        with dashboard:
+            completed = drain_queue(queue, batch, render_job, workers=jobs)
+    else:
+        completed = drain_queue(queue, batch, render_job, workers=jobs)
+    if not completed:
+        print(f"🛑 Batch {batch} cancelled, continue it with `python render.py --resume`")
+    elif predicted is not None:
+        actual = time.perf_counter() - start
+        print(f"⏱️  Batch took {format_seconds(actual)}, predicted {format_seconds(predicted)} ({(predicted - actual) / actual:+.0%})")
+    return queue.jobs(batch)
+
+
+def render_lecture(
+    lecture_id: str,
+    quality: str,
+    project_dir: Path,
+    image: str | None,
+    transparent: bool = False,
+    jobs: int = 1,
+    timeout: float | None = None,
+    max_attempts: int = 3,
+    alpha_profile: str | None = None,
+) -> Path | None:
+    """
+    Render the missing scenes of a lecture manifest and join all of them into one video
+    (stream copy, a chapter per scene).
+
+    Returns:
+        Path | None: The lecture video, None if a scene failed or cannot be joined.
+    """
+    from src.utils.lectures import LectureError, assemble_lecture, lecture_output_path, load_lecture
+
+    try:
+        lecture = load_lecture(lecture_id)
+    except LectureError as e:
+        print(f"❌ {e}")
+        return None
+    unknown = [scene for scene in lecture.scenes if not find_scene_by_name(scene)[1]]
+    if unknown:
+        print(f"❌ Scenes of {lecture.path.name} not found: {', '.join(unknown)}")
+        return None
+
+    def rendered_videos() -> dict[str, Path]:
+        videos = {}
+        for scene in lecture.scenes:
+            video = _find_rendered_video(*find_scene_by_name(scene), quality)
+            if video is not None:
+                videos[scene] = video
+        return videos
+
+    videos = rendered_videos()
+    missing = [scene for scene in dict.fromkeys(lecture.scenes) if scene not in videos]
+    print(f"📚 Lecture {lecture.title}: {len(lecture.scenes)} scenes, {len(missing)} to render at -{quality}")
+    if missing:
+        queue = RenderQueue()
+        batch = queue.create_batch(
+            missing, quality, transparent, options={"alpha_profile": alpha_profile}, max_attempts=max_attempts
+        )
+        render_batch(queue, batch, project_dir, image, jobs, timeout)
+        queue.close()
+        videos = rendered_videos()
+        failed = [scene for scene in missing if scene not in videos]
+        if failed:
+            print(f"❌ Lecture not assembled, failed scenes: {', '.join(failed)}")
+            return None
+
+    start = time.perf_counter()
+    try:
+        output = assemble_lecture(
+            lecture, videos, lecture_output_path(lecture, _get_quality_folder(quality)), project_dir, image
+        )
+    except LectureError as e:
+        print(f"❌ {e}")
+        return None
+    print(f"🎞️  Lecture assembled without re-encoding in {time.perf_counter() - start:.1f}s: {output}")
+    return output
+
+
+def _predict_batch(batch_jobs: list[RenderJob], workers: int) -> float | None:
+    """Print the expected duration of the remaining jobs (longest first, as the queue hands them out)"""
+    todo = [job for job in batch_jobs if job.status != DONE]
+    known = [job.estimate for job in todo if job.estimate is not None]
+    if not known:
+        print("⏱️  No render history for these scenes yet, no time estimate")
+        return None
+
+    # scenes never rendered are handed out first, count them as an average one
+    unknown = len(todo) - len(known)
+    average = sum(known) / len(known)
+    durations = [average] * unknown + sorted(known, reverse=True)
+    predicted = predict_makespan(durations, workers)
+    estimates = ", ".join(
+        f"{job.scene} {format_seconds(job.estimate)}" for job in sorted(todo, key=lambda job: -(job.estimate or 0)) if job.estimate
+    )
+    print(
+        f"⏱️  Predicted: {format_seconds(predicted)} on {workers} worker(s), longest first ({estimates}"
+        + (f", {unknown} without history counted as {format_seconds(average)})" if unknown else ")")
+    )
+    return predicted
+
+
+def _parse_sections(value: str | None, scene_names: list[str]) -> list[str] | None:
+    """Parse `--sections a,b` and check that every section exists in one of the scenes"""
+    if not value:
+        return None
+    sections = [name.strip() for name in value.split(",") if name.strip()]
+
+    known = set()
+    for scene_name in scene_names:
+        module_path, class_name = find_scene_by_name(scene_name)
+        if class_name:
+            source_file = (SOURCES_DIR / module_path.replace(".", "/")).with_suffix(".py")
+            scene_sections = get_scene_sections(source_file, class_name)
+            print(f"📑 {class_name} sections: {', '.join(scene_sections) or 'none'}")
+            known.update(scene_sections)
+
+    unknown = [name for name in sections if name not in known]
+    if scene_names and unknown:
+        print(f"❌ Unknown sections: {', '.join(unknown)}")
+        raise SystemExit(1)
+    return sections
+
+
+def prepare_render_image(project_dir: Path, backend: str | None = None) -> str | None:
+    """
+    Pick the render backend, then for Docker make sure it runs (exit otherwise) and pick the image.
+
+    Returns:
+        str | None: The render image, None for the local backend.
+    """
+    if pick_backend(backend) != DOCKER_BACKEND:
+        ensure_directories()
+        return None
+
+    # Ensure Docker is running
+    if not ensure_docker_running():
+        print("❌ Cannot proceed without Docker running.")
+        print("Please start Docker manually and try again.")
+        raise SystemExit(1)
+
+    ensure_directories()
+
+    image = get_render_image()
+    if image == PREWARMED_DOCKER_IMAGE:
+        print(f"🔥 Using prewarmed image: {image}")
+        report_startup_saving(project_dir)
+    else:
+        print("💡 Tip: build the prewarmed image with `python render.py --build-image` for faster container startup.")
+    return image
+
+
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="Render Manim scenes")
@@ -131,9 +489,87 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--transparent", "-t", action="store_true", help="Render scene with transparent background (alpha channel)"
     )
+    parser.add_argument(
+        "--alpha-profile", choices=list(ALPHA_PROFILES),
+        help="Output of transparent renders: qtrle .mov (manim's, default), prores 4444 .mov, webm (VP9) or png (zipped frames)"
+    )
+    parser.add_argument(
+        "--alpha-report", action="store_true",
+        help="With --transparent: compare the size and encode time of every alpha profile for the rendered scene"
+    )
+    parser.add_argument(
+        "--derive", metavar="QUALITIES",
+        help="Comma-separated extra qualities (e.g. ql,qm): render once at the highest one and transcode the rest"
+    )
+    parser.add_argument(
+        "--parallel", "-p", type=int, default=1, metavar="N",
+        help="Split each scene into N animation ranges rendered in parallel and joined losslessly"
+    )
+    parser.add_argument(
+        "--sections", "-s", metavar="NAMES",
+        help="Comma-separated sections to render into <Scene>_sections_<names>, the others are fast-forwarded without encoding them"
+    )
+    parser.add_argument(
+        "--checkpoints", action="store_true",
+        help="Save the scene state at every section start; with --sections resume from the first selected one"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, metavar="N", help="Render N scenes concurrently"
+    )
+    parser.add_argument(
+        "--timeout", type=float, metavar="SECONDS", help="Time limit per render attempt"
+    )
+    parser.add_argument(
+        "--retries", type=int, default=2, metavar="N", help="Retry a failed render N times, with backoff (default: 2)"
+    )
+    parser.add_argument(
+        "--resume", nargs="?", const=LAST_BATCH, metavar="BATCH",
+        help="Resume the last batch (or the given one): skip completed scenes, retry failed and unfinished ones"
+    )
+    parser.add_argument(
+        "--watch", "-w", action="store_true",
+        help="Watch the project and re-render the scenes affected by every change (optionally only the given scenes)"
+    )
+    parser.add_argument(
+        "--lecture", metavar="ID",
+        help="Render the missing scenes of a lecture manifest (src/animations_lectures/<ID>.toml) and join them with chapters"
+    )
+    parser.add_argument(
+        "--contact-sheet", action="store_true",
+        help="Tile the end frame of every play of the scenes (default: all) into a PNG per scene, without rendering videos"
+    )
+    parser.add_argument(
+        "--by-sections", action="store_true", help="With --contact-sheet: a frame per section instead of per play"
+    )
+    parser.add_argument(
+        "--package", action="store_true",
+        help="Build HLS/DASH streaming packages of the rendered videos at the quality (default: all scenes and lectures)"
+    )
+    parser.add_argument(
+        "--lint", action="store_true", help="Flag mobjects built when the scene modules are imported"
+    )
+    parser.add_argument(
+        "--estimate", action="store_true",
+        help="Print the expected frames and render time of the scenes (default: all) at every quality, without rendering"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="With --estimate: replay construct without frames for exact times and the peak number of mobjects"
+    )
+    parser.add_argument(
+        "--backend", choices=BACKENDS,
+        help="Render with manim from the project venv (local) or in Docker (default: local if LaTeX and ffmpeg are installed)"
+    )
     parser.add_argument(
         "--list", "-l", action="store_true", help="List all available scenes"
     )
+    parser.add_argument(
+        "--build-image", action="store_true",
+        help="Build the prewarmed render image (TeX format, font caches, bytecode) and report the startup time saved"
+    )
+    parser.add_argument(
+        "--precrop-sprites", action="store_true", help="With --build-image: bake pre-cropped sprite poses into the image"
+    )
 
     # Set default quality if none specified
     parser.set_defaults(quality="ql")
@@ -152,7 +588,24 @@ def print_usage():
     """Print usage and available quality options"""
     print("\nUsage:")
     print("  python render.py <scene_name> [-ql|-qm|-qh|-qp|-qk]  # Render scene with quality (default: -ql, low)")
+    print("  python render.py <scene_name> -qh --derive ql,qm     # Render once at -qh, transcode -ql and -qm")
+    print("  python render.py <scene_name> -qh --parallel 4       # Render 4 animation ranges in parallel")
+    print("  python render.py <scene_name> -t --alpha-profile png  # Transparent render as zipped PNG frames")
+    print("  python render.py <scene_name> --sections a,b         # Render only sections a and b of the scene")
+    print("  python render.py <scene_name> -s b --checkpoints     # Resume at section b from a saved checkpoint")
+    print("  python render.py <scene1>,<scene2> --jobs 2          # Render 2 scenes concurrently")
+    print("  python render.py --resume                            # Resume the last interrupted batch")
+    print("  python render.py --lecture 24 -qh                    # Render lecture 24 and join its scenes")
+    print("  python render.py --watch [<scene1>,<scene2>]         # Re-render affected scenes on every save")
+    print("  python render.py <scene_name> --backend docker       # Render in Docker even with a local toolchain")
+    print("  python render.py <scene_name> --contact-sheet        # End frames of every play on one image")
+    print("  python render.py --package -qh                       # HLS/DASH packages of the 1080p60 videos")
+    print("  python render.py cache stats                         # Size of media/ per category")
+    print("  python render.py cache prune --max-size 20G          # Evict least recently used media")
     print("  python render.py --list                              # List all scenes")
+    print("  python render.py --lint                              # Flag mobjects built at import time")
+    print("  python render.py --estimate [<scene>] [--dry-run]    # Expected frames and render time per quality")
+    print("  python render.py --build-image                       # Build the prewarmed render image")
     print("  python render.py                                     # Show this help")
     print("\nQuality options:")
     print("  -ql, --quality-low         Low quality (854x480p15FPS)")
@@ -163,33 +616,174 @@ def print_usage():
 
 
 if __name__ == "__main__":
+    # Ensure virtual environment is active
+    if not ensure_venv_active():
+        print("❌ Cannot proceed without an active virtual environment.")
+        print("Please check the README file to set up the environment.")
+        print("Run the following commands manually:")
+        print("  uv sync")
+        print("  .venv\\Scripts\\activate  # Windows")
+        print("  source .venv/bin/activate  # Linux/Mac")
+        raise SystemExit(1)
+
+    if sys.argv[1:2] == ["cache"]:
+        from src.utils.media_cache import main as cache_main  # `render.py cache stats|prune`, only needed here
+
+        raise SystemExit(cache_main(sys.argv[2:]))
+
     args = parse_arguments()
 
+    project_dir = Path(__file__).resolve().parent
+
     if args.list:
         print_available_scenes()
-    elif args.scenes:
-        # Ensure Docker is running
+    elif args.build_image:
         if not ensure_docker_running():
             print("❌ Cannot proceed without Docker running.")
-            print("Please start Docker manually and try again.")
             raise SystemExit(1)
-
-        scene_list = [scene.strip() for scene in args.scenes.split(",")]
-        project_dir = Path(__file__).resolve().parent
-        print(
-            f"Rendering scenes: {', '.join(scene_list)} with quality: {args.quality}{' (transparent)' if args.transparent else ''}"
+        if not build_prewarmed_image(project_dir, precrop_sprites=args.precrop_sprites):
+            print("❌ Failed to build the prewarmed image.")
+            raise SystemExit(1)
+        print(f"\n✅ Prewarmed image ready: {PREWARMED_DOCKER_IMAGE}")
+        report_startup_saving(project_dir, measure=True)
+    elif args.lint:
+        image = prepare_render_image(project_dir, args.backend)
+        command = render_command(project_dir, image, ["python", "-m", "src.utils.lazy_mobjects"])
+        raise SystemExit(subprocess.run(command, cwd=project_dir, env=render_env(project_dir, image)).returncode)
+    elif args.lecture:
+        image = prepare_render_image(project_dir, args.backend)
+        output = render_lecture(
+            args.lecture, args.quality, project_dir, image, args.transparent, args.jobs, args.timeout, args.retries + 1,
+            args.alpha_profile,
         )
-
-        successful_scenes = []
-        for scene_name in scene_list:
-            if render_scene(scene_name, args.quality, project_dir, args.transparent):
-                successful_scenes.append(scene_name)
-
+        raise SystemExit(0 if output else 1)
+    elif args.contact_sheet:
+        from src.utils.contact_sheet import make_contact_sheets  # only needed here
+
+        image = prepare_render_image(project_dir, args.backend)
+        scene_list = [scene.strip() for scene in args.scenes.split(",")] if args.scenes else [name for _, name in get_all_scenes()]
+        unknown = [scene for scene in scene_list if not find_scene_by_name(scene)[1]]
+        if unknown:
+            print(f"❌ Scenes not found: {', '.join(unknown)}")
+            raise SystemExit(1)
+        start = time.perf_counter()
+        sheets = make_contact_sheets(scene_list, project_dir, image, args.by_sections, workers=max(args.jobs, os.cpu_count() or 2))
+        print(f"🖼️  {len(sheets)}/{len(scene_list)} contact sheet(s) in {time.perf_counter() - start:.1f}s")
+        raise SystemExit(0 if len(sheets) == len(scene_list) else 1)
+    elif args.package:
+        from src.utils.streaming import package_videos, streaming_sources  # only needed here
+
+        ensure_directories()
+        scene_list = [scene.strip() for scene in args.scenes.split(",")] if args.scenes else None
+        sources = streaming_sources(_get_quality_folder(args.quality), scene_list)
+        if not sources:
+            print(f"❌ No rendered -{args.quality} videos to package, render them first")
+            raise SystemExit(1)
+        package_videos(sources, project_dir, MANIM_DOCKER_IMAGE, workers=args.jobs if args.jobs > 1 else os.cpu_count() or 2)
+    elif args.estimate:
+        from src.utils.scene_cost import all_scene_names, report_costs  # only needed here, keeps the CLI startup fast
+
+        image = prepare_render_image(project_dir, args.backend) if args.dry_run else None
+        scene_list = [scene.strip() for scene in args.scenes.split(",")] if args.scenes else all_scene_names()
+        queue = RenderQueue()
+        report_costs(scene_list, queue, args.transparent, project_dir, image, dry=args.dry_run)
+        queue.close()
+    elif args.watch:
+        from src.utils.watch import watch_scenes  # only needed here, keeps the CLI startup fast
+
+        image = prepare_render_image(project_dir, args.backend)
+        scene_list = [scene.strip() for scene in args.scenes.split(",")] if args.scenes else None
+
+        sections = _parse_sections(args.sections, scene_list or [])
+
+        def render_preview(scene_name: str, cancel_event: threading.Event) -> bool:
+            return render_scene(
+                scene_name, args.quality, project_dir, args.transparent, image,
+                sections=sections, checkpoints=args.checkpoints, cancel_event=cancel_event, interactive=False,
+            )
+
+        watch_scenes(render_preview, scene_list)
+    elif args.scenes or args.resume:
+        image = prepare_render_image(project_dir, args.backend)
+
+        queue = RenderQueue()
+        if args.resume:
+            batch = queue.latest_batch() if args.resume == LAST_BATCH else args.resume
+            if batch is None:
+                print("✅ Nothing to resume, no batch was rendered yet.")
+                raise SystemExit(0)
+            batch_jobs = queue.jobs(batch)
+            if not batch_jobs:
+                print(f"❌ Unknown batch: {batch}")
+                raise SystemExit(1)
+            if all(job.status == DONE for job in batch_jobs):
+                print(f"✅ Nothing to resume, batch {batch} was rendered completely.")
+                older = queue.unfinished_batches()
+                if older:
+                    print("Older unfinished batches (resume one with `python render.py --resume <batch>`):")
+                    for candidate, done, total, created_at in older:
+                        print(f"  {candidate}  {done}/{total} done, started {time.strftime('%Y-%m-%d %H:%M', time.localtime(created_at))}")
+                raise SystemExit(0)
+            queue.prepare_resume(batch)
+            batch_jobs = queue.jobs(batch)
+            done = [job.scene for job in batch_jobs if job.status == DONE]
+            todo = [job.scene for job in batch_jobs if job.status != DONE]
+            print(f"⏯️  Resuming batch {batch}: {len(done)} done, rendering: {', '.join(todo)}")
+        else:
+            quality = args.quality
+            derive = []
+            if args.derive:
+                qualities = [q.strip().lstrip("-") for q in args.derive.split(",") if q.strip()]
+                unknown = [q for q in qualities if q not in QUALITIES]
+                if unknown:
+                    print(f"❌ Unknown qualities in --derive: {', '.join(unknown)} (use {', '.join(QUALITIES)})")
+                    raise SystemExit(1)
+                qualities = list(dict.fromkeys([args.quality, *qualities]))
+                quality = _pick_render_quality(qualities)
+                derive = [q for q in qualities if q != quality]
+                print(f"Rendering once at -{quality}, deriving: {', '.join('-' + q for q in derive)}")
+
+            scene_list = [scene.strip() for scene in args.scenes.split(",")]
+            # an unknown scene would only fail again on every retry
+            unknown = [scene for scene in scene_list if not find_scene_by_name(scene)[1]]
+            if unknown:
+                print(f"❌ Scenes not found: {', '.join(unknown)}")
+                print_available_scenes()
+                raise SystemExit(1)
+            print(
+                f"Rendering scenes: {', '.join(scene_list)} with quality: {quality}{' (transparent)' if args.transparent else ''}"
+            )
+            sections = _parse_sections(args.sections, scene_list)
+            parallel = args.parallel
+            if (sections or args.checkpoints) and parallel > 1:
+                print("⚠️  --sections/--checkpoints render serially, ignoring --parallel")
+                parallel = 1
+            batch = queue.create_batch(
+                scene_list,
+                quality,
+                args.transparent,
+                options={
+                    "derive": derive,
+                    "parallel": parallel,
+                    "sections": sections,
+                    "checkpoints": args.checkpoints,
+                    "alpha_profile": args.alpha_profile,
+                    "alpha_report": args.alpha_report,
+                },
+                max_attempts=args.retries + 1,
+            )
+
+        batch_jobs = render_batch(queue, batch, project_dir, image, args.jobs, args.timeout)
+        queue.close()
+
+        successful_scenes = [job.scene for job in batch_jobs if job.status == DONE]
         succ_num = len(successful_scenes)
-        all_num = len(scene_list)
+        all_num = len(batch_jobs)
         print(f"\n🎉 Successfully rendered scenes [{succ_num}/{all_num}]:")
         for scene in successful_scenes:
             print(f"  - {scene}")
+        if succ_num < all_num:
+            print("⏯️  Re-run the remaining scenes with `python render.py --resume`")
     else:
         print_available_scenes()
         print_usage()
@@ -1,36 +1,51 @@
 from manim import *  # type: ignore
 from src.utils.manim_config import turn_debug_mode_on, UkrainianTexTemplate
-from src.utils.config import LOGOS_DIR, IS_DEBUG_MODE_ON
+from src.utils.config import LOGOS_DIR, EMBEDDINGS_FILE, IS_DEBUG_MODE_ON
+from src.utils.asset_cache import AssetCache
+from src.utils.sections import section
+from src.utils.text_cache import cached_text
+from src.utils.lazy_mobjects import LazyMobject
+from src.utils.style_buffer import FadeAllExcept
+from src.utils.arrow_field import ArrowField, GrowArrowField
+from src.utils.embeddings import EmbeddingStore
+from src.utils.chat_transcript import ChatTranscript, RevealMessage
 import numpy as np
 
+LOGOS = AssetCache(LOGOS_DIR)
+
 
 class LogosIntro(Scene):
 
     OFFSET = 0.5
 
+    def setup(self):
+        # start parsing the logos in the background, only when this scene is rendered
+        LOGOS.preload("chatgpt", "claude", "gemini", "deepseek", "grok")
+
     def construct(self):
         if IS_DEBUG_MODE_ON:
             turn_debug_mode_on(scene=self, opacity=0.5)
 
         logos = self.get_logos()
 
-        self.animate_logos(logos, is_skipped=False)
+        self.animate_logos(logos)
         self.wait()
 
     def get_logos(self) -> dict[str, SVGMobject]:
         logos = dict()
-        logos["chatgpt"] = SVGMobject(LOGOS_DIR / "chatgpt.svg").set_color(WHITE)
-        logos["claude"] = SVGMobject(LOGOS_DIR / "claude.svg")
+        logos["chatgpt"] = LOGOS.svg("chatgpt").set_color(WHITE)
+        logos["claude"] = LOGOS.svg("claude")
         # gradient colors for the logo
-        logos["gemini"] = SVGMobject(LOGOS_DIR / "gemini.svg").set_fill(
+        logos["gemini"] = LOGOS.svg("gemini").set_fill(
             color=["#00BCD4", "#2196F3", "#3F51B5", "#673AB7"],  # type: ignore
             opacity=1,
         )
-        logos["deepseek"] = SVGMobject(LOGOS_DIR / "deepseek.svg")
-        logos["grok"] = SVGMobject(LOGOS_DIR / "grok.svg").set_color(WHITE)
+        logos["deepseek"] = LOGOS.svg("deepseek")
+        logos["grok"] = LOGOS.svg("grok").set_color(WHITE)
         return logos
 
-    def animate_logos(self, logos: dict[str, SVGMobject], is_skipped: bool = True):
+    @section()
+    def animate_logos(self, logos: dict[str, SVGMobject]):
 
         intro_anim = DrawBorderThenFill(logos["chatgpt"])
 
@@ -70,10 +85,6 @@ class LogosIntro(Scene):
             logos["grok"].animate.move_to(grok_copy).set_width(grok_copy.width)
         )
 
-        if is_skipped:
-            self.add(logos["claude"])
-            return
-
         self.play(intro_anim)
         self.wait()
 
@@ -101,8 +112,14 @@ class ChatGPTSimulation(Scene):
     upper_edge = UP * 3
     right_edge = RIGHT * 4
     left_edge = LEFT * 3
-    big_question_mark = Text("?", font_size=221, color=RED)
-    heading = Text("ChatGPT", font_size=52).to_edge(UL)
+
+    @LazyMobject
+    def big_question_mark(self) -> Text:
+        return cached_text("?", font_size=221, color=RED)
+
+    @LazyMobject
+    def heading(self) -> Text:
+        return cached_text("ChatGPT", font_size=52).to_edge(UL)
 
     def construct(self):
 
@@ -110,35 +127,22 @@ class ChatGPTSimulation(Scene):
             turn_debug_mode_on(scene=self, opacity=0.5)
 
         messages = self._get_messages()
-        boxed_messages = self.get_boxed_messages(messages)
+        transcript = self.get_transcript(messages)
 
-        self.play(Write(self.heading))
-        self.wait(1)
+        self.animate_heading()
 
         # Animate the boxed messages to appear one by one
-        self.animate_boxed_messages(boxed_messages, is_skipped=IS_DEBUG_MODE_ON)
+        self.animate_boxed_messages(transcript)
         self.wait(1)
 
         # all the messages are changing to half opacity and appearing big question mark
-        self.animate_fade_all_messages(
-            boxed_messages, opacity=0.1, is_skipped=IS_DEBUG_MODE_ON
-        )
+        self.animate_fade_all_messages(opacity=0.1)
         self.wait(1)
 
-    def _get_boxed_message(self, message: str, is_user: bool) -> VGroup:
-        """Create a boxed message with an arrow pointing left or right."""
-        text = Text(message, font_size=self.TEXT_SIZE, line_spacing=0.5)
-        box_color = BLUE_E if is_user else GREEN_E
-        box = SurroundingRectangle(
-            text,
-            corner_radius=self.ROUNDNESS,
-            color=box_color,
-            fill_color=box_color,
-            fill_opacity=0.5,
-            buff=0.2,
-        )
-
-        return VGroup(box, text)
+    @section()
+    def animate_heading(self):
+        self.play(Write(self.heading))
+        self.wait(1)
 
     def _get_messages(self) -> list[tuple[str, bool]]:
         messages = [
@@ -149,49 +153,35 @@ class ChatGPTSimulation(Scene):
         ]
         return messages
 
-    def get_boxed_messages(self, messages: list[tuple[str, bool]]) -> list[VGroup]:
-        """Animate the boxed messages to appear one by one."""
-        boxed_messages: list[VGroup] = []
-        for msg, is_user in messages:
-            boxed_msg = self._get_boxed_message(msg, is_user).align_to(
-                self.upper_edge, UP
-            )
-            if is_user:
-                boxed_msg.align_to(self.right_edge, RIGHT)
-            else:
-                boxed_msg.align_to(self.left_edge, LEFT)
-            self.upper_edge = boxed_msg.get_bottom() + DOWN * self.BOX_OFFSET
-            boxed_messages.append(boxed_msg)
-
-        return boxed_messages
-
-    def animate_boxed_messages(
-        self, boxed_messages: list[VGroup], is_skipped: bool = True
-    ):
+    def get_transcript(self, messages: list[tuple[str, bool]]) -> ChatTranscript:
+        """Chat window of the messages, bubbles are built when they are revealed."""
+        return ChatTranscript(
+            messages,
+            top=self.upper_edge[1],
+            right=self.right_edge[0],
+            left=self.left_edge[0],
+            gap=self.BOX_OFFSET,
+            text_size=self.TEXT_SIZE,
+            roundness=self.ROUNDNESS,
+            user_color=BLUE_E,
+            bot_color=GREEN_E,
+        )
+
+    @section()
+    def animate_boxed_messages(self, transcript: ChatTranscript):
         """Animate the boxed messages to appear one by one."""
         animation = Succession(
-            *[FadeIn(boxed_msg, shift=UP * 0.5) for boxed_msg in boxed_messages],
+            *[RevealMessage(transcript) for _ in transcript.messages],
             lag_ratio=1,
         )
+        self.play(animation)
 
-        if is_skipped:
-            self.add(*boxed_messages)
-        else:
-            self.play(animation)
-
-    def animate_fade_all_messages(
-        self, boxed_messages: list[VGroup], opacity: float, is_skipped: bool = True
-    ):
-        """Animate fading all messages to half opacity."""
-        msgs_fading_out = [msg.animate(run_time=3).set_opacity(opacity) for msg in boxed_messages]  # type: ignore
+    @section()
+    def animate_fade_all_messages(self, opacity: float):
+        """Animate fading all messages to a lower opacity."""
+        msgs_fading_out = FadeAllExcept(self, self.heading, opacity=opacity, run_time=3)
         big_question_mark_appear = FadeIn(self.big_question_mark, scale=0.5, run_time=5)
-
-        if is_skipped:
-            for msg in boxed_messages:
-                msg.set_opacity(opacity)
-            self.add(self.big_question_mark)
-        else:
-            self.play(*msgs_fading_out, big_question_mark_appear)
+        self.play(msgs_fading_out, big_question_mark_appear)
 
 
 class CosineSimilarity(Scene):
@@ -200,8 +190,7 @@ class CosineSimilarity(Scene):
             turn_debug_mode_on(scene=self, opacity=0.5)
 
         axes = self.get_axes()
-        self.play(DrawBorderThenFill(axes))
-        self.wait()
+        self.animate_axes(axes)
 
         vectors = self.get_vectors(
             labels=["собачка", "кицюня", "добрий", "злий"],
@@ -209,21 +198,12 @@ class CosineSimilarity(Scene):
             label_buff=0.15,
         )
 
-        self.animate_vectors(vectors, is_skipped=False)
-
-        eng_title = Text("Cosine Similarity", font_size=44).to_edge(LEFT).shift(DOWN)
-        ukr_title = Text("косинусна подібність", font_size=28).next_to(
-            eng_title, DOWN, buff=0.2, aligned_edge=LEFT
-        )
-
-        self.play(
-            Succession(
-                Write(eng_title),
-                Write(ukr_title),
-                lag_ratio=1,
-            )
-        )
+        self.animate_vectors(vectors)
+        self.animate_titles()
 
+    @section()
+    def animate_axes(self, axes: Axes):
+        self.play(DrawBorderThenFill(axes))
         self.wait()
 
     def get_axes(self, x_length: int = 8, y_length: int = 6) -> Axes:
@@ -245,58 +225,56 @@ class CosineSimilarity(Scene):
         return axes
 
     def get_vectors(
-        self, labels: list[str], label_size: int, label_buff: float
-    ) -> list[VGroup]:
-        vectors = []
+        self, labels: list[str], label_size: int, label_buff: float, max_length: float = 2.2
+    ) -> tuple[ArrowField, VGroup]:
         colors = [YELLOW, PINK, BLUE, RED]
 
-        # first two vectors are close
-        coord1 = np.array([2, 1])
-        coord2 = np.array([1.8, 1.2])
-
-        # 3rd is orthogonal to the first two
-        coord3 = np.array([-1.1, 1.9])
-
-        # 4th is opposite to the third
-        coord4 = coord3 * -1
-
-        labels_dirs = [DR, UP, UL, DR]
-
-        # create the vectors
-
-        for i, coord in enumerate([coord1, coord2, coord3, coord4]):
-            coord = np.append(coord, 0)  # make it 3D
-            vec = VGroup(
-                Arrow(
-                    start=ORIGIN,
-                    end=coord,
-                    buff=0,
-                    max_tip_length_to_length_ratio=0.1,
-                    stroke_width=6,
-                    color=colors[i],
-                ),
-                Text(labels[i], font_size=label_size, color=colors[i]).next_to(
-                    coord, labels_dirs[i], buff=label_buff
-                ),
+        # 2-D projection of the word embeddings: the first two words are close,
+        # the 3rd is orthogonal to them and the 4th opposite to the third
+        coords = EmbeddingStore(EMBEDDINGS_FILE).project(labels)
+        coords *= max_length / np.linalg.norm(coords, axis=1).max()
+
+        # create the vectors: all the arrows in one field, the labels past their ends
+        arrows = ArrowField(coords, colors=colors, stroke_width=6, max_tip_length_to_length_ratio=0.1)
+        texts = VGroup(*[
+            cached_text(label, font_size=label_size, color=color).next_to(
+                np.append(coord, 0), normalize(np.append(coord, 0)), buff=label_buff
             )
-            vectors.append(vec)
+            for label, color, coord in zip(labels, colors, coords)
+        ])
 
-        return vectors
+        return arrows, texts
 
-    def animate_vectors(self, vectors: list[VGroup], is_skipped: bool = True):
+    @section()
+    def animate_vectors(self, vectors: tuple[ArrowField, VGroup]):
+        arrows, texts = vectors
+        # every 2 seconds an arrow grows (for 1 s), then its label fades in
+        step = 2
+        run_time = step * (len(texts) - 1) + 1
 
-        grow_fade_in = lambda vec: LaggedStart(
-            GrowArrow(vec[0]), FadeIn(vec[1], scale=0.7), run_time=2, lag_ratio=0.85
+        self.play(
+            GrowArrowField(arrows, lag_ratio=step, run_time=run_time),
+            Succession(
+                Wait(0.9),
+                LaggedStart(*[FadeIn(text, scale=0.7) for text in texts], lag_ratio=step, run_time=run_time),
+            ),
         )
-        animation = Succession(
-            *[grow_fade_in(vec) for vec in vectors],
-            lag_ratio=1,
+        self.wait()
+
+    @section()
+    def animate_titles(self):
+        eng_title = cached_text("Cosine Similarity", font_size=44).to_edge(LEFT).shift(DOWN)
+        ukr_title = cached_text("косинусна подібність", font_size=28).next_to(
+            eng_title, DOWN, buff=0.2, aligned_edge=LEFT
         )
 
-        if is_skipped:
-            self.add(*vectors)
-        else:
-            self.play(animation)
+        self.play(
+            Succession(
+                Write(eng_title),
+                Write(ukr_title),
+                lag_ratio=1,
+            )
+        )
 
         self.wait()
 
@@ -314,20 +292,24 @@ class IntroToTrigonometry(Scene):
         if IS_DEBUG_MODE_ON:
             self.debug_plane = turn_debug_mode_on(scene=self, opacity=0.5)
 
+        # sections get the triangle from `self`, so it is the restored one when resuming from a checkpoint
         self.triangle = self.create_triangle(self.a, self.b, self.c, stroke_width=6, alpha_label_size=69, buff=0.4)
-        triangle = self.triangle
-        triangle.shift(LEFT * 4 + DOWN * 1.5)
-        self.animate_triangle(triangle, is_skipped=IS_DEBUG_MODE_ON)
+        self.triangle.shift(LEFT * 4 + DOWN * 1.5)
+        self.animate_triangle(self.triangle)
 
-        self.animate_sides_labels(triangle, text_size=33, is_skipped=IS_DEBUG_MODE_ON)
+        self.animate_sides_labels(self.triangle, text_size=33)
 
-        self.animate_sincos_formulas(is_skipped=IS_DEBUG_MODE_ON)
+        text_size = DEFAULT_FONT_SIZE
+        sin_formula, cos_formula = self.animate_sincos_formulas(text_size=text_size)
 
-        self.animate_remove_all_except_triangle(triangle, is_skipped=IS_DEBUG_MODE_ON)
+        self.animate_cossin_hack(cos_formula=cos_formula, sin_formula=sin_formula, text_size=text_size+10)
+        self.wait()
+
+        self.animate_remove_all_except_triangle(self.triangle)
 
-        self.animate_trig_similarity(triangle, alpha_label_size=69, buff=0.4, formulas_x=3, is_skipped=IS_DEBUG_MODE_ON)
+        self.animate_trig_similarity(self.triangle, alpha_label_size=69, buff=0.4, formulas_x=3)
 
-        self.animate_question_mark(opacity=0.1, is_skipped=False)
+        self.animate_question_mark(opacity=0.1)
 
         self.wait()
 
@@ -353,15 +335,12 @@ class IntroToTrigonometry(Scene):
         triangle = VGroup(line1, line2, line3, adj_right_angle, angle, alpha)
         return triangle
 
-    def animate_triangle(self, triangle: VGroup, is_skipped: bool = True):
+    @section()
+    def animate_triangle(self, triangle: VGroup):
         """Animate triangle creation using copies, keeping originals inside the group."""
         line1, line2, line3, right_angle = triangle[:4]
         angle, alpha = triangle[4], triangle[5]
 
-        if is_skipped:
-            self.add(triangle)
-            return
-        
         # Animate
         self.play(
             LaggedStart(
@@ -373,13 +352,14 @@ class IntroToTrigonometry(Scene):
         self.play(LaggedStart(Create(angle), Write(alpha), lag_ratio=1))  # type: ignore
         self.wait()
 
-    def animate_sides_labels(self, triangle: VGroup, text_size: int = 36, is_skipped: bool = True):
+    @section()
+    def animate_sides_labels(self, triangle: VGroup, text_size: int = 36):
         close_cathetus = triangle[0]
         far_cathetus = triangle[1]
         hypotenuse = triangle[2]
 
         text_close, text_far, text_hyp = [
-            Text(text, font_size=text_size, color=color)
+            cached_text(text, font_size=text_size, color=color)
             for text, color in zip(self.edge_labels, self.colors)
         ]
 
@@ -401,21 +381,16 @@ class IntroToTrigonometry(Scene):
 
         text_hyp.rotate(angle_hyp).move_to(hypotenuse.point_from_proportion(0.45) + normal_vec * 0.33)
 
-        if is_skipped:
-            [edge.set_color(color) for edge, color in zip(triangle[:3], self.colors)]
-            self.add(text_close, text_far, text_hyp)
-            return
-        
-        else:
-            anims = [LaggedStart(
-                edge.animate.set_color(color),  # type: ignore
-                Write(text),
-                lag_ratio=1,
-            ) for edge, color, text in zip(triangle[:3], self.colors, [text_close, text_far, text_hyp])]
-            self.play(Succession(*anims, lag_ratio=1))
+        anims = [LaggedStart(
+            edge.animate.set_color(color),  # type: ignore
+            Write(text),
+            lag_ratio=1,
+        ) for edge, color, text in zip(triangle[:3], self.colors, [text_close, text_far, text_hyp])]
+        self.play(Succession(*anims, lag_ratio=1))
         self.wait()
 
-    def animate_sincos_formulas(self, text_size = DEFAULT_FONT_SIZE, is_skipped: bool = True):
+    @section()
+    def animate_sincos_formulas(self, text_size = DEFAULT_FONT_SIZE) -> tuple[Tex, Tex]:
 
         sin_formula = Tex(r"$\sin(\alpha) = \frac{\text{протилежний}}{\text{гіпотенуза}}$", font_size=text_size, tex_template=UkrainianTexTemplate)
         cos_formula = Tex(r"$\cos(\alpha) = \frac{\text{прилеглий}}{\text{гіпотенуза}}$", font_size=text_size, tex_template=UkrainianTexTemplate)
@@ -432,44 +407,32 @@ class IntroToTrigonometry(Scene):
         sin_formula[0][7:].set_color(BLACK)
         cos_formula[0][7:].set_color(BLACK)
 
-        if is_skipped:
-            # color the text in the formula by indices
-            sin_formula[0][18].set_color(WHITE)  # frac line
-            sin_formula[0][7:18].set_color(self.colors[1])  # протилежний
-            sin_formula[0][19:].set_color(self.colors[2])  # гіпотенуза
-
-            cos_formula[0][16].set_color(WHITE)  # frac line
-            cos_formula[0][7:16].set_color(self.colors[0])  # прилеглий
-            cos_formula[0][17:].set_color(self.colors[2])  # гіпотенуза
-            self.add(sin_formula, sin_indices, cos_formula, cos_indices)
-        else:
-            # step by step animation
-            # 1. write sin formula
-            self.play(Write(sin_formula))
-            self.wait()
-            # 2. appear frac line
-            self.play(sin_formula[0][18].animate.set_color(WHITE))
-            self.wait()
-            # 3. color the text in the formula by indices
-            self.play(sin_formula[0][7:18].animate.set_color(self.colors[1]))  # протилежний
-            self.wait()
-            self.play(sin_formula[0][19:].animate.set_color(self.colors[2]))  # гіпотенуза
-            self.wait(2)
-            # 4. do the same for cos formula
-            self.play(Write(cos_formula))
-            self.wait()
-            self.play(cos_formula[0][16].animate.set_color(WHITE))
-            self.wait()
-            self.play(cos_formula[0][7:16].animate.set_color(self.colors[0]))  # прилеглий
-            self.wait()
-            self.play(cos_formula[0][17:].animate.set_color(self.colors[2]))  # гіпотенуза
-        self.wait()
-
-        self.animate_cossin_hack(cos_formula=cos_formula, sin_formula=sin_formula, text_size=text_size+10, is_skipped=is_skipped)
-
-        self.wait()
-
-    def animate_cossin_hack(self, cos_formula: Tex, sin_formula: Tex, buff: float = 1.3, text_size = DEFAULT_FONT_SIZE, is_skipped: bool = True):
+        # step by step animation
+        # 1. write sin formula
+        self.play(Write(sin_formula))
+        self.wait()
+        # 2. appear frac line
+        self.play(sin_formula[0][18].animate.set_color(WHITE))
+        self.wait()
+        # 3. color the text in the formula by indices
+        self.play(sin_formula[0][7:18].animate.set_color(self.colors[1]))  # протилежний
+        self.wait()
+        self.play(sin_formula[0][19:].animate.set_color(self.colors[2]))  # гіпотенуза
+        self.wait(2)
+        # 4. do the same for cos formula
+        self.play(Write(cos_formula))
+        self.wait()
+        self.play(cos_formula[0][16].animate.set_color(WHITE))
+        self.wait()
+        self.play(cos_formula[0][7:16].animate.set_color(self.colors[0]))  # прилеглий
+        self.wait()
+        self.play(cos_formula[0][17:].animate.set_color(self.colors[2]))  # гіпотенуза
+        self.wait()
+
+        return sin_formula, cos_formula
+
+    @section()
+    def animate_cossin_hack(self, cos_formula: Tex, sin_formula: Tex, buff: float = 1.3, text_size = DEFAULT_FONT_SIZE):
         cos_text = MathTex(r"\cos", font_size=text_size)
         cos_text.next_to(cos_formula, DOWN, buff=buff, aligned_edge=LEFT)
 
@@ -494,57 +457,50 @@ class IntroToTrigonometry(Scene):
         ordered_cos[0][5:].set_color(BLACK)
         ordered_sin[0][5:].set_color(BLACK)
 
+        self.play(Write(cossin_before))
+        self.wait()
+        self.play(TransformMatchingShapes(cossin_before, cossin_after))
+        self.wait()
+        self.play(Transform(cossin_after, cosin_text))
+        self.wait(2)
+        self.play(Succession(
+            Write(ordered_cos), Write(ordered_sin), lag_ratio=1
+        ))
+        self.wait()
 
-        if is_skipped:
-            ordered_cos.set_color(self.colors[0])
-            ordered_sin.set_color(self.colors[1])
-
-            self.add(cosin_text, ordered_cos, ordered_sin)
-
-        else:
-            self.play(Write(cossin_before))
-            self.wait()
-            self.play(TransformMatchingShapes(cossin_before, cossin_after))
-            self.wait()
-            self.play(Transform(cossin_after, cosin_text))
-            self.wait(2)
-            self.play(Succession(
-                Write(ordered_cos), Write(ordered_sin), lag_ratio=1
-            ))
-            self.wait()
-
-            # indicate first letters
-            sf = 1.5
-            self.play(Succession(
-                Indicate(ordered_cos[0][2], color=BLUE, scale_factor=sf),  # type: ignore
-                Indicate(ordered_sin[0][2], color=RED, scale_factor=sf),  # type: ignore
-                lag_ratio=1,
-            ))
-            self.wait()
-
-            # now indicate the cathetus of the triangle
-            triangle = self.triangle
-            self.play(Succession(
-                Indicate(triangle[0], color=YELLOW),  # type: ignore
-                Indicate(triangle[1], color=YELLOW),  # type: ignore
-                lag_ratio=1,
-            ))
-            self.wait()
-
-            # color the text in the formulas to WHITE (appear)
-            self.play(Succession(*[tex[0][5:].animate.set_color(WHITE) for tex in [ordered_cos, ordered_sin]], lag_ratio=1))  # type: ignore
-            self.wait()
-            # color the whole text in the formulas by intuitive colors
-            self.play(Succession(*[tex.animate.set_color(self.colors[i]) for i, tex in enumerate([ordered_cos, ordered_sin])], lag_ratio=1))  # type: ignore
-            self.wait()
-            # indicate cos in cos_formula and the numerator
-            self.play(Succession(Indicate(cos_formula[0][:3], color=BLUE), Indicate(cos_formula[0][7:16]), lag_ratio=1))  # type: ignore
-            self.wait()
-            # indicate sin in sin_formula and the numerator
-            self.play(Succession(Indicate(sin_formula[0][:3], color=RED), Indicate(sin_formula[0][7:18]), lag_ratio=1))  # type: ignore
-        self.wait()
-
-    def animate_remove_all_except_triangle(self, triangle: VGroup, is_skipped: bool = True):
+        # indicate first letters
+        sf = 1.5
+        self.play(Succession(
+            Indicate(ordered_cos[0][2], color=BLUE, scale_factor=sf),  # type: ignore
+            Indicate(ordered_sin[0][2], color=RED, scale_factor=sf),  # type: ignore
+            lag_ratio=1,
+        ))
+        self.wait()
+
+        # now indicate the cathetus of the triangle
+        triangle = self.triangle
+        self.play(Succession(
+            Indicate(triangle[0], color=YELLOW),  # type: ignore
+            Indicate(triangle[1], color=YELLOW),  # type: ignore
+            lag_ratio=1,
+        ))
+        self.wait()
+
+        # color the text in the formulas to WHITE (appear)
+        self.play(Succession(*[tex[0][5:].animate.set_color(WHITE) for tex in [ordered_cos, ordered_sin]], lag_ratio=1))  # type: ignore
+        self.wait()
+        # color the whole text in the formulas by intuitive colors
+        self.play(Succession(*[tex.animate.set_color(self.colors[i]) for i, tex in enumerate([ordered_cos, ordered_sin])], lag_ratio=1))  # type: ignore
+        self.wait()
+        # indicate cos in cos_formula and the numerator
+        self.play(Succession(Indicate(cos_formula[0][:3], color=BLUE), Indicate(cos_formula[0][7:16]), lag_ratio=1))  # type: ignore
+        self.wait()
+        # indicate sin in sin_formula and the numerator
+        self.play(Succession(Indicate(sin_formula[0][:3], color=RED), Indicate(sin_formula[0][7:18]), lag_ratio=1))  # type: ignore
+        self.wait()
+
+    @section()
+    def animate_remove_all_except_triangle(self, triangle: VGroup):
         """Hide all elements except the triangle."""
         if triangle not in self.mobjects:
             self.add(triangle)
@@ -555,12 +511,6 @@ class IntroToTrigonometry(Scene):
                 obj_to_remove.append(obj)
 
         shift_vec = RIGHT * 2
-        if is_skipped:
-            turn_debug_mode_on(scene=self)
-            self.remove(*obj_to_remove)
-            triangle.shift(shift_vec)
-            return
-        
         self.play(FadeOut(*obj_to_remove))
         self.wait()
 
@@ -591,7 +541,8 @@ class IntroToTrigonometry(Scene):
         triangle_copy = VGroup(line1_copy, line2_copy, line3_copy, right_angle_copy, angle_copy, alpha_copy)  # type: ignore
         return triangle_copy
     
-    def animate_trig_similarity(self, triangle: VGroup, alpha_label_size: float, buff: float, formulas_x: float, is_skipped: bool = True):
+    @section()
+    def animate_trig_similarity(self, triangle: VGroup, alpha_label_size: float, buff: float, formulas_x: float):
         """Animate the triangle dynamically changing as point C moves and display dynamic sin/cos values."""
         # Create a ValueTracker for the y-coordinate of point C
         c = triangle[1].get_end()
@@ -628,10 +579,6 @@ class IntroToTrigonometry(Scene):
 
         rect = SurroundingRectangle(VGroup(sin_label, cos_label), buff=0.2, color=WHITE)  # type: ignore
 
-        if is_skipped:
-            self.add(triangle_copy, sin_label, cos_label, rect)
-            return
-
         # Remove the old triangle
         self.remove(triangle)
 
@@ -669,57 +616,14 @@ class IntroToTrigonometry(Scene):
         self.play(DrawBorderThenFill(rect))
         self.wait()
 
-    def animate_question_mark(self, opacity: float, is_skipped: bool = True):
+    @section()
+    def animate_question_mark(self, opacity: float):
         """Animate a question mark appearing while fading other objects to a lower opacity."""
-        big_question_mark = Text("?", font_size=221, color=RED).set_z_index(3)
-        all_objects = self.mobjects.copy()
-    
-        # Collect all low-level objects without modifying the original list during iteration
-        low_level_objects = []
-        for obj in all_objects:
-            if isinstance(obj, VGroup):
-                low_level_objects.extend(obj.get_family())
-            else:
-                low_level_objects.append(obj)
-    
-        if is_skipped:
-            for obj in low_level_objects:
-                if isinstance(obj, (Tex, MathTex)):
-                    obj.set_fill(opacity=opacity)
-                    obj.set_stroke(opacity=opacity)
-                elif hasattr(obj, "set_opacity"):
-                    obj.set_opacity(opacity)
-                elif hasattr(obj, "set_stroke"):
-                    obj.set_stroke(opacity=opacity)
-            self.add(big_question_mark)
-            return
-    
-        # # Change opacity of all objects while fading in the question mark
-        # # BUG: unexcpected behavior with VGroups containing Tex/MathTex...
-        # fade_out_anims = []
-        # for obj in low_level_objects:
-        #     if isinstance(obj, (Tex, MathTex)):
-        #         fade_out_anims.append(obj.animate.set_stroke(opacity=opacity))
-        #         fade_out_anims.append(obj.animate.set_fill(opacity=opacity))
-        #     elif hasattr(obj, "set_stroke"):
-        #         fade_out_anims.append(obj.animate.set_stroke(opacity=opacity))
-        #     elif hasattr(obj, "set_opacity"):
-        #         fade_out_anims.append(obj.animate.set_opacity(opacity))
-    
-        black_square = Square(side_length=100, fill_color=BLACK, fill_opacity=0, stroke_opacity=0).set_z_index(2)
-        fade_out_anims = [black_square.animate(run_time=3).set_fill(opacity=1-opacity)]  # type: ignore
+        big_question_mark = cached_text("?", font_size=221, color=RED).set_z_index(3)
 
+        # one vectorized fade of every submobject (Tex glyphs included), relative to their opacity
+        fade_out = FadeAllExcept(self, opacity=opacity, run_time=3)
         big_question_mark_appear = FadeIn(big_question_mark, scale=0.5, run_time=5)
-        self.play(*fade_out_anims, big_question_mark_appear)
-    
-        # # Explicitly set opacity after animation to ensure it persists
-        # for obj in low_level_objects:
-        #     if isinstance(obj, (Tex, MathTex)):
-        #         obj.set_fill(opacity=opacity)
-        #         obj.set_stroke(opacity=opacity)
-        #     elif hasattr(obj, "set_stroke"):
-        #         obj.set_stroke(opacity=opacity)
-        #     elif hasattr(obj, "set_opacity"):
-        #         obj.set_opacity(opacity)
-    
+        self.play(fade_out, big_question_mark_appear)
+
         self.wait()
\ No newline at end of file
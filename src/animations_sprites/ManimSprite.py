@@ -1,5 +1,6 @@
 from pathlib import Path
-from src.utils.config import POSES_NUM_LIST, SPRITES_POSES_DIR, POSE_PREFIX
+from src.utils.config import POSES_NUM_LIST, PREBUILT_SPRITES_POSES_DIR, SPRITES_POSES_DIR, POSE_PREFIX
+from src.utils.asset_cache import AssetCache
 from manim import SVGMobject
 
 
@@ -30,25 +31,32 @@ class ManimSprite:
         self.position = position
         self.pose_prefix = pose_prefix
         self.poses_num_list = POSES_NUM_LIST
+        # parse all the poses in the background, they are shared between sprites of the same kind
+        pose_files = [f"{self.pose_prefix}{pose_num}.svg" for pose_num in self.poses_num_list]
+        self.poses_cache = AssetCache(self.poses_dir).preload(
+            *[name for name in pose_files if (self.poses_dir / name).is_file()]
+        )
         self.cur_manim_svgmobject = self._get_manim_svgmobject(self.poses_num_list[0])
         self.old_manim_svgmobject = self._get_manim_svgmobject(self.poses_num_list[-1])
 
     def _get_poses_dir(self):
-        cur_poses_dir = self.sprites_poses_dir / self.sprite_name
-        if not cur_poses_dir.exists() or not cur_poses_dir.is_dir():
-            new_poses_dir = self.sprites_poses_dir / (self.sprite_name + "_vector")
-            if new_poses_dir.exists() and new_poses_dir.is_dir():
-                cur_poses_dir = new_poses_dir
-            else:
-                raise FileNotFoundError(f"Directory for sprite '{self.sprite_name}' not found in {self.sprites_poses_dir}")
-        return cur_poses_dir
+        sprites_poses_dirs = [self.sprites_poses_dir]
+        if PREBUILT_SPRITES_POSES_DIR is not None:
+            sprites_poses_dirs.append(PREBUILT_SPRITES_POSES_DIR)  # pre-cropped in the render image
+
+        for sprites_poses_dir in sprites_poses_dirs:
+            for dir_name in (self.sprite_name, self.sprite_name + "_vector"):
+                cur_poses_dir = sprites_poses_dir / dir_name
+                if cur_poses_dir.exists() and cur_poses_dir.is_dir():
+                    return cur_poses_dir
+        raise FileNotFoundError(f"Directory for sprite '{self.sprite_name}' not found in {self.sprites_poses_dir}")
     
     def _get_manim_svgmobject(self, pose_num: str) -> SVGMobject:
 
         pose_file = self.poses_dir / f"{self.pose_prefix}{pose_num}.svg"
         if not pose_file.exists() or not pose_file.is_file():
             raise FileNotFoundError(f"Pose file '{pose_file}' not found.")
-        svg_mobject = SVGMobject(str(pose_file))
+        svg_mobject = self.poses_cache.svg(pose_file.name)
         svg_mobject.scale(self.scale)
         svg_mobject.move_to(self.position)
         return svg_mobject
@@ -0,0 +1,169 @@
+"""
+Output formats of transparent renders.
+
+Manim writes transparent scenes as QuickTime Animation (`qtrle`) `.mov` files: lossless
+but huge. The render is encoded afterwards into the alpha profile chosen with
+`render.py -t --alpha-profile`:
+
+    qtrle   manim's own .mov, kept as it is (default, opens everywhere)
+    prores  ProRes 4444 .mov, for video editors (smaller, still near lossless)
+    webm    VP9 with alpha .webm, for the web (by far the smallest)
+    png     the frames as PNGs in a .zip archive (lossless, for compositing tools)
+
+`--alpha-report` encodes the render into every profile and compares sizes and encode times.
+"""
+import json
+import time
+import shutil
+from pathlib import Path
+
+from src.utils.config import CACHE_DIR, MANIM_DOCKER_IMAGE
+from src.utils.ffmpeg import CODEC_ARGS, run_ffmpeg, to_project_path
+
+MANIM_ALPHA_SUFFIX = ".mov"  # what `manim -t` writes
+ALPHA_WORK_DIR = CACHE_DIR / "alpha"
+
+# profile -> (suffix, ffmpeg encoder arguments); None: not an ffmpeg video encode
+ALPHA_PROFILES: dict[str, tuple[str, list[str] | None]] = {
+    "qtrle": (".mov", None),
+    "prores": (".mov", ["-c:v", "prores_ks", "-profile:v", "4444", "-pix_fmt", "yuva444p10le", "-vendor", "apl0"]),
+    "webm": (".webm", CODEC_ARGS[".webm"]),
+    "png": (".zip", None),
+}
+DEFAULT_ALPHA_PROFILE = "qtrle"
+
+
+def alpha_suffix(profile: str | None) -> str:
+    """File suffix of the output of an alpha profile"""
+    return ALPHA_PROFILES[profile or DEFAULT_ALPHA_PROFILE][0]
+
+
+def _encode_png_archive(source: Path, target: Path, project_dir: Path, image: str | None) -> None:
+    import zipfile
+
+    frames_dir = ALPHA_WORK_DIR / f"{target.stem}_frames"
+    shutil.rmtree(frames_dir, ignore_errors=True)
+    frames_dir.mkdir(parents=True)
+    result = run_ffmpeg(
+        [
+            "-y", "-loglevel", "error",
+            "-i", to_project_path(source, project_dir),
+            "-pix_fmt", "rgba", "-start_number", "0",
+            to_project_path(frames_dir / "%05d.png", project_dir),
+        ],
+        project_dir,
+        image=image,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Extracting the frames of {source} failed:\n{result.stderr[-2000:]}")
+
+    probe = run_ffmpeg(
+        ["-v", "error", "-select_streams", "v:0", "-show_entries", "stream=r_frame_rate,width,height", "-of", "json",
+         to_project_path(source, project_dir)],
+        project_dir,
+        tool="ffprobe",
+        image=image,
+    )
+    stream = json.loads(probe.stdout)["streams"][0] if probe.returncode == 0 else {}
+    frames = sorted(frames_dir.glob("*.png"))
+    # PNGs are compressed already: stored, so members can be read without inflating
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("frames.json", json.dumps({**stream, "frames": len(frames), "pattern": "%05d.png"}))
+        for frame in frames:
+            archive.write(frame, frame.name)
+    shutil.rmtree(frames_dir)
+
+
+def encode_alpha(
+    source: Path,
+    profile: str,
+    project_dir: Path,
+    image: str | None = MANIM_DOCKER_IMAGE,
+    target: Path | None = None,
+) -> Path:
+    """
+    Encode manim's transparent output into an alpha profile.
+
+    Args:
+        source (Path): The `.mov` written by `manim -t`.
+        profile (str): One of ALPHA_PROFILES.
+        project_dir (Path): The project root (both files must be inside it).
+        image (str | None, optional): Render image used when ffmpeg is not installed locally.
+        target (Path | None, optional): Output path. Defaults to the source with the profile's
+            suffix, replacing the source.
+
+    Raises:
+        RuntimeError: If ffmpeg fails.
+
+    Returns:
+        Path: The encoded output.
+    """
+    suffix, codec_args = ALPHA_PROFILES[profile]
+    replace_source = target is None
+    target = source.with_suffix(suffix) if target is None else target
+    if profile == "qtrle":
+        if not replace_source:
+            shutil.copyfile(source, target)
+        return target
+
+    # written next to the target first: prores has the same suffix as the source
+    partial = target.with_name(f"{target.stem}.partial{suffix}")
+    partial.parent.mkdir(parents=True, exist_ok=True)
+    if profile == "png":
+        _encode_png_archive(source, partial, project_dir, image)
+    else:
+        result = run_ffmpeg(
+            [
+                "-y", "-loglevel", "error",
+                "-i", to_project_path(source, project_dir),
+                *codec_args,
+                "-c:a", "copy",
+                to_project_path(partial, project_dir),
+            ],
+            project_dir,
+            image=image,
+        )
+        if result.returncode != 0:
+            partial.unlink(missing_ok=True)
+            raise RuntimeError(f"Encoding {source} as {profile} failed:\n{result.stderr[-2000:]}")
+    partial.replace(target)
+    if replace_source and source != target:
+        source.unlink(missing_ok=True)
+    return target
+
+
+def compare_alpha_profiles(source: Path, project_dir: Path, image: str | None = MANIM_DOCKER_IMAGE) -> list[tuple[str, int, float]]:
+    """
+    Encode a transparent render into every profile and print their sizes and encode times.
+
+    Args:
+        source (Path): The `.mov` written by `manim -t` (left untouched).
+        project_dir (Path): The project root.
+        image (str | None, optional): Render image used when ffmpeg is not installed locally.
+
+    Returns:
+        list[tuple[str, int, float]]: (profile, bytes, encode seconds), smallest first.
+    """
+    work_dir = ALPHA_WORK_DIR / source.stem
+    work_dir.mkdir(parents=True, exist_ok=True)
+    reference = source.stat().st_size
+    results = [("qtrle", reference, 0.0)]
+    for profile in ALPHA_PROFILES:
+        if profile == "qtrle":
+            continue
+        start = time.perf_counter()
+        try:
+            output = encode_alpha(source, profile, project_dir, image, work_dir / f"{source.stem}{alpha_suffix(profile)}")
+        except RuntimeError as e:
+            print(f"⚠️  {profile}: {e}")
+            continue
+        results.append((profile, output.stat().st_size, time.perf_counter() - start))
+        output.unlink()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+    results.sort(key=lambda result: result[1])
+    print(f"📊 Alpha profiles for {source.name}:")
+    for profile, size, seconds in results:
+        encode = "rendered by manim" if profile == "qtrle" else f"encoded in {seconds:.1f}s"
+        print(f"  {profile:<7} {size / 2**20:9.1f} MB  {size / reference:6.1%} of qtrle  {encode}")
+    return results
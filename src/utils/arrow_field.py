@@ -0,0 +1,183 @@
+"""
+Thousands of arrows as a handful of VMobjects.
+
+A manim `Arrow` is a Line plus a tip mobject, built and positioned in Python; a `VGroup` of
+hundreds of them is slow to build and every `GrowArrow` of it is a separate animation.
+`ArrowField` generates the points of all the shafts (one VMobject per color) and all the tips
+(one more per color) with numpy, and `GrowArrowField` grows them all by rescaling those arrays.
+"""
+from typing import Sequence
+
+import numpy as np
+from manim import (
+    Animation,
+    ManimColor,
+    ParsableManimColor,
+    VGroup,
+    VMobject,
+    WHITE,
+    DEFAULT_ARROW_TIP_LENGTH,
+)
+
+# cubic bezier handles of a straight segment
+_LINE_T = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+
+
+def _to_3d(points: np.ndarray) -> np.ndarray:
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError(f"Expected an (N, 2) or (N, 3) array, got shape {points.shape}")
+    if points.shape[1] == 2:
+        points = np.hstack([points, np.zeros((len(points), 1))])
+    return points
+
+
+def _line_curves(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Bezier points of the segments starts[i] -> ends[i], 4 points per segment"""
+    return (starts[:, None, :] + _LINE_T * (ends - starts)[:, None, :]).reshape(-1, 3)
+
+
+def _arrow_colors(colors: ParsableManimColor | Sequence[ParsableManimColor] | np.ndarray, count: int) -> np.ndarray:
+    """(N, 3) RGB array of the arrows"""
+    if isinstance(colors, np.ndarray) and colors.ndim == 2:
+        rgbs = colors[:, :3].astype(float)
+    elif isinstance(colors, (list, tuple)) and len(colors) == count and not isinstance(colors[0], (int, float)):
+        rgbs = np.array([ManimColor(color).to_rgb() for color in colors])
+    else:
+        return np.tile(ManimColor(colors).to_rgb(), (count, 1))
+    if len(rgbs) != count:
+        raise ValueError(f"Got {len(rgbs)} colors for {count} arrows")
+    return rgbs
+
+
+class ArrowField(VGroup):
+    """
+    Straight arrows given as arrays, drawn with two VMobjects per distinct color.
+
+    `shafts` holds one VMobject per color whose subpaths are the shafts of the arrows of
+    that color, `tips` the same for the (filled triangle) tips. Each of them keeps the
+    indices of its arrows (`arrows`) and the arrow of each of its points (`point_arrows`).
+
+    Args:
+        vectors (np.ndarray): (N, 2) or (N, 3) arrow vectors.
+        starts (np.ndarray | None, optional): (N, 2) or (N, 3) arrow starts. Defaults to the origin.
+        colors (ParsableManimColor | Sequence[ParsableManimColor] | np.ndarray, optional): One color,
+            one per arrow, or an (N, 3) RGB array. Defaults to WHITE.
+        stroke_width (float, optional): Shaft width. Defaults to 6.
+        tip_length (float, optional): Tip length (and width). Defaults to DEFAULT_ARROW_TIP_LENGTH.
+        max_tip_length_to_length_ratio (float, optional): Like `Arrow`'s, short arrows get
+            shorter tips. Defaults to 0.25.
+
+    Example:
+        >>> field = ArrowField(np.random.randn(1000, 2), colors=[BLUE, RED] * 500)
+        >>> self.play(GrowArrowField(field, lag_ratio=0.01))
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        starts: np.ndarray | None = None,
+        colors: ParsableManimColor | Sequence[ParsableManimColor] | np.ndarray = WHITE,
+        stroke_width: float = 6,
+        tip_length: float = DEFAULT_ARROW_TIP_LENGTH,
+        max_tip_length_to_length_ratio: float = 0.25,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.vectors = _to_3d(vectors)
+        self.n_arrows = len(self.vectors)
+        self.starts = np.zeros_like(self.vectors) if starts is None else _to_3d(starts)
+        if len(self.starts) != self.n_arrows:
+            raise ValueError(f"Got {len(self.starts)} starts for {self.n_arrows} arrows")
+
+        shaft_points, tip_points = self._geometry(tip_length, max_tip_length_to_length_ratio)
+        rgbs = _arrow_colors(colors, self.n_arrows)
+        unique_rgbs, color_of_arrow = np.unique(rgbs, axis=0, return_inverse=True)
+
+        self.shafts = VGroup()
+        self.tips = VGroup()
+        for index, rgb in enumerate(unique_rgbs):
+            arrows = np.flatnonzero(color_of_arrow.ravel() == index)
+            color = ManimColor(rgb)
+
+            shaft = VMobject(stroke_color=color, stroke_width=stroke_width, fill_opacity=0)
+            shaft.set_points(shaft_points[arrows].reshape(-1, 3))
+            tip = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            tip.set_points(tip_points[arrows].reshape(-1, 3))
+            for part, points_per_arrow in ((shaft, 4), (tip, 12)):
+                part.arrows = arrows
+                part.point_arrows = np.repeat(arrows, points_per_arrow)
+
+            self.shafts.add(shaft)
+            self.tips.add(tip)
+        self.add(self.shafts, self.tips)
+
+    def _geometry(self, tip_length: float, max_ratio: float) -> tuple[np.ndarray, np.ndarray]:
+        """Bezier points of every shaft (N, 4, 3) and every tip (N, 12, 3)"""
+        lengths = np.linalg.norm(self.vectors, axis=1)
+        directions = np.divide(
+            self.vectors, lengths[:, None], out=np.zeros_like(self.vectors), where=lengths[:, None] > 0
+        )
+        normals = np.stack([-directions[:, 1], directions[:, 0], np.zeros(self.n_arrows)], axis=1)
+        tip_lengths = np.minimum(tip_length, max_ratio * lengths)[:, None]
+
+        ends = self.starts + self.vectors
+        bases = ends - tip_lengths * directions
+        shafts = _line_curves(self.starts, bases).reshape(-1, 4, 3)
+
+        # triangle apex -> left corner -> right corner -> apex
+        left, right = bases + tip_lengths / 2 * normals, bases - tip_lengths / 2 * normals
+        corners = np.stack([ends, left, right], axis=1)
+        tips = _line_curves(corners.reshape(-1, 3), np.roll(corners, -1, axis=1).reshape(-1, 3))
+        return shafts, tips.reshape(-1, 12, 3)
+
+    def parts(self) -> list[VMobject]:
+        """The shaft and tip VMobjects"""
+        return [*self.shafts, *self.tips]
+
+    def current_starts(self) -> np.ndarray:
+        """(N, 3) starts of the arrows, as currently placed (after shifts, rotations, ...)"""
+        starts = np.empty((self.n_arrows, 3))
+        for shaft in self.shafts:
+            starts[shaft.arrows] = shaft.points[::4]
+        return starts
+
+
+class GrowArrowField(Animation):
+    """
+    Grow every arrow of an `ArrowField` from its start, like `GrowArrow`, as one animation.
+
+    Each frame rescales the point arrays of the field around the arrow starts (one numpy
+    operation per shaft/tip VMobject). `lag_ratio` staggers the arrows as it would
+    staggered sub-animations, the rate function being evaluated once per distinct progress.
+
+    Args:
+        field (ArrowField): The field to grow (added to the scene).
+        lag_ratio (float, optional): Delay between two arrows, in arrow durations. Defaults to 0.
+    """
+
+    def __init__(self, field: ArrowField, lag_ratio: float = 0, **kwargs):
+        super().__init__(field, lag_ratio=lag_ratio, introducer=True, suspend_mobject_updating=False, **kwargs)
+
+    def begin(self) -> None:
+        field: ArrowField = self.mobject
+        starts = field.current_starts()
+        # final points and the start of their arrow, captured now so the field may have moved since
+        self.targets = [
+            (part, part.points.copy(), starts[part.point_arrows]) for part in field.parts()
+        ]
+        self.starting_mobject = field
+        self.interpolate(0)
+
+    def get_all_mobjects(self) -> list[ArrowField]:
+        return [self.mobject]
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        field: ArrowField = self.mobject
+        full_length = (field.n_arrows - 1) * self.lag_ratio + 1
+        progress = np.clip(alpha * full_length - np.arange(field.n_arrows) * self.lag_ratio, 0, 1)
+        values, inverse = np.unique(progress, return_inverse=True)
+        scales = np.array([self.rate_func(value) for value in values])[inverse.ravel()]
+
+        for part, points, starts in self.targets:
+            part.points = starts + scales[part.point_arrows][:, None] * (points - starts)
@@ -0,0 +1,125 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from manim import ImageMobject, Mobject, SVGMobject
+
+SVG_SUFFIXES = (".svg",)
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp", ".bmp")
+
+
+class AssetCache:
+    """
+    Per-process cache of parsed SVG/image assets from a single directory.
+
+    Assets are parsed in a shared thread pool as soon as they are requested
+    with `preload`, so I/O and SVG parsing overlap with the rest of the scene
+    setup. Parsed mobjects are memoized by (path, mtime, kwargs) and every
+    getter returns a fresh copy, so scenes are free to mutate the result.
+
+    Preload from the scene that uses the assets (`setup`), not at module level: a scene
+    module is imported to render any of its scenes, and by the scene probes.
+
+    Example:
+        LOGOS = AssetCache(LOGOS_DIR)
+        ...
+        def setup(self):
+            LOGOS.preload("chatgpt", "claude")
+        ...
+        logo = LOGOS.svg("chatgpt").set_color(WHITE)
+    """
+
+    _executor: ThreadPoolExecutor | None = None
+    _entries: dict[tuple[Path, tuple], tuple[int, Future]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, assets_dir: str | Path, max_workers: int = 4):
+        self.assets_dir = Path(assets_dir)
+        self.max_workers = max_workers
+
+    @classmethod
+    def _get_executor(cls, max_workers: int) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="asset-cache"
+                )
+            return cls._executor
+
+    def _resolve(self, name: str) -> Path:
+        """Resolve an asset name (with or without suffix) to a file path."""
+        path = self.assets_dir / name
+        if path.suffix:
+            if not path.is_file():
+                raise FileNotFoundError(f"Asset '{name}' not found in {self.assets_dir}")
+            return path
+
+        for suffix in SVG_SUFFIXES + IMAGE_SUFFIXES:
+            candidate = path.with_suffix(suffix)
+            if candidate.is_file():
+                return candidate
+        raise FileNotFoundError(f"Asset '{name}' not found in {self.assets_dir}")
+
+    @staticmethod
+    def _parse(path: Path, kwargs: dict) -> Mobject:
+        if path.suffix.lower() in SVG_SUFFIXES:
+            return SVGMobject(str(path), **kwargs)
+        return ImageMobject(str(path), **kwargs)
+
+    def _submit(self, path: Path, kwargs: dict) -> Future:
+        """Return the parse future for the asset, (re)submitting it if stale."""
+        key = (path, tuple(sorted(kwargs.items())))
+        mtime = os.stat(path).st_mtime_ns
+
+        with AssetCache._lock:
+            entry = AssetCache._entries.get(key)
+            if entry is not None and entry[0] == mtime:
+                return entry[1]
+
+        future = self._get_executor(self.max_workers).submit(self._parse, path, kwargs)
+        with AssetCache._lock:
+            AssetCache._entries[key] = (mtime, future)
+        return future
+
+    def preload(self, *names: str, **kwargs) -> "AssetCache":
+        """
+        Start parsing the given assets in the background.
+
+        Args:
+            *names (str): Asset names relative to the assets directory. If empty,
+                every SVG/image file in the directory is preloaded.
+            **kwargs: Extra keyword arguments passed to the mobject constructor.
+
+        Returns:
+            AssetCache: The cache itself, so it can be created and preloaded in one line.
+        """
+        if names:
+            paths = [self._resolve(name) for name in names]
+        else:
+            paths = sorted(
+                p for p in self.assets_dir.glob("*")
+                if p.suffix.lower() in SVG_SUFFIXES + IMAGE_SUFFIXES
+            )
+        for path in paths:
+            self._submit(path, kwargs)
+        return self
+
+    def get(self, name: str, **kwargs) -> Mobject:
+        """Return a copy of the parsed asset, waiting for the background parse if needed."""
+        mobject = self._submit(self._resolve(name), kwargs).result()
+        return mobject.copy()
+
+    def svg(self, name: str, **kwargs) -> SVGMobject:
+        """Return a copy of the SVG asset `name`."""
+        mobject = self.get(name, **kwargs)
+        if not isinstance(mobject, SVGMobject):
+            raise TypeError(f"Asset '{name}' is not an SVG file")
+        return mobject
+
+    def image(self, name: str, **kwargs) -> ImageMobject:
+        """Return a copy of the image asset `name`."""
+        mobject = self.get(name, **kwargs)
+        if not isinstance(mobject, ImageMobject):
+            raise TypeError(f"Asset '{name}' is not an image file")
+        return mobject
@@ -0,0 +1,242 @@
+"""
+A scrolling chat window whose cost depends on the visible messages only.
+
+Laying out a whole conversation up front builds a `Text` and a rectangle per message and
+keeps all of them in the scene, drawn on every frame. `ChatTranscript` builds a bubble
+the first time it is needed, remembers only its height once it scrolled away (the
+mobjects of at most `max_cached` bubbles are kept), and has as submobjects the bubbles
+inside the window.
+"""
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Sequence
+
+import numpy as np
+from manim import Animation, SurroundingRectangle, VGroup, BLUE, GREEN, LEFT, RIGHT, UP
+
+from src.utils.style_buffer import StyleBuffer
+from src.utils.text_cache import cached_text
+
+
+class ChatTranscript(VGroup):
+    """
+    Chat bubbles stacked from the top of a window, scrolled up as new messages are revealed.
+
+    Messages are revealed one by one (`RevealMessage`), the window scrolls so the last one is
+    fully visible and the bubbles crossing the top edge fade out; once out of the window they
+    are removed from the scene.
+
+    Args:
+        messages (Sequence[tuple[str, bool]]): (text, is_user) pairs; user messages are aligned right.
+        top (float, optional): Top edge of the window. Defaults to 3.
+        bottom (float, optional): Bottom edge of the window. Defaults to -3.5.
+        right (float, optional): Right edge of the user bubbles. Defaults to 4.
+        left (float, optional): Left edge of the other bubbles. Defaults to -3.
+        gap (float, optional): Vertical space between bubbles. Defaults to 0.6.
+        text_size (float, optional): Font size. Defaults to 24.
+        roundness (float, optional): Corner radius of the bubbles. Defaults to 0.3.
+        user_color (str, optional): Bubble color of the user messages. Defaults to BLUE.
+        bot_color (str, optional): Bubble color of the other messages. Defaults to GREEN.
+        max_cached (int, optional): Bubbles kept built outside the window. Defaults to 32.
+
+    Example:
+        >>> chat = ChatTranscript(messages)
+        >>> self.play(Succession(*[RevealMessage(chat) for _ in messages]))
+    """
+
+    def __init__(
+        self,
+        messages: Sequence[tuple[str, bool]],
+        top: float = 3,
+        bottom: float = -3.5,
+        right: float = 4,
+        left: float = -3,
+        gap: float = 0.6,
+        text_size: float = 24,
+        roundness: float = 0.3,
+        user_color: str = BLUE,
+        bot_color: str = GREEN,
+        max_cached: int = 32,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.messages = list(messages)
+        self.top = top
+        self.bottom = bottom
+        self.right = right
+        self.left = left
+        self.gap = gap
+        self.text_size = text_size
+        self.roundness = roundness
+        self.user_color = user_color
+        self.bot_color = bot_color
+        self.max_cached = max_cached
+
+        self.scroll = 0.0  # how far the conversation moved up
+        self.revealed = 0  # messages [0, revealed) may be shown
+
+        # layout of the measured messages, unscrolled: how far below the top edge every bubble
+        # starts and ends (both increasing, for bisect) and their heights
+        self._depths: list[float] = []
+        self._ends: list[float] = []
+        self._heights: list[float] = []
+        # built bubbles, least recently used first: index -> (bubble, its style, its current scroll)
+        self._bubbles: OrderedDict[int, tuple[VGroup, StyleBuffer, float]] = OrderedDict()
+
+    def _build(self, index: int) -> VGroup:
+        message, is_user = self.messages[index]
+        text = cached_text(message, font_size=self.text_size, line_spacing=0.5)
+        color = self.user_color if is_user else self.bot_color
+        box = SurroundingRectangle(
+            text, corner_radius=self.roundness, color=color, fill_color=color, fill_opacity=0.5, buff=0.2
+        )
+        bubble = VGroup(box, text)
+        if is_user:
+            bubble.align_to(RIGHT * self.right, RIGHT)
+        else:
+            bubble.align_to(RIGHT * self.left, LEFT)
+        return bubble
+
+    def bubble(self, index: int) -> VGroup:
+        """The bubble of a message, built (and measured) if needed, at its place for the current scroll"""
+        entry = self._bubbles.get(index)
+        if entry is not None:
+            self._bubbles.move_to_end(index)
+            return entry[0]
+
+        self._measure(index - 1)
+        bubble = self._build(index)
+        if index == len(self._depths):
+            previous = self._ends[-1] + self.gap if self._ends else 0.0
+            self._depths.append(previous)
+            self._ends.append(previous + bubble.height)
+            self._heights.append(bubble.height)
+        bubble.shift(UP * (self.top - self._depths[index] - bubble.get_top()[1]))
+        self._bubbles[index] = (bubble, StyleBuffer([bubble]), 0.0)
+        self._evict()
+        return bubble
+
+    def _measure(self, index: int) -> None:
+        """Lay out the messages up to `index` (a bubble's place depends on the heights above it)"""
+        for missing in range(len(self._depths), index + 1):
+            self.bubble(missing)
+
+    def _evict(self) -> None:
+        shown = {id(bubble) for bubble in self.submobjects}
+        for index in list(self._bubbles):
+            if len(self._bubbles) <= self.max_cached:
+                break
+            if id(self._bubbles[index][0]) not in shown:
+                del self._bubbles[index]
+
+    def scroll_to_show(self, index: int) -> float:
+        """Scroll at which the bubble of `index` is fully inside the window (never scrolls back)"""
+        self._measure(index)
+        bubble_bottom = self.top - self._depths[index] - self._heights[index]
+        return max(self.scroll, self.bottom - bubble_bottom)
+
+    def visible(self, scroll: float | None = None) -> range:
+        """Indices of the revealed messages inside the window at a given scroll"""
+        scroll = self.scroll if scroll is None else scroll
+        # the bubbles whose bottom is below the top edge, and whose top is above the bottom edge
+        first = bisect_right(self._ends, scroll)
+        end = bisect_left(self._depths, self.top - self.bottom + scroll)
+        return range(first, min(end, self.revealed))
+
+    def set_scroll(self, scroll: float, prune: bool = True, entering: tuple[int, float] | None = None) -> "ChatTranscript":
+        """
+        Move the conversation, fading the bubbles that cross the top edge.
+
+        Args:
+            scroll (float): How far the conversation moved up.
+            prune (bool, optional): Drop the bubbles that left the window from the submobjects.
+                Animations keep them until they finish (the renderer lists what it draws when
+                an animation begins), transparent. Defaults to True.
+            entering (tuple[int, float] | None, optional): (index, progress) of a bubble being
+                revealed: it rises into its place while fading in. Defaults to None.
+
+        Returns:
+            ChatTranscript: self.
+        """
+        self.scroll = scroll
+        shown = []
+        for index in self.visible(scroll):
+            bubble = self.bubble(index)
+            _, style, placed_at = self._bubbles[index]
+            offset = scroll
+            opacity = 1.0
+            if entering is not None and entering[0] == index:
+                offset -= (1 - entering[1]) * RevealMessage.RISE
+                opacity = entering[1]
+
+            bubble.shift(UP * (offset - placed_at))
+            self._bubbles[index] = (bubble, style, offset)
+            bubble_bottom = self.top - self._depths[index] - self._heights[index] + offset
+            opacity *= float(np.clip((self.top - bubble_bottom) / self._heights[index], 0, 1))
+            style.scale_opacity(opacity).write()
+            style.release()  # the bubble keeps its own arrays (other animations may restyle it)
+            shown.append(bubble)
+
+        if prune:
+            self.submobjects = shown
+            self._evict()
+        else:
+            kept = {id(bubble) for bubble in shown}
+            for bubble in self.submobjects:
+                if id(bubble) not in kept:
+                    bubble.set_opacity(0)
+            self.submobjects += [bubble for bubble in shown if bubble not in self.submobjects]
+        return self
+
+
+class ScrollTranscript(Animation):
+    """Scroll a `ChatTranscript` to a given position (bubbles come and go as they cross the window)"""
+
+    def __init__(self, transcript: ChatTranscript, scroll: float, **kwargs):
+        self.target = scroll
+        super().__init__(transcript, introducer=True, suspend_mobject_updating=False, **kwargs)
+
+    def begin(self) -> None:
+        self.start = self.mobject.scroll
+        self.starting_mobject = self.mobject
+        self.interpolate(0)
+
+    def get_all_mobjects(self) -> list[ChatTranscript]:
+        return [self.mobject]
+
+    def _entering(self, progress: float) -> tuple[int, float] | None:
+        return None
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        progress = self.rate_func(min(alpha, 1.0))
+        scroll = self.start + (self.target - self.start) * progress
+        self.mobject.set_scroll(scroll, prune=False, entering=self._entering(progress))
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject.set_scroll(self.target)
+
+
+class RevealMessage(ScrollTranscript):
+    """
+    Reveal the next message of a `ChatTranscript` (rising and fading in like `FadeIn(shift=UP)`),
+    scrolling the window first if it does not fit.
+    """
+
+    RISE = 0.5  # how far a revealed bubble rises into its place
+
+    def __init__(self, transcript: ChatTranscript, index: int | None = None, **kwargs):
+        self.index = index
+        super().__init__(transcript, transcript.scroll, **kwargs)
+
+    def begin(self) -> None:
+        transcript: ChatTranscript = self.mobject
+        # known only now: the previous reveals of a Succession have run
+        if self.index is None:
+            self.index = transcript.revealed
+        self.target = transcript.scroll_to_show(self.index)
+        transcript.revealed = max(transcript.revealed, self.index + 1)
+        super().begin()
+
+    def _entering(self, progress: float) -> tuple[int, float] | None:
+        return self.index, progress
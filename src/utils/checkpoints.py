@@ -0,0 +1,208 @@
+"""
+Scene state checkpoints at section boundaries (see `src/utils/sections.py`).
+
+With KSE_CHECKPOINTS=1 (`render.py --checkpoints`) the state of the scene is saved at the
+start of every section: its mobjects, the attributes set on it, the values returned by the
+previous sections, the arguments of the section and the renderer's time and play count. A checkpoint is keyed by a hash of the
+code that ran before it (the scene module without the later sections, the project modules
+it imports), so editing a section only invalidates the checkpoints after it.
+
+When only some sections are rendered (`--sections`), the scene resumes from the checkpoint
+of the first selected one: the sections before it are not executed at all.
+
+This runs inside the render environment (it imports manim). Mobjects with updaters made of
+lambdas (`always_redraw`) need `dill`, installed in the prewarmed image; without it such
+checkpoints are skipped.
+"""
+import ast
+import sys
+import json
+import hashlib
+import inspect
+from pathlib import Path
+from typing import Any
+
+try:
+    import dill as pickle  # serializes lambdas and closures (updaters)
+except ImportError:
+    import pickle
+
+from manim import Mobject, Scene, __version__ as manim_version
+
+from src.utils.config import CACHE_DIR
+
+CHECKPOINTS_DIR = CACHE_DIR / "checkpoints"
+# bumped when the saved state changes, so that older checkpoints are not used any more
+CHECKPOINT_FORMAT = "2"  # 2: renderer time and number of plays
+
+
+def _hash(*parts: str) -> str:
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _is_section_method(node: ast.AST) -> bool:
+    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return False
+    for decorator in node.decorator_list:
+        func = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if (func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)) == "section":
+            return True
+    return False
+
+
+_SCENE_ATTRIBUTES: set[str] | None = None
+
+
+def _scene_attributes() -> set[str]:
+    """Attributes manim's Scene sets on itself (not scene state worth saving)"""
+    global _SCENE_ATTRIBUTES
+    if _SCENE_ATTRIBUTES is None:
+        names = {"renderer", "camera"}
+        for klass in Scene.__mro__[:-1]:
+            tree = ast.parse(inspect.getsource(klass).lstrip())
+            for node in ast.walk(tree):
+                if (
+                    isinstance(node, ast.Attribute)
+                    and isinstance(node.ctx, ast.Store)
+                    and isinstance(node.value, ast.Name)
+                    and node.value.id == "self"
+                ):
+                    names.add(node.attr)
+        _SCENE_ATTRIBUTES = names
+    return _SCENE_ATTRIBUTES
+
+
+class CodeDigest:
+    """Hashes of the code a scene's state depends on, split by section"""
+
+    def __init__(self, scene_class: type[Scene]):
+        source_file = Path(inspect.getsourcefile(scene_class) or "")
+        tree = ast.parse(source_file.read_text(encoding="utf-8"))
+
+        self.sections: dict[str, str] = {}
+        others = []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == scene_class.__name__:
+                for item in node.body:
+                    if _is_section_method(item):
+                        self.sections[item.name] = _hash(ast.dump(item))
+                    else:
+                        others.append(ast.dump(item))
+            else:
+                others.append(ast.dump(node))  # module level code and the other classes
+
+        self.base = _hash(
+            CHECKPOINT_FORMAT,
+            manim_version,
+            f"{sys.version_info[0]}.{sys.version_info[1]}",
+            pickle.__name__,
+            *others,
+            *self._dependencies(source_file),
+        )
+
+    @staticmethod
+    def _dependencies(source_file: Path) -> list[str]:
+        from src.utils.scene_dependencies import DependencyGraph
+
+        graph = DependencyGraph().build()
+        path = source_file.resolve()
+        if path not in graph.modules:
+            return []
+        return [
+            hashlib.sha1(module.read_bytes()).hexdigest()
+            for module in sorted(graph.dependencies(path))
+            if module.is_file()
+        ]
+
+    def key(self, methods: list[str]) -> str:
+        """Key of the checkpoint taken after running the given section methods, in order"""
+        return _hash(self.base, *(f"{name}:{self.sections.get(name, '')}" for name in methods))
+
+
+class Checkpoint:
+    """A saved scene state, identified by the section it starts"""
+
+    def __init__(self, scene_class: type[Scene], section: str, path: list[str], methods: list[str], key: str):
+        self.scene_class = scene_class
+        self.section = section
+        self.path = path  # sections run before it, in call order
+        self.methods = methods  # their method names (what the key is made of)
+        self.key = key
+
+    @staticmethod
+    def directory(scene_class: type[Scene]) -> Path:
+        return CHECKPOINTS_DIR / scene_class.__name__
+
+    @property
+    def file(self) -> Path:
+        return self.directory(self.scene_class) / f"{self.section}-{self.key[:16]}.pkl"
+
+    @classmethod
+    def find(cls, scene_class: type[Scene], digest: CodeDigest) -> list["Checkpoint"]:
+        """Return the checkpoints of the scene that are still valid for its current code"""
+        checkpoints = []
+        for meta_file in sorted(cls.directory(scene_class).glob("*.json")):
+            try:
+                meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            checkpoint = cls(scene_class, meta["section"], meta["path"], meta["methods"], meta["key"])
+            if checkpoint.key == digest.key(checkpoint.methods) and checkpoint.file.exists():
+                checkpoints.append(checkpoint)
+        return checkpoints
+
+    def save(self, scene: Scene, returns: list[Any], args: tuple, kwargs: dict) -> bool:
+        """Pickle the scene state (one pickle, so the objects keep sharing identities)"""
+        if self.file.exists():
+            return True
+
+        attributes = {
+            name: value for name, value in vars(scene).items()
+            if name not in _scene_attributes() and not name.startswith("_kse")
+        }
+        # class level mobjects are shared by every instance, save the ones in use
+        for klass in type(scene).__mro__:
+            for name, value in vars(klass).items():
+                if isinstance(value, Mobject) and name not in attributes:
+                    attributes[name] = value
+
+        state = {
+            # the scene time (updaters, `-n` ranges) and manim's play counter (`Animation N`)
+            "time": scene.renderer.time,
+            "num_plays": scene.renderer.num_plays,
+            "mobjects": scene.mobjects,
+            "foreground_mobjects": scene.foreground_mobjects,
+            "attributes": attributes,
+            "returns": returns,
+            "args": args,
+            "kwargs": kwargs,
+        }
+        try:
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:  # unpicklable updaters, C objects, ...
+            print(f"⚠️  No checkpoint for section '{self.section}': {type(e).__name__}: {e}")
+            return False
+
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.file.with_suffix(".tmp")
+        tmp_file.write_bytes(data)
+        tmp_file.replace(self.file)
+        self.file.with_suffix(".json").write_text(
+            json.dumps({"section": self.section, "path": self.path, "methods": self.methods, "key": self.key}),
+            encoding="utf-8",
+        )
+        return True
+
+    def load(self) -> dict[str, Any]:
+        with open(self.file, "rb") as file:
+            return pickle.load(file)
+
+    @staticmethod
+    def restore(scene: Scene, state: dict[str, Any]) -> None:
+        """Replace the scene state with a loaded checkpoint"""
+        scene.renderer.time = state["time"]
+        scene.renderer.num_plays = state["num_plays"]
+        scene.mobjects = state["mobjects"]
+        scene.foreground_mobjects = state["foreground_mobjects"]
+        for name, value in state["attributes"].items():
+            setattr(scene, name, value)
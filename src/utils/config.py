@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 IS_DEBUG_MODE_ON = False
@@ -11,13 +12,25 @@ ASSETS_DIR = BASE_DIR / "assets"
 SPRITES_SHEETS_DIR = ASSETS_DIR / "sprites_sheets"
 SPRITES_POSES_DIR = ASSETS_DIR / "sprites_poses"
 LOGOS_DIR = ASSETS_DIR / "logos"
+EMBEDDINGS_DIR = ASSETS_DIR / "embeddings"
+
+# Word embeddings of the vector scenes (`src/utils/embeddings.py`), the small synthetic
+# vocabulary unless KSE_EMBEDDINGS points to a real one
+EMBEDDINGS_FILE = Path(os.environ.get("KSE_EMBEDDINGS", EMBEDDINGS_DIR / "synthetic_uk.npz"))
+
+# Local state of the render tooling (timings, caches, ...), lives inside the project
+# so it is visible from the render containers too
+CACHE_DIR = BASE_DIR / ".cache"
+
+# manim's output tree (`media/videos/<module>/<quality>/`, ...) and the assembled lectures
+MEDIA_DIR = BASE_DIR / "media"
+LECTURES_OUTPUT_DIR = MEDIA_DIR / "lectures"
 
 SPRITE_ANIMATIONS_DIR = SOURCES_DIR / "animations_sprites"
 LECTURE_ANIMATIONS_DIR = SOURCES_DIR / "animations_lectures"
 NOTEBOOKS_DIR = BASE_DIR / "notebooks"
 
-# check if the directories exist, if not create them
-for directory in [
+PROJECT_DIRS = [
     ASSETS_DIR,
     SPRITES_SHEETS_DIR,
     SPRITES_POSES_DIR,
@@ -25,10 +38,42 @@ for directory in [
     SPRITE_ANIMATIONS_DIR,
     LECTURE_ANIMATIONS_DIR,
     NOTEBOOKS_DIR,
-]:
-    if directory.exists() and directory.is_file():
-        directory.unlink()  # Remove the file if a file exists with the same name
-    directory.mkdir(parents=True, exist_ok=True)
+    CACHE_DIR,
+]
+
+
+def ensure_directories() -> None:
+    """Create the project directories if they don't exist yet (explicit step, not done on import)"""
+    for directory in PROJECT_DIRS:
+        if directory.exists() and directory.is_file():
+            directory.unlink()  # Remove the file if a file exists with the same name
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+# Docker image used for rendering and an optional local copy of it
+# (created with `docker save manimcommunity/manim:v0.19.0 -o manim_image.tar`).
+# Same tag as the `FROM` of the Dockerfile: the prewarmed image is compared against it.
+MANIM_DOCKER_IMAGE = "manimcommunity/manim:v0.19.0"
+MANIM_IMAGE_TARBALL = BASE_DIR / "manim_image.tar"
+
+# Prewarmed render image, built from the `prewarmed` stage of the Dockerfile
+PREWARMED_DOCKER_IMAGE = "kse-manim-lectures:prewarmed"
+
+# Directories baked into the prewarmed image (the env variables are set by the Dockerfile)
+TEX_FORMATS_DIR = Path(os.environ["KSE_TEX_FORMATS_DIR"]) if "KSE_TEX_FORMATS_DIR" in os.environ else None
+PREBUILT_SPRITES_POSES_DIR = (
+    Path(os.environ["KSE_PREBUILT_POSES_DIR"]) if "KSE_PREBUILT_POSES_DIR" in os.environ else None
+)
+UKRAINIAN_TEX_FORMAT = "kse_ukrainian"
+
+# Manim quality flags: (width, height, fps), the output folder is f"{height}p{fps}"
+QUALITIES = {
+    "ql": (854, 480, 15),
+    "qm": (1280, 720, 30),
+    "qh": (1920, 1080, 60),
+    "qp": (2560, 1440, 60),
+    "qk": (3840, 2160, 60),
+}
 
 POSE_PREFIX = "pose_"
 
@@ -0,0 +1,262 @@
+"""
+Contact sheets: the end frame of every play (or section) of a scene, tiled into one image.
+
+Reviewing a scene this way needs no video: `construct` is replayed with every animation
+fast-forwarded (like the scene probe) and only the frames to keep are drawn, at preview
+resolution. The plays of a scene are dealt round-robin to several worker processes, all
+the scenes at once, and the frames are tiled on the host into
+`media/images/<module>/<Scene>_contact_sheet.png`, with an HTML index of all the sheets.
+
+    python render.py IntroToTrigonometry --contact-sheet
+    python render.py --contact-sheet --by-sections      # every scene, a frame per section
+"""
+import os
+import json
+import html
+import shutil
+import argparse
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.config import CACHE_DIR, MEDIA_DIR, SOURCES_DIR
+from src.utils.manim_scenes_finder import find_scene_by_name, scene_media_name
+
+FRAMES_DIR = CACHE_DIR / "contact_sheets"
+SHEET_SUFFIX = "_contact_sheet.png"
+INDEX_FILE = MEDIA_DIR / "images" / "contact_sheets.html"
+
+COLUMNS = 6
+THUMBNAIL_WIDTH = 320
+LABEL_HEIGHT = 20
+MAX_WORKERS_PER_SCENE = 4  # every worker replays the whole `construct`, more do not pay off
+
+
+def capture_frames(
+    file_name: str,
+    class_name: str,
+    out_dir: Path,
+    quality: str = "ql",
+    by_sections: bool = False,
+    worker: int = 0,
+    workers: int = 1,
+) -> list[dict]:
+    """
+    Replay a scene without rendering and save the end frames of its plays (runs in the render environment).
+
+    Args:
+        file_name (str): Scene source file, relative to the project root.
+        class_name (str): Scene class name.
+        out_dir (Path): Where to write the PNG frames.
+        quality (str, optional): Resolution of the frames. Defaults to "ql".
+        by_sections (bool, optional): A frame per section (its end) instead of per play. Defaults to False.
+        worker (int, optional): This worker's number. Defaults to 0.
+        workers (int, optional): Number of workers, each saves every `workers`-th frame. Defaults to 1.
+
+    Returns:
+        list[dict]: {"index", "label", "file"} of the saved frames.
+    """
+    from PIL import Image
+    from manim import Scene
+
+    from src.utils.scene_probe import PlayRecorder, configure, load_scene_class, run_scene
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    frames = []
+    counter = {"frames": 0, "plays": 0}
+
+    def section_name(scene: Scene) -> str:
+        sections = getattr(scene.renderer.file_writer, "sections", None)
+        return sections[-1].name if sections else ""
+
+    def save(scene: Scene, label: str) -> None:
+        index = counter["frames"]
+        counter["frames"] += 1
+        if index % workers != worker:
+            return
+        scene.renderer.update_frame(scene)  # ignores the skipping: draws this one frame
+        file = out_dir / f"{index:04d}.png"
+        Image.fromarray(scene.renderer.get_frame()).save(file)
+        frames.append({"index": index, "label": label, "file": file.name})
+
+    def on_play(scene: Scene, index: int) -> None:
+        counter["plays"] += 1
+        if not by_sections:
+            section = section_name(scene)
+            save(scene, f"{index}" + (f" · {section}" if section and section != "autocreated" else ""))
+
+    recorder = PlayRecorder()
+    recorder.callbacks.append(on_play)
+    recorder.install()
+
+    if by_sections:
+        original_next_section = Scene.next_section
+        plays_at_section_start = {"plays": 0}
+
+        def next_section(scene: Scene, *args, **kwargs):
+            if counter["plays"] > plays_at_section_start["plays"]:  # the section that ends had animations
+                save(scene, section_name(scene))
+            plays_at_section_start["plays"] = counter["plays"]
+            return original_next_section(scene, *args, **kwargs)
+
+        Scene.next_section = next_section
+
+    configure(file_name, quality)
+    scene = run_scene(load_scene_class(file_name, class_name), skip_all=True)
+    if by_sections and counter["plays"] > plays_at_section_start["plays"]:
+        save(scene, section_name(scene))
+    return frames
+
+
+def tile_frames(frames: list[tuple[Path, str]], sheet_path: Path, columns: int = COLUMNS, thumbnail_width: int = THUMBNAIL_WIDTH) -> Path:
+    """
+    Tile frames into a labelled grid.
+
+    Args:
+        frames (list[tuple[Path, str]]): (PNG file, label) in order.
+        sheet_path (Path): The contact sheet to write.
+        columns (int, optional): Frames per row. Defaults to 6.
+        thumbnail_width (int, optional): Width of a frame on the sheet. Defaults to 320.
+
+    Returns:
+        Path: The contact sheet.
+    """
+    from PIL import Image, ImageDraw
+
+    with Image.open(frames[0][0]) as first:
+        thumbnail_height = round(first.height * thumbnail_width / first.width)
+    cell_height = thumbnail_height + LABEL_HEIGHT
+    rows = -(-len(frames) // columns)
+    sheet = Image.new("RGB", (columns * thumbnail_width, rows * cell_height), "black")
+    draw = ImageDraw.Draw(sheet)
+    for position, (file, label) in enumerate(frames):
+        x, y = (position % columns) * thumbnail_width, (position // columns) * cell_height
+        with Image.open(file) as frame:
+            sheet.paste(frame.convert("RGB").resize((thumbnail_width, thumbnail_height), Image.LANCZOS), (x, y))
+        draw.text((x + 4, y + thumbnail_height + 3), label, fill="white")
+
+    sheet_path.parent.mkdir(parents=True, exist_ok=True)
+    sheet.save(sheet_path, optimize=True)
+    return sheet_path
+
+
+def write_index(sheets: dict[str, tuple[Path, int]], index_path: Path = INDEX_FILE) -> Path:
+    """
+    Write an HTML page showing the contact sheets (merged with the scenes already in it).
+
+    Args:
+        sheets (dict[str, tuple[Path, int]]): Scene name -> (contact sheet, number of frames).
+        index_path (Path, optional): The page. Defaults to INDEX_FILE.
+
+    Returns:
+        Path: The page.
+    """
+    listing = index_path.with_suffix(".json")
+    entries = json.loads(listing.read_text(encoding="utf-8")) if listing.exists() else {}
+    for scene, (sheet, count) in sheets.items():
+        entries[scene] = {"sheet": Path(os.path.relpath(sheet, index_path.parent)).as_posix(), "frames": count}
+    entries = {scene: entry for scene, entry in sorted(entries.items()) if (index_path.parent / entry["sheet"]).exists()}
+
+    body = "\n".join(
+        f'<section id="{html.escape(scene)}"><h2>{html.escape(scene)} <small>{entry["frames"]} frames</small></h2>'
+        f'<a href="{html.escape(entry["sheet"])}"><img src="{html.escape(entry["sheet"])}" alt="{html.escape(scene)}"></a></section>'
+        for scene, entry in entries.items()
+    )
+    toc = " · ".join(f'<a href="#{html.escape(scene)}">{html.escape(scene)}</a>' for scene in entries)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Contact sheets</title>"
+        "<style>body{background:#111;color:#eee;font-family:sans-serif}img{max-width:100%}</style></head>\n"
+        f"<body><h1>Contact sheets</h1><p>{toc}</p>\n{body}\n</body></html>\n",
+        encoding="utf-8",
+    )
+    listing.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+    return index_path
+
+
+def make_contact_sheets(
+    scene_names: list[str],
+    project_dir: Path,
+    image: str | None,
+    by_sections: bool = False,
+    workers: int = os.cpu_count() or 2,
+) -> dict[str, Path]:
+    """
+    Build the contact sheets of scenes, capturing their frames in parallel worker processes.
+
+    Args:
+        scene_names (list[str]): Scene names.
+        project_dir (Path): The project root.
+        image (str | None): The render image, None for the local backend.
+        by_sections (bool, optional): A frame per section instead of per play. Defaults to False.
+        workers (int, optional): Worker processes in total. Defaults to the CPU count.
+
+    Returns:
+        dict[str, Path]: Scene name -> its contact sheet (scenes that failed are left out).
+    """
+    from src.utils.render_backend import render_command, render_env
+
+    per_scene = max(1, min(MAX_WORKERS_PER_SCENE, workers // max(1, len(scene_names))))
+    scenes = {}
+    for name in scene_names:
+        module_path, class_name = find_scene_by_name(name)
+        source_file = (SOURCES_DIR / module_path.replace(".", "/")).with_suffix(".py")
+        frames_dir = FRAMES_DIR / class_name
+        shutil.rmtree(frames_dir, ignore_errors=True)
+        scenes[class_name] = (source_file.relative_to(project_dir).as_posix(), scene_media_name(module_path), frames_dir)
+
+    def capture(class_name: str, worker: int) -> list[dict] | None:
+        file_name, _, frames_dir = scenes[class_name]
+        result_path = frames_dir / f"worker_{worker}.json"
+        command = render_command(
+            project_dir, image,
+            ["python", "-m", "src.utils.contact_sheet", file_name, class_name,
+             "--out", frames_dir.relative_to(project_dir).as_posix(),
+             "--worker", str(worker), "--workers", str(per_scene)] + (["--by-sections"] if by_sections else []),
+        )
+        result = subprocess.run(command, capture_output=True, text=True, cwd=project_dir, env=render_env(project_dir, image))
+        if result.returncode != 0:
+            print(f"⚠️  Capturing {class_name} (worker {worker}) failed:\n{result.stderr.strip()[-1000:]}")
+            return None
+        return json.loads(result_path.read_text(encoding="utf-8"))
+
+    tasks = [(class_name, worker) for class_name in scenes for worker in range(per_scene)]
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        results = dict(zip(tasks, pool.map(lambda task: capture(*task), tasks)))
+
+    sheets = {}
+    for class_name, (_, module_name, frames_dir) in scenes.items():
+        parts = [results[(class_name, worker)] for worker in range(per_scene)]
+        if any(part is None for part in parts):
+            continue
+        frames = sorted((frame for part in parts for frame in part), key=lambda frame: frame["index"])
+        if not frames:
+            print(f"⚠️  {class_name} has no animations, no contact sheet")
+            continue
+        sheet = tile_frames(
+            [(frames_dir / frame["file"], frame["label"]) for frame in frames],
+            MEDIA_DIR / "images" / module_name / f"{class_name}{SHEET_SUFFIX}",
+        )
+        sheets[class_name] = (sheet, len(frames))
+        print(f"🖼️  {class_name}: {len(frames)} frames -> {sheet.relative_to(project_dir).as_posix()}")
+    if sheets:
+        print(f"🖼️  Index: {write_index(sheets).relative_to(project_dir).as_posix()}")
+    return {class_name: sheet for class_name, (sheet, _) in sheets.items()}
+
+
+if __name__ == "__main__":
+    # a worker, in the render environment: python -m src.utils.contact_sheet FILE SCENE --out DIR ...
+    parser = argparse.ArgumentParser(description="Save the end frames of the plays of a scene")
+    parser.add_argument("file", help="Scene source file (relative to the project root)")
+    parser.add_argument("scene", help="Scene class name")
+    parser.add_argument("--out", required=True, help="Directory of the frames (and of worker_<N>.json)")
+    parser.add_argument("--worker", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--by-sections", action="store_true", help="A frame per section instead of per play")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    captured = capture_frames(
+        args.file, args.scene, out_dir, by_sections=args.by_sections, worker=args.worker, workers=args.workers
+    )
+    (out_dir / f"worker_{args.worker}.json").write_text(json.dumps(captured), encoding="utf-8")
@@ -0,0 +1,372 @@
+import os
+import json
+import time
+import socket
+import http.client
+from pathlib import Path
+from urllib.parse import quote, urlencode
+
+DEFAULT_SOCKET_PATHS = [
+    "/var/run/docker.sock",
+    str(Path.home() / ".docker" / "run" / "docker.sock"),  # Docker Desktop (macOS)
+    str(Path(os.environ.get("XDG_RUNTIME_DIR", "/run/user/0")) / "docker.sock"),  # rootless
+]
+
+# read timeout for long-running requests (image pull/load)
+LONG_TIMEOUT = 600.0
+
+# errors after which a kept-alive connection is dropped and the request retried once
+_RECONNECT_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.ResponseNotReady,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class DockerAPIError(Exception):
+    """Raised when the Docker Engine API returns an error"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Docker API error {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a unix domain socket"""
+
+    def __init__(self, socket_path: str, timeout: float | None = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+def _split_image_ref(image: str) -> tuple[str, str]:
+    """Split 'repo/name:tag' into ('repo/name', 'tag'), defaulting the tag to 'latest'"""
+    name, sep, tag = image.rpartition(":")
+    if not sep or "/" in tag:
+        return image, "latest"
+    return name, tag
+
+
+def find_docker_socket() -> str | None:
+    """Find the Docker Engine unix socket (DOCKER_HOST or the default locations)"""
+    if not hasattr(socket, "AF_UNIX"):  # Windows named pipes are not supported
+        return None
+
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host:
+        if docker_host.startswith("unix://"):
+            return docker_host.removeprefix("unix://")
+        return None  # tcp:// or ssh:// hosts are handled by the docker CLI
+
+    for path in DEFAULT_SOCKET_PATHS:
+        if Path(path).exists():
+            return path
+    # the socket appears only once the daemon is started
+    return DEFAULT_SOCKET_PATHS[0]
+
+
+class DockerClient:
+    """
+    Minimal Docker Engine API client over the unix socket.
+
+    The HTTP connection is kept alive and reused between requests, and a
+    successful health check is cached for the rest of the session, so the
+    daemon is not pinged (or the `docker` CLI spawned) for every render.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 10.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn: UnixHTTPConnection | None = None
+        self._is_healthy = False
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _get_connection(self) -> UnixHTTPConnection:
+        if self._conn is None:
+            self._conn = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        return self._conn
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict | None = None,
+        body=None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> http.client.HTTPResponse:
+        """Send a request on the kept-alive connection (reconnecting once if it went stale)"""
+        url = path + (f"?{urlencode(params)}" if params else "")
+        for attempt in range(2):
+            conn = self._get_connection()
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                conn.sock.settimeout(timeout if timeout is not None else self.timeout)
+                conn.request(method, url, body=body, headers=headers or {})
+                return conn.getresponse()
+            except _RECONNECT_ERRORS:
+                self.close()
+                if attempt == 1:
+                    raise
+            except OSError:
+                self.close()
+                raise
+        raise AssertionError("unreachable")
+
+    def ping(self) -> bool:
+        """Check if the daemon answers on the socket"""
+        try:
+            response = self._request("GET", "/_ping", timeout=2.0)
+            return response.status == 200 and response.read().strip() == b"OK"
+        except (OSError, http.client.HTTPException):
+            return False
+
+    def is_healthy(self, refresh: bool = False) -> bool:
+        """Return the daemon health, cached for the session once the daemon was seen running"""
+        if not self._is_healthy or refresh:
+            self._is_healthy = self.ping()
+        return self._is_healthy
+
+    async def wait_until_ready(self, timeout: float = 30.0, interval: float = 0.5, on_wait=None) -> bool:
+        """
+        Wait until the daemon answers the ping, without spawning any process.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds. Defaults to 30.0.
+            interval (float, optional): Time between pings in seconds. Defaults to 0.5.
+            on_wait (Callable[[float], None] | None, optional): Called with the elapsed
+                time after every failed ping. Defaults to None.
+
+        Returns:
+            bool: True if the daemon became ready within the timeout.
+        """
+        import asyncio
+
+        start = time.monotonic()
+        while True:
+            if await asyncio.to_thread(self.is_healthy, True):
+                return True
+            elapsed = time.monotonic() - start
+            if elapsed >= timeout:
+                return False
+            if on_wait is not None:
+                on_wait(elapsed)
+            await asyncio.sleep(min(interval, timeout - elapsed))
+
+    def inspect_image(self, image: str) -> dict | None:
+        """Return the image details, or None if the image is not present locally"""
+        response = self._request("GET", f"/images/{quote(image, safe='/:')}/json")
+        data = response.read()
+        if response.status == 404:
+            return None
+        if response.status >= 400:
+            raise DockerAPIError(response.status, _error_message(data))
+        return json.loads(data)
+
+    def image_exists(self, image: str) -> bool:
+        """Check if the image is present locally"""
+        return self.inspect_image(image) is not None
+
+    def pull_image(self, image: str) -> None:
+        """Pull the image from the registry, raising DockerAPIError on failure"""
+        name, tag = _split_image_ref(image)
+        response = self._request(
+            "POST", "/images/create", params={"fromImage": name, "tag": tag}, timeout=LONG_TIMEOUT
+        )
+        _read_progress_stream(response)
+
+    def load_image(self, tarball: str | Path) -> None:
+        """Load the image from a tarball created with `docker save`"""
+        tarball = Path(tarball)
+        with tarball.open("rb") as f:
+            response = self._request(
+                "POST",
+                "/images/load",
+                params={"quiet": "1"},
+                body=f,
+                headers={
+                    "Content-Type": "application/x-tar",
+                    "Content-Length": str(tarball.stat().st_size),
+                },
+                timeout=LONG_TIMEOUT,
+            )
+            _read_progress_stream(response)
+
+    def ensure_image(self, image: str, tarball: str | Path | None = None) -> bool:
+        """
+        Make sure the image is present, loading it from a local tarball or pulling it.
+
+        Args:
+            image (str): Image reference, e.g. "manimcommunity/manim:v0.19.0".
+            tarball (str | Path | None, optional): Tarball from `docker save` to load
+                before falling back to a registry pull. Defaults to None.
+
+        Returns:
+            bool: True if the image is available.
+        """
+        if self.image_exists(image):
+            return True
+
+        if tarball is not None and Path(tarball).exists():
+            print(f"Loading image {image} from {tarball}...")
+            self.load_image(tarball)
+            if self.image_exists(image):
+                return True
+            print(f"Tarball {tarball} does not contain {image}.")
+
+        print(f"Pulling image {image}...")
+        self.pull_image(image)
+        return self.image_exists(image)
+
+
+def _error_message(data: bytes) -> str:
+    try:
+        return json.loads(data).get("message", data.decode(errors="replace"))
+    except (ValueError, AttributeError):
+        return data.decode(errors="replace")
+
+
+def _read_progress_stream(response: http.client.HTTPResponse) -> None:
+    """Consume a streamed JSON progress response, raising on errors"""
+    if response.status >= 400:
+        raise DockerAPIError(response.status, _error_message(response.read()))
+
+    while line := response.readline():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if "error" in message:
+            response.read()  # drain, so the connection can be reused
+            raise DockerAPIError(response.status, message["error"])
+
+
+_client: DockerClient | None = None
+
+
+def get_docker_client() -> DockerClient | None:
+    """Return the session-wide client, or None if the daemon socket is not reachable"""
+    global _client
+    if _client is None:
+        socket_path = find_docker_socket()
+        if socket_path is None:
+            return None
+        _client = DockerClient(socket_path)
+    return _client
+
+
+def self_check() -> bool:
+    """
+    Exercise the client against a fake Engine API on a temporary unix socket.
+
+    Checks the ping, the kept-alive connection (and the reconnect once the server dropped
+    it), image lookups and an error reported in the middle of a pull progress stream.
+
+    Returns:
+        bool: True if every check passed.
+    """
+    import sys
+    import tempfile
+    import threading
+    import socketserver
+    from http.server import BaseHTTPRequestHandler
+
+    connections = []
+
+    class FakeEngine(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, as dockerd
+
+        def setup(self):
+            super().setup()
+            connections.append(self.connection)
+
+        def _reply(self, status: int, body: bytes, close: bool = False):
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            if close:
+                self.send_header("Connection", "close")
+                self.close_connection = True
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/_ping":
+                self._reply(200, b"OK")
+            elif self.path == "/images/present:latest/json":
+                self._reply(200, json.dumps({"Id": "sha256:fake"}).encode())
+            elif self.path == "/close":
+                self._reply(200, b"", close=True)
+            else:
+                self._reply(404, json.dumps({"message": "No such image"}).encode())
+
+        def do_POST(self):
+            body = b'{"status":"Pulling"}\n{"error":"manifest unknown"}\n'
+            self._reply(200, body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+        def handle_error(self, request, client_address):
+            # the client hanging up (a checked reconnect) is not a failure, anything else is
+            if not isinstance(sys.exc_info()[1], ConnectionError):
+                super().handle_error(request, client_address)
+
+    checks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = str(Path(tmp) / "docker.sock")
+        with Server(socket_path, FakeEngine) as server:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            client = DockerClient(socket_path, timeout=2.0)
+
+            checks.append(("ping", client.ping()))
+            checks.append(("health is cached", client.is_healthy() and client.is_healthy()))
+            checks.append(("connection kept alive", len(connections) == 1))
+            checks.append(("image present", client.image_exists("present:latest")))
+            checks.append(("image missing", not client.image_exists("missing:latest")))
+            client._request("GET", "/close").read()
+            checks.append(("reconnects after a closed connection", client.ping() and len(connections) == 2))
+            try:
+                client.pull_image("missing:latest")
+                checks.append(("pull error raised", False))
+            except DockerAPIError as e:
+                checks.append(("pull error raised", "manifest unknown" in e.message))
+            checks.append(("connection reused after an error", client.ping() and len(connections) == 2))
+            client.close()
+            server.shutdown()
+
+    for name, ok in checks:
+        print(f"{'✅' if ok else '❌'} {name}")
+    return all(ok for _, ok in checks)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--self-check" in sys.argv[1:]:
+        raise SystemExit(0 if self_check() else 1)
+    client = get_docker_client()
+    if client is None:
+        print("❌ No Docker Engine unix socket (DOCKER_HOST is not unix://, or not supported here)")
+        raise SystemExit(1)
+    print(f"{'✅' if client.is_healthy() else '❌'} {client.socket_path}")
@@ -2,9 +2,13 @@ import os
 import subprocess
 import time
 
+from src.utils.config import MANIM_DOCKER_IMAGE, MANIM_IMAGE_TARBALL
 
-def _is_docker_running() -> bool:
-    """Check if Docker daemon is running"""
+DOCKER_START_TIMEOUT = 30  # seconds
+
+
+def _is_docker_running_cli() -> bool:
+    """Check if Docker daemon is running using the docker CLI (fallback without socket access)"""
     try:
         result = subprocess.run(
             ["docker", "info"], capture_output=True, text=True, timeout=10
@@ -14,6 +18,53 @@ def _is_docker_running() -> bool:
         return False
 
 
+def _get_docker_client():
+    # imported lazily: asyncio and http.client are too slow for the CLI startup
+    from src.utils.docker_client import get_docker_client
+
+    return get_docker_client()
+
+
+def _is_docker_running() -> bool:
+    """Check if Docker daemon is running (cached for the session once it is up)"""
+    client = _get_docker_client()
+    if client is not None and client.is_healthy():
+        return True
+    return _is_docker_running_cli()
+
+
+def _wait_for_docker(timeout: int = DOCKER_START_TIMEOUT) -> bool:
+    """Wait until the Docker daemon is ready"""
+    import asyncio
+
+    client = _get_docker_client()
+
+    if client is not None:
+        reported = set()
+
+        def on_wait(elapsed: float):
+            seconds = int(elapsed)
+            if seconds and seconds % 5 == 0 and seconds not in reported:
+                reported.add(seconds)
+                print(f"Still waiting for Docker... ({seconds}/{timeout} seconds)")
+
+        start = time.monotonic()
+        if asyncio.run(client.wait_until_ready(timeout=timeout, on_wait=on_wait)):
+            print(f"Docker started successfully after {time.monotonic() - start:.1f} seconds!\n")
+            return True
+        # the socket may live elsewhere (docker contexts, tcp hosts), ask the CLI once
+        return _is_docker_running_cli()
+
+    for i in range(timeout):
+        time.sleep(1)
+        if _is_docker_running_cli():
+            print(f"Docker started successfully after {i+1} seconds!\n")
+            return True
+        if (i + 1) % 5 == 0:
+            print(f"Still waiting for Docker... ({i+1}/{timeout} seconds)")
+    return False
+
+
 def _start_docker() -> bool:
     """Try to start Docker daemon"""
     print("Docker is not running. Attempting to start Docker...")
@@ -36,17 +87,12 @@ def _start_docker() -> bool:
             print("Starting Docker service...")
             subprocess.run(["sudo", "systemctl", "start", "docker"], check=False)
 
-        # Wait for Docker to start and check multiple times
+        # Wait for Docker to start
         print("Waiting for Docker to start...")
-        for i in range(30):  # Wait up to 30 seconds
-            time.sleep(1)
-            if _is_docker_running():
-                print(f"Docker started successfully after {i+1} seconds!\n")
-                return True
-            if (i + 1) % 5 == 0:
-                print(f"Still waiting for Docker... ({i+1}/30 seconds)")
-
-        print("Docker failed to start within 30 seconds.")
+        if _wait_for_docker():
+            return True
+
+        print(f"Docker failed to start within {DOCKER_START_TIMEOUT} seconds.")
         return False
 
     except Exception as e:
@@ -54,13 +100,33 @@ def _start_docker() -> bool:
         return False
 
 
+def ensure_manim_image(image: str = MANIM_DOCKER_IMAGE) -> bool:
+    """Ensure the render image is present locally (load it from MANIM_IMAGE_TARBALL or pull it)"""
+    from src.utils.docker_client import DockerAPIError
+
+    client = _get_docker_client()
+    if client is None or not client.is_healthy():
+        return True  # no socket access, let `docker run` pull the image itself
+
+    try:
+        if client.ensure_image(image, tarball=MANIM_IMAGE_TARBALL):
+            return True
+        print(f"Image {image} is not available.")
+        return False
+    except (DockerAPIError, OSError) as e:
+        print(f"Error preparing image {image}: {e}")
+        return False
+
+
 def ensure_docker_running() -> bool:
-    """Ensure Docker is running, start it if necessary"""
+    """Ensure Docker is running, start it if necessary, and make sure the render image is present"""
     print("Checking Docker status...")
 
     if _is_docker_running():
         print("Docker is already running!\n")
-        return True
+    else:
+        print("Docker is not running.")
+        if not _start_docker():
+            return False
 
-    print("Docker is not running.")
-    return _start_docker()
+    return ensure_manim_image()
@@ -0,0 +1,269 @@
+"""
+Word embeddings for the vector scenes, memory-mapped so big vocabularies stay on disk.
+
+Supported files:
+    - `.npz` written with `np.savez` (uncompressed): a `vectors` (N, D) array and a `words` (N,) array
+    - `.npy` (N, D) array, with the words in a `.txt` file next to it (one per line)
+
+Only numpy is needed (no manim), e.g. to explore a file:
+    python -m src.utils.embeddings assets/embeddings/synthetic_uk.npz --nearest собачка
+"""
+import zipfile
+import argparse
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from src.utils.config import EMBEDDINGS_FILE
+
+DEFAULT_BLOCK_SIZE = 65536  # rows per block of the blockwise operations (16 MB for 64 float32 dims)
+
+
+def _memmap_npz_member(path: Path, name: str) -> np.ndarray:
+    """Memory-map an array stored (uncompressed) in an `.npz` file, load it if compressed"""
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        print(f"⚠️  '{name}' is compressed in {path.name}, loading it in memory (save with np.savez to map it)")
+        with np.load(path) as data:
+            return data[name]
+
+    with open(path, "rb") as file:
+        # the local file header: 30 bytes, then the file name and the extra field
+        file.seek(info.header_offset + 26)
+        name_length, extra_length = np.frombuffer(file.read(4), dtype="<u2")
+        file.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        offset = file.tell()
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape, order="F" if fortran_order else "C")
+
+
+def cosine_similarity(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarities of every row of `a` with every row of `b`.
+
+    Args:
+        a (np.ndarray): (M, D) or (D,) vectors.
+        b (np.ndarray): (N, D) or (D,) vectors.
+
+    Returns:
+        np.ndarray: (M, N) similarities (dimensions of 1-D inputs are dropped), 0 for zero vectors.
+    """
+    a2, b2 = np.atleast_2d(a).astype(np.float64), np.atleast_2d(b).astype(np.float64)
+    a_norms = np.linalg.norm(a2, axis=1)[:, None]
+    b_norms = np.linalg.norm(b2, axis=1)[None, :]
+    norms = a_norms * b_norms
+    similarities = np.divide(a2 @ b2.T, norms, out=np.zeros((len(a2), len(b2))), where=norms > 0)
+    if np.ndim(b) == 1:
+        similarities = similarities[:, 0]
+    if np.ndim(a) == 1:
+        similarities = similarities[0]
+    return similarities
+
+
+class EmbeddingStore:
+    """
+    Word vectors read on demand from a memory-mapped file.
+
+    The matrix is never loaded as a whole: lookups read single rows and the vocabulary-wide
+    operations (norms, nearest neighbours, principal axes) go through it in blocks.
+
+    Example:
+        >>> store = EmbeddingStore(EMBEDDINGS_FILE)
+        >>> coords = store.project(["собачка", "кицюня", "добрий", "злий"])
+        >>> store.nearest("собачка", k=5)
+    """
+
+    def __init__(self, path: str | Path = EMBEDDINGS_FILE, block_size: int = DEFAULT_BLOCK_SIZE):
+        self.path = Path(path)
+        self.block_size = block_size
+        if self.path.suffix == ".npz":
+            self.vectors = _memmap_npz_member(self.path, "vectors")
+            with np.load(self.path) as data:
+                words = data["words"].tolist()
+        elif self.path.suffix == ".npy":
+            self.vectors = np.load(self.path, mmap_mode="r")
+            words = self.path.with_suffix(".txt").read_text(encoding="utf-8").splitlines()
+        else:
+            raise ValueError(f"Unsupported embeddings file: {self.path} (expected .npz or .npy)")
+
+        if self.vectors.ndim != 2 or len(self.vectors) != len(words):
+            raise ValueError(f"{self.path}: {len(words)} words for vectors of shape {self.vectors.shape}")
+        self.words: list[str] = words
+        self.index = {word: row for row, word in enumerate(words)}
+        self._norms: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.index
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    def blocks(self) -> Iterator[tuple[int, np.ndarray]]:
+        """Yield (first row, block) over the whole matrix, block by block"""
+        for start in range(0, len(self), self.block_size):
+            yield start, np.asarray(self.vectors[start:start + self.block_size], dtype=np.float32)
+
+    def row(self, word: str) -> int:
+        try:
+            return self.index[word]
+        except KeyError:
+            raise KeyError(f"'{word}' is not in the vocabulary of {self.path.name}") from None
+
+    def vector(self, word: str) -> np.ndarray:
+        return np.asarray(self.vectors[self.row(word)], dtype=np.float32)
+
+    def matrix(self, words: Sequence[str]) -> np.ndarray:
+        """(len(words), D) vectors of the given words (only those rows are read)"""
+        return np.asarray(self.vectors[[self.row(word) for word in words]], dtype=np.float32)
+
+    def norms(self) -> np.ndarray:
+        """Norms of all the vectors (computed once, blockwise)"""
+        if self._norms is None:
+            norms = np.empty(len(self), dtype=np.float32)
+            for start, block in self.blocks():
+                norms[start:start + len(block)] = np.sqrt(np.einsum("ij,ij->i", block, block))
+            self._norms = norms
+        return self._norms
+
+    def similarity(self, word1: str, word2: str) -> float:
+        return float(cosine_similarity(self.vector(word1), self.vector(word2)))
+
+    def nearest(self, query: str | np.ndarray, k: int = 10) -> list[tuple[str, float]]:
+        """
+        The `k` words most similar to a word or a vector, scanning the vocabulary in blocks.
+
+        Args:
+            query (str | np.ndarray): A word (excluded from the results) or a (D,) vector.
+            k (int, optional): Number of neighbours. Defaults to 10.
+
+        Returns:
+            list[tuple[str, float]]: (word, cosine similarity), most similar first.
+        """
+        excluded = self.row(query) if isinstance(query, str) else None
+        vector = self.vector(query) if isinstance(query, str) else np.asarray(query, dtype=np.float32)
+        query_norm = float(np.linalg.norm(vector))
+        norms = self.norms()
+
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        for start, block in self.blocks():
+            denominators = norms[start:start + len(block)] * query_norm
+            scores = np.divide(block @ vector, denominators, out=np.full(len(block), -np.inf, np.float32), where=denominators > 0)
+            if excluded is not None and start <= excluded < start + len(block):
+                scores[excluded - start] = -np.inf
+            # keep the k best of this block, then of the block and the previous best
+            top = np.argpartition(-scores, k - 1)[:k] if len(scores) > k else np.arange(len(scores))
+            best_rows = np.concatenate([best_rows, top + start])
+            best_scores = np.concatenate([best_scores, scores[top]])
+            if len(best_scores) > k:
+                keep = np.argpartition(-best_scores, k - 1)[:k]
+                best_rows, best_scores = best_rows[keep], best_scores[keep]
+
+        order = np.argsort(-best_scores)
+        return [(self.words[row], float(score)) for row, score in zip(best_rows[order], best_scores[order]) if np.isfinite(score)]
+
+    def principal_axes(self, words: Sequence[str] | None = None, n_components: int = 2, center: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        PCA of the given words, or of the whole vocabulary (streamed, a D x D matrix in memory).
+
+        Not centering (the default) keeps the angles to the origin meaningful: the axes
+        are those of the plane closest to the vectors themselves, which is what the cosine
+        similarity pictures need.
+
+        Args:
+            words (Sequence[str] | None, optional): Words to fit on. Defaults to the whole vocabulary.
+            n_components (int, optional): Number of axes. Defaults to 2.
+            center (bool, optional): Subtract the mean first (classic PCA). Defaults to False.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (D,) mean (zeros if not centered) and the (n_components, D) axes.
+        """
+        if words is not None:
+            data = self.matrix(words).astype(np.float64)
+            mean = data.mean(axis=0) if center else np.zeros(self.dim)
+            _, _, vt = np.linalg.svd(data - mean, full_matrices=False)
+            return mean, vt[:n_components]
+
+        total = np.zeros(self.dim)
+        second_moment = np.zeros((self.dim, self.dim))
+        for _, block in self.blocks():
+            block = block.astype(np.float64)
+            total += block.sum(axis=0)
+            second_moment += block.T @ block
+        mean = total / len(self) if center else np.zeros(self.dim)
+        scatter = second_moment - len(self) * np.outer(mean, mean)
+        eigenvalues, eigenvectors = np.linalg.eigh(scatter)
+        return mean, eigenvectors[:, np.argsort(eigenvalues)[::-1][:n_components]].T
+
+    def project(self, words: Sequence[str], axes: tuple[np.ndarray, np.ndarray] | None = None) -> np.ndarray:
+        """
+        Project words to 2-D (or on the given principal axes).
+
+        Args:
+            words (Sequence[str]): The words.
+            axes (tuple[np.ndarray, np.ndarray] | None, optional): (mean, axes) from `principal_axes`.
+                Defaults to the principal axes of the words themselves.
+
+        Returns:
+            np.ndarray: (len(words), n_components) coordinates, oriented so the first word has
+                positive coordinates (the sign of the axes is arbitrary otherwise).
+        """
+        mean, components = axes if axes is not None else self.principal_axes(words)
+        coords = (self.matrix(words) - mean) @ components.T
+        signs = np.where(coords[0] < 0, -1.0, 1.0)
+        return coords * signs
+
+
+def write_synthetic_embeddings(path: str | Path, vocab_size: int = 1000, dim: int = 32, seed: int = 0) -> Path:
+    """
+    Write a small synthetic vocabulary, used by the lecture scenes when no real embeddings are set.
+
+    «собачка» and «кицюня» are close, «добрий» is orthogonal to them and «злий» opposite to
+    «добрий»; the other words are random filler (`слово_0004`, ...).
+
+    Args:
+        path (str | Path): The `.npz` file to write.
+        vocab_size (int, optional): Number of words. Defaults to 1000.
+        dim (int, optional): Number of dimensions. Defaults to 32.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        Path: The written file.
+    """
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(0, 0.5, (vocab_size, dim)).astype(np.float32)
+    vectors[:4] *= 0.05  # little noise outside the plane of the demo words
+    vectors[:4, :2] = [[2.0, 1.0], [1.8, 1.2], [-1.1, 1.9], [1.1, -1.9]]
+    words = ["собачка", "кицюня", "добрий", "злий"] + [f"слово_{i:04d}" for i in range(4, vocab_size)]
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, vectors=vectors, words=np.array(words))  # uncompressed: can be memory-mapped
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Explore a word embeddings file")
+    parser.add_argument("file", nargs="?", default=str(EMBEDDINGS_FILE), help="The .npz/.npy file")
+    parser.add_argument("--nearest", "-n", metavar="WORD", help="Print the nearest neighbours of a word")
+    parser.add_argument("--k", type=int, default=10, help="Number of neighbours")
+    parser.add_argument("--synthetic", action="store_true", help="(Re)write the synthetic vocabulary to the file")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        print(f"✅ Synthetic embeddings written to {write_synthetic_embeddings(args.file)}")
+    store = EmbeddingStore(args.file)
+    print(f"📚 {store.path.name}: {len(store)} words, {store.dim} dimensions")
+    if args.nearest:
+        for word, score in store.nearest(args.nearest, k=args.k):
+            print(f"  {score:+.3f}  {word}")
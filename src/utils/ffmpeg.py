@@ -0,0 +1,78 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+from src.utils.config import MANIM_DOCKER_IMAGE
+
+# Encoder settings matching the ones manim uses for each container
+CODEC_ARGS = {
+    ".mp4": ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "23"],
+    ".mov": ["-c:v", "qtrle", "-pix_fmt", "argb"],  # manim's transparent output
+    ".webm": ["-c:v", "libvpx-vp9", "-pix_fmt", "yuva420p", "-b:v", "0", "-crf", "32"],
+}
+
+
+def get_ffmpeg_command(project_dir: Path, tool: str = "ffmpeg", image: str | None = MANIM_DOCKER_IMAGE) -> list[str]:
+    """
+    Return the command prefix to run ffmpeg/ffprobe.
+
+    The local binary is used when it is installed, otherwise the one shipped in the
+    render image (with the project mounted at /manim, so paths must be relative to it).
+    """
+    if shutil.which(tool):
+        return [tool]
+    return [
+        "docker", "run", "--rm",
+        "-v", f"{project_dir}:/manim", "-w", "/manim",
+        "--entrypoint", tool,
+        image or MANIM_DOCKER_IMAGE,  # None: the local backend, without ffmpeg on the host
+    ]
+
+
+def run_ffmpeg(
+    args: list[str], project_dir: Path, tool: str = "ffmpeg", image: str | None = MANIM_DOCKER_IMAGE
+) -> subprocess.CompletedProcess:
+    """Run ffmpeg/ffprobe from the project directory (paths in `args` are relative to it)"""
+    command = get_ffmpeg_command(project_dir, tool, image) + args
+    return subprocess.run(command, cwd=project_dir, capture_output=True, text=True)
+
+
+def to_project_path(path: Path, project_dir: Path) -> str:
+    """Path relative to the project directory, usable both locally and inside the render container"""
+    return Path(path).resolve().relative_to(project_dir.resolve()).as_posix()
+
+
+def transcode_video(
+    source: Path,
+    target: Path,
+    width: int,
+    height: int,
+    fps: int,
+    project_dir: Path,
+    image: str | None = MANIM_DOCKER_IMAGE,
+) -> subprocess.CompletedProcess:
+    """
+    Downscale and resample a rendered video into another quality.
+
+    Args:
+        source (Path): The rendered video (highest quality).
+        target (Path): Output path, its suffix selects the encoder settings.
+        width (int): Output width in pixels.
+        height (int): Output height in pixels.
+        fps (int): Output frame rate.
+        project_dir (Path): The project root (both files must be inside it).
+        image (str, optional): Render image used when ffmpeg is not installed locally.
+
+    Returns:
+        subprocess.CompletedProcess: The finished ffmpeg process.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    args = [
+        "-y", "-loglevel", "error",
+        "-i", to_project_path(source, project_dir),
+        "-vf", f"fps={fps},scale={width}:{height}:flags=lanczos",
+        *CODEC_ARGS.get(target.suffix, CODEC_ARGS[".mp4"]),
+        "-c:a", "copy",
+        to_project_path(target, project_dir),
+    ]
+    return run_ffmpeg(args, project_dir, image=image)
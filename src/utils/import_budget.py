@@ -0,0 +1,85 @@
+import re
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+
+from src.utils.config import BASE_DIR
+
+# Host-side CLI modules that must start fast
+CLI_MODULES = ["render"]
+
+# Import time budget for a single CLI module (cumulative, in milliseconds)
+DEFAULT_BUDGET_MS = 100.0
+
+# Modules that must never be imported by the host-side CLI at startup
+HEAVY_MODULES = {"manim", "numpy", "PIL", "cairosvg", "cairo", "scipy", "IPython"}
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_import_time(module: str, cwd: Path = BASE_DIR) -> tuple[float, list[tuple[str, float]]]:
+    """
+    Import `module` in a fresh interpreter with `-X importtime`.
+
+    Args:
+        module (str): The module to import (e.g. "render").
+        cwd (Path, optional): Working directory of the interpreter. Defaults to BASE_DIR.
+
+    Raises:
+        RuntimeError: If the module can't be imported.
+
+    Returns:
+        tuple[float, list[tuple[str, float]]]: Cumulative import time of the module in ms
+            and the list of all imported modules with their own (self) time in ms.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Cannot import '{module}':\n{result.stderr}")
+
+    total_ms = 0.0
+    imported = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _, name = match.groups()
+        imported.append((name, int(self_us) / 1000))
+        if name == module:
+            total_ms = int(cumulative_us) / 1000
+    return total_ms, imported
+
+
+def check_import_budget(modules: list[str] = CLI_MODULES, budget_ms: float = DEFAULT_BUDGET_MS) -> bool:
+    """Check that every CLI module imports within the budget and without heavy dependencies"""
+    ok = True
+    for module in modules:
+        total_ms, imported = measure_import_time(module)
+        heavy = sorted({name for name, _ in imported if name.split(".")[0] in HEAVY_MODULES})
+        slowest = sorted(imported, key=lambda item: item[1], reverse=True)[:5]
+
+        status = "✅" if total_ms <= budget_ms and not heavy else "❌"
+        print(f"{status} import {module}: {total_ms:.1f} ms (budget: {budget_ms:.0f} ms)")
+        for name, self_ms in slowest:
+            print(f"    {self_ms:7.1f} ms  {name}")
+
+        if heavy:
+            print(f"    heavy modules imported at startup: {', '.join(heavy)}")
+            ok = False
+        if total_ms > budget_ms:
+            ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the startup time of the host-side CLI")
+    parser.add_argument("modules", nargs="*", default=CLI_MODULES, help="Modules to check (default: render)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Import time budget per module")
+    args = parser.parse_args()
+
+    raise SystemExit(0 if check_import_budget(args.modules, args.budget_ms) else 1)
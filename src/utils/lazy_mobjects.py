@@ -0,0 +1,135 @@
+"""
+Lazy class-level mobjects, and a check for mobjects built when a scene module is imported.
+
+Run the check inside the render environment (it imports manim), e.g.:
+    python -m src.utils.lazy_mobjects src/animations_lectures/24_1.py
+"""
+import sys
+import inspect
+import argparse
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from manim import Mobject
+
+from src.utils.asset_cache import AssetCache
+from src.utils.manim_scenes_finder import get_all_scenes
+
+
+class LazyMobject:
+    """
+    Class-level mobject built on first access, once per scene instance.
+
+    A mobject assigned in a class body is built when the module is imported: by every
+    scene discovery, for every scene of the module, rendered or not, and shared (mutated)
+    by all the instances. Decorating a method that builds it instead defers the work to
+    the first access inside `construct` and caches the result on the instance.
+
+    Example:
+        >>> class MyScene(Scene):
+        ...     @LazyMobject
+        ...     def heading(self) -> Text:
+        ...         return Text("ChatGPT", font_size=52).to_edge(UL)
+    """
+
+    def __init__(self, factory: Callable[[Any], Mobject]):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None):
+        if instance is None:
+            return self
+        # stored in the instance dict, which shadows this (non-data) descriptor from now on
+        mobject = instance.__dict__[self.name] = self.factory(instance)
+        return mobject
+
+
+def _import_time_line(path: Path) -> int | None:
+    """Line of the module-level or class-level statement of `path` being executed, if any"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        # module and class bodies are the only code objects not compiled as functions
+        if not code.co_flags & inspect.CO_OPTIMIZED and Path(code.co_filename).resolve() == path:
+            return frame.f_lineno
+        frame = frame.f_back
+    return None
+
+
+def find_eager_mobjects(file_name: str | Path) -> dict[int, str]:
+    """
+    Import a scene module and report the mobjects built by its module-level and class-level code.
+
+    Constructions and copies (cached mobjects are copies) made from the importing thread are
+    recorded, and so are `AssetCache.preload` calls (they parse the assets in background threads).
+
+    Args:
+        file_name (str | Path): The scene module.
+
+    Returns:
+        dict[int, str]: Line number -> type of the (outermost) mobject built on that line.
+    """
+    from src.utils.scene_probe import load_module
+
+    path = Path(file_name).resolve()
+    found: dict[int, str] = {}
+    main_thread = threading.current_thread()
+    state = threading.local()
+
+    def record(mobject: Mobject) -> None:
+        if threading.current_thread() is main_thread and not getattr(state, "depth", 0):
+            line = _import_time_line(path)
+            if line is not None:
+                found.setdefault(line, type(mobject).__name__)
+
+    def tracked(method: Callable) -> Callable:
+        def wrapper(self, *args, **kwargs):
+            record(self)
+            state.depth = getattr(state, "depth", 0) + 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                state.depth -= 1
+
+        return wrapper
+
+    def tracked_preload(self, *names, **kwargs):
+        line = _import_time_line(path)
+        if line is not None:
+            found.setdefault(line, "AssetCache.preload")
+        return original_preload(self, *names, **kwargs)
+
+    original_init, original_copy, original_preload = Mobject.__init__, Mobject.copy, AssetCache.preload
+    Mobject.__init__, Mobject.copy = tracked(original_init), tracked(original_copy)
+    AssetCache.preload = tracked_preload
+    try:
+        load_module(path)
+    finally:
+        Mobject.__init__, Mobject.copy = original_init, original_copy
+        AssetCache.preload = original_preload
+    return found
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flag mobjects built when scene modules are imported")
+    parser.add_argument("files", nargs="*", help="Scene modules (default: every module defining a scene)")
+    args = parser.parse_args()
+
+    files = [Path(file) for file in args.files] or sorted(
+        {Path(module_path.split("#")[0]) for module_path, _ in get_all_scenes()}
+    )
+    clean = True
+    for file in files:
+        source_lines = file.read_text(encoding="utf-8").splitlines()
+        for line, type_name in sorted(find_eager_mobjects(file).items()):
+            clean = False
+            advice = "called at import time, call it from the scene's setup" if type_name == "AssetCache.preload" else "built at import time, use LazyMobject"
+            print(f"{file}:{line}: {type_name} {advice}: {source_lines[line - 1].strip()}")
+    if clean:
+        print("✅ No mobject is built at import time")
+    raise SystemExit(0 if clean else 1)
@@ -0,0 +1,231 @@
+"""
+Lecture manifests and their lossless assembly into one video.
+
+A lecture is described by a TOML file next to its script in `src/animations_lectures/`
+(`24.toml` for `24.md`): a title and the scenes in playback order, one chapter each.
+The rendered scenes are joined with ffmpeg's concat demuxer and stream copy (no
+re-encoding), so they must share their encoding parameters, which is checked first.
+"""
+import os
+import json
+import tomllib
+from pathlib import Path
+
+from src.utils.config import CACHE_DIR, LECTURE_ANIMATIONS_DIR, LECTURES_OUTPUT_DIR, MANIM_DOCKER_IMAGE
+from src.utils.ffmpeg import run_ffmpeg, to_project_path
+
+LECTURES_WORK_DIR = CACHE_DIR / "lectures"
+
+# Stream parameters that must be equal for a stream copy concatenation
+VIDEO_PARAMETERS = ("codec_name", "profile", "width", "height", "pix_fmt", "r_frame_rate", "time_base")
+AUDIO_PARAMETERS = ("codec_name", "sample_rate", "channels")
+
+
+class LectureError(RuntimeError):
+    """Raised for an invalid manifest or scenes that cannot be joined without re-encoding"""
+
+
+class Lecture:
+    """A lecture manifest: its title and its (scene, chapter title) pairs in playback order"""
+
+    def __init__(self, lecture_id: str, path: Path, title: str, chapters: list[tuple[str, str]]):
+        self.id = lecture_id
+        self.path = path
+        self.title = title
+        self.chapters = chapters
+
+    @property
+    def scenes(self) -> list[str]:
+        return [scene for scene, _ in self.chapters]
+
+
+def lecture_ids(lectures_dir: Path = LECTURE_ANIMATIONS_DIR) -> list[str]:
+    return sorted(path.stem for path in lectures_dir.glob("*.toml"))
+
+
+def load_lecture(lecture_id: str, lectures_dir: Path = LECTURE_ANIMATIONS_DIR) -> Lecture:
+    """
+    Read the manifest of a lecture.
+
+    Args:
+        lecture_id (str): The manifest name without extension (e.g. "24").
+        lectures_dir (Path, optional): Where the manifests are. Defaults to LECTURE_ANIMATIONS_DIR.
+
+    Raises:
+        LectureError: If the manifest does not exist or has no chapters.
+
+    Returns:
+        Lecture: The parsed manifest.
+    """
+    path = lectures_dir / f"{lecture_id}.toml"
+    if not path.exists():
+        known = ", ".join(lecture_ids(lectures_dir)) or "none"
+        raise LectureError(f"No lecture manifest {path.name} (available: {known})")
+    with open(path, "rb") as file:
+        manifest = tomllib.load(file)
+
+    chapters = []
+    for chapter in manifest.get("chapters", []):
+        if "scene" not in chapter:
+            raise LectureError(f"{path.name}: every [[chapters]] entry needs a `scene`")
+        chapters.append((chapter["scene"], chapter.get("title", chapter["scene"])))
+    if not chapters:
+        raise LectureError(f"{path.name} has no [[chapters]]")
+    return Lecture(lecture_id, path, manifest.get("title", lecture_id), chapters)
+
+
+def lecture_output_path(lecture: Lecture, quality_folder: str, suffix: str = ".mp4") -> Path:
+    """`media/lectures/<quality>/<id>.mp4`, like manim's `media/videos/<module>/<quality>/`"""
+    return LECTURES_OUTPUT_DIR / quality_folder / f"{lecture.id}{suffix}"
+
+
+def probe_video(video: Path, project_dir: Path, image: str | None = MANIM_DOCKER_IMAGE) -> dict:
+    """
+    Read the stream parameters and the duration of a video with ffprobe.
+
+    Returns:
+        dict: {"duration": seconds, "video": {...}, "audio": {...} or None}.
+    """
+    result = run_ffmpeg(
+        [
+            "-v", "error",
+            "-show_entries", f"stream=codec_type,{','.join(sorted(set(VIDEO_PARAMETERS + AUDIO_PARAMETERS)))}:format=duration",
+            "-of", "json",
+            to_project_path(video, project_dir),
+        ],
+        project_dir,
+        tool="ffprobe",
+        image=image,
+    )
+    if result.returncode != 0:
+        raise LectureError(f"Cannot probe {video}: {result.stderr.strip()[-500:]}")
+    info = json.loads(result.stdout)
+    streams = info.get("streams", [])
+    video_stream = next((stream for stream in streams if stream.get("codec_type") == "video"), None)
+    audio_stream = next((stream for stream in streams if stream.get("codec_type") == "audio"), None)
+    if video_stream is None:
+        raise LectureError(f"{video} has no video stream")
+    return {
+        "duration": float(info["format"]["duration"]),
+        "video": {key: video_stream.get(key) for key in VIDEO_PARAMETERS},
+        "audio": {key: audio_stream.get(key) for key in AUDIO_PARAMETERS} if audio_stream else None,
+    }
+
+
+def check_compatible(probes: dict[str, dict]) -> None:
+    """
+    Check that the scenes can be concatenated with stream copy.
+
+    Args:
+        probes (dict[str, dict]): Scene name -> `probe_video` result, in playback order.
+
+    Raises:
+        LectureError: Listing every parameter that differs from the first scene's.
+    """
+    (first_scene, first), *others = probes.items()
+    problems = []
+    for scene, probe in others:
+        for key in VIDEO_PARAMETERS:
+            if probe["video"][key] != first["video"][key]:
+                problems.append(f"{scene}: video {key} {probe['video'][key]} != {first['video'][key]} ({first_scene})")
+        if (probe["audio"] is None) != (first["audio"] is None):
+            problems.append(f"{scene}: audio track {'present' if probe['audio'] else 'missing'}, unlike {first_scene}")
+        elif probe["audio"] is not None:
+            for key in AUDIO_PARAMETERS:
+                if probe["audio"][key] != first["audio"][key]:
+                    problems.append(f"{scene}: audio {key} {probe['audio'][key]} != {first['audio'][key]} ({first_scene})")
+    if problems:
+        raise LectureError(
+            "Scenes cannot be joined without re-encoding (render them with the same quality and flags):\n  "
+            + "\n  ".join(problems)
+        )
+
+
+def _escape_metadata(value: str) -> str:
+    """Escape a value of an FFMETADATA file"""
+    for char in ("\\", "=", ";", "#", "\n"):
+        value = value.replace(char, "\\" + char)
+    return value
+
+
+def chapters_metadata(title: str, chapters: list[tuple[str, float]]) -> str:
+    """
+    An FFMETADATA file with the title and one chapter per (chapter title, duration).
+
+    Returns:
+        str: The file content (chapter times in milliseconds).
+    """
+    lines = [";FFMETADATA1", f"title={_escape_metadata(title)}"]
+    start = 0
+    elapsed = 0.0
+    for chapter_title, duration in chapters:
+        elapsed += duration
+        end = round(elapsed * 1000)
+        lines += ["", "[CHAPTER]", "TIMEBASE=1/1000", f"START={start}", f"END={end}", f"title={_escape_metadata(chapter_title)}"]
+        start = end
+    return "\n".join(lines) + "\n"
+
+
+def assemble_lecture(
+    lecture: Lecture,
+    videos: dict[str, Path],
+    output_path: Path,
+    project_dir: Path,
+    image: str | None = MANIM_DOCKER_IMAGE,
+) -> Path:
+    """
+    Join the rendered scenes of a lecture without re-encoding, with a chapter per scene.
+
+    Args:
+        lecture (Lecture): The lecture manifest.
+        videos (dict[str, Path]): Scene name -> its rendered video, for every scene of the lecture.
+        output_path (Path): The lecture video (its suffix is taken from the scene videos).
+        project_dir (Path): The project root (all the files must be inside it).
+        image (str | None, optional): Render image used when ffmpeg is not installed locally.
+
+    Raises:
+        LectureError: If the scenes cannot be joined with stream copy, or ffmpeg fails.
+
+    Returns:
+        Path: The lecture video.
+    """
+    scene_videos = [videos[scene] for scene in lecture.scenes]
+    suffixes = {video.suffix for video in scene_videos}
+    if len(suffixes) > 1:
+        raise LectureError(f"Scenes rendered to different containers ({', '.join(sorted(suffixes))})")
+
+    probes = {scene: probe_video(videos[scene], project_dir, image) for scene in lecture.scenes}
+    check_compatible(probes)
+
+    work_dir = LECTURES_WORK_DIR / lecture.id
+    work_dir.mkdir(parents=True, exist_ok=True)
+    # paths in a concat list are relative to the list file
+    list_file = work_dir / "concat.txt"
+    list_file.write_text(
+        "".join(f"file '{Path(os.path.relpath(Path(video).resolve(), work_dir.resolve())).as_posix()}'\n" for video in scene_videos),
+        encoding="utf-8",
+    )
+    metadata_file = work_dir / "chapters.txt"
+    metadata_file.write_text(
+        chapters_metadata(lecture.title, [(title, probes[scene]["duration"]) for scene, title in lecture.chapters]),
+        encoding="utf-8",
+    )
+
+    output_path = output_path.with_suffix(suffixes.pop())
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    result = run_ffmpeg(
+        [
+            "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0",
+            "-i", to_project_path(list_file, project_dir),
+            "-i", to_project_path(metadata_file, project_dir),
+            "-map", "0", "-map_metadata", "1", "-map_chapters", "1",
+            "-c", "copy",
+            to_project_path(output_path, project_dir),
+        ],
+        project_dir,
+        image=image,
+    )
+    if result.returncode != 0:
+        raise LectureError(f"Concatenation of lecture {lecture.id} failed:\n{result.stderr[-2000:]}")
+    return output_path
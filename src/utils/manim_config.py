@@ -1,15 +1,34 @@
 from manim import TexTemplate, Scene, NumberPlane
 
-UkrainianTexTemplate = TexTemplate(
-    tex_compiler="xelatex",
-    description="Ukrainian TeX Template",
-    preamble=r"""
+from src.utils.config import TEX_FORMATS_DIR, UKRAINIAN_TEX_FORMAT
+
+TEX_DOCUMENTCLASS = r"\documentclass[preview]{standalone}"
+
+# Everything before `\endofdump` is precompiled into a TeX format in the prewarmed
+# Docker image (fonts can't be dumped by XeTeX, so they are selected after it).
+# Without the format `\csname endofdump\endcsname` is just `\relax`.
+UKRAINIAN_TEX_PREAMBLE = r"""
     \usepackage{fontspec}
     \usepackage{babel}
+    \usepackage{amsmath, amssymb}
+    \csname endofdump\endcsname
     \babelprovide[import, main]{ukrainian}
     \setmainfont{DejaVu Serif}
-    \usepackage{amsmath, amssymb}
-    """,
+    """
+
+
+def _ukrainian_documentclass() -> str:
+    """Use the precompiled preamble format (`%&format` first line) when it is available"""
+    if TEX_FORMATS_DIR is not None and (TEX_FORMATS_DIR / f"{UKRAINIAN_TEX_FORMAT}.fmt").exists():
+        return f"%&{UKRAINIAN_TEX_FORMAT}\n{TEX_DOCUMENTCLASS}"
+    return TEX_DOCUMENTCLASS
+
+
+UkrainianTexTemplate = TexTemplate(
+    tex_compiler="xelatex",
+    description="Ukrainian TeX Template",
+    documentclass=_ukrainian_documentclass(),
+    preamble=UKRAINIAN_TEX_PREAMBLE,
     output_format=".xdv",
 )
 
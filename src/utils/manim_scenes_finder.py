@@ -1,8 +1,6 @@
 import os
-import sys
-import inspect
+import ast
 from pathlib import Path
-from manim import Scene
 
 from src.utils.config import SOURCES_DIR
 
@@ -18,40 +16,66 @@ BUILTIN_SCENES = {
 }
 
 
+def _base_name(base: ast.expr) -> str | None:
+    """Return the class name of a base expression (`Scene`, `manim.Scene`, ...)"""
+    if isinstance(base, ast.Name):
+        return base.id
+    if isinstance(base, ast.Attribute):
+        return base.attr
+    return None
+
+
+def _iter_source_files(sources_dir: Path = SOURCES_DIR):
+    for root, _, files in os.walk(sources_dir):
+        for file in sorted(files):
+            if file.endswith(".py"):
+                yield Path(root) / file
+
+
+def _collect_classes(sources_dir: Path = SOURCES_DIR) -> list[tuple[Path, ast.ClassDef]]:
+    """Parse every project module and collect its top-level class definitions"""
+    classes = []
+    for module_path in _iter_source_files(sources_dir):
+        try:
+            tree = ast.parse(module_path.read_text(encoding="utf-8"), filename=str(module_path))
+        except (SyntaxError, UnicodeDecodeError) as e:
+            print(f"Error parsing {module_path}: {e}")
+            continue
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes.append((module_path, node))
+    return classes
+
+
 def get_all_scenes() -> list[tuple[str, str]]:
     """
-    Get only custom scene classes, excluding built-in Manim classes
+    Get only custom scene classes, excluding built-in Manim classes.
+
+    Scenes are found statically (no module is imported, so neither is manim):
+    a class is a scene if one of its bases is a built-in Manim scene or
+    another scene class defined in the project.
 
     Returns:
         list[tuple[str, str]]: List of tuples containing (module_path#line_number, class_name)
     """
-    scenes = []
+    classes = _collect_classes()
 
-    # Add SOURCES_DIR to sys.path
-    sys.path.append(str(SOURCES_DIR))
+    scene_names = set(BUILTIN_SCENES)
+    changed = True
+    while changed:  # propagate through project-level scene base classes
+        changed = False
+        for _, node in classes:
+            if node.name in scene_names:
+                continue
+            if any(_base_name(base) in scene_names for base in node.bases):
+                scene_names.add(node.name)
+                changed = True
 
-    for root, _, files in os.walk(SOURCES_DIR):
-        for file in files:
-            if file.endswith(".py"):
-                module_path = Path(root) / file
-                # Convert the path to a module name (e.g., src.animations_lectures.24_1)
-                relative_module = module_path.relative_to(SOURCES_DIR).with_suffix("")
-                module_name = ".".join(relative_module.parts)
-                try:
-                    module = __import__(module_name, fromlist=["*"])
-                    for name, obj in inspect.getmembers(module, inspect.isclass):
-                        # Check if it's a Scene subclass but not a built-in one
-                        if (
-                            issubclass(obj, Scene)
-                            and obj is not Scene
-                            and name not in BUILTIN_SCENES
-                            and obj.__module__ == module_name
-                        ):  # Only classes defined in this module
-                            # Get line number where the class is defined
-                            _, line_number = inspect.getsourcelines(obj)
-                            scenes.append((f"{str(module_path.resolve())}#{line_number}", name))
-                except Exception as e:
-                    print(f"Error importing {module_path}: {e}")
+    scenes = []
+    for module_path, node in classes:
+        if node.name in scene_names and node.name not in BUILTIN_SCENES:
+            line_number = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+            scenes.append((f"{str(module_path.resolve())}#{line_number}", node.name))
     return scenes
 
 
@@ -74,3 +98,20 @@ def find_scene_by_name(scene_name: str) -> tuple[str, str] | tuple[None, None]:
         if class_name == scene_name:
             return module_path, class_name
     return None, None
+
+
+def scene_media_name(module_path: str) -> str:
+    """
+    The folder manim puts a scene's media in (`media/videos/<name>/`, `media/images/<name>/`):
+    the stem of its source file.
+
+    Args:
+        module_path (str): The module path of the scene, as returned by `find_scene_by_name`
+            (a source path without suffix), or a dotted module name.
+
+    Returns:
+        str: The folder name (e.g. "24_1").
+    """
+    if "/" in module_path or os.sep in module_path:
+        return Path(module_path).name
+    return module_path.split(".")[-1]
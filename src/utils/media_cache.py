@@ -0,0 +1,280 @@
+"""
+Size budget for the `media/` and `.cache/` trees: usage per category and least recently
+used eviction.
+
+    python render.py cache stats
+    python render.py cache prune --max-size 20G [--dry-run]
+
+Never evicted:
+    - the partial movie files of the last render of every scene and quality (the cache keys
+      listed in its `partial_movie_file_list.txt`): an unchanged animation is not re-rendered
+    - the streaming packages that are up to date with their source video
+    - the videos of the scenes of the lecture manifests, and the assembled lectures
+    - the render queue (resumable batches and render history) and the startup timings
+
+In `.cache/`, the laid out texts, section checkpoints and leftover work files (parallel
+ranges, streaming renditions, contact sheet frames, alpha encodes, lecture concat lists)
+are evicted like the media files: all of them are rebuilt on demand.
+
+The rest goes oldest access first (access time, or modification time where the file
+system does not record accesses). Streaming packages are evicted as a whole.
+"""
+import re
+import json
+import shutil
+import argparse
+from pathlib import Path
+
+from src.utils.config import BASE_DIR, CACHE_DIR, MEDIA_DIR
+from src.utils.lectures import LectureError, lecture_ids, load_lecture
+from src.utils.streaming import PACKAGE_FILE, is_packaged, package_key
+
+PARTIAL_MOVIES_DIR = "partial_movie_files"
+PARTIAL_MOVIE_LIST = "partial_movie_file_list.txt"
+
+CATEGORIES = (
+    "videos", "partial movies", "images", "tex", "texts", "streaming", "lectures", "other",
+    "text layouts", "checkpoints", "work files", "other cache",
+)
+_TOP_LEVEL_CATEGORIES = {"videos": "videos", "images": "images", "Tex": "tex", "texts": "texts", "streaming": "streaming", "lectures": "lectures"}
+# .cache/<folder> -> category (the other files of .cache/ are "other cache")
+_CACHE_CATEGORIES = {
+    "texts": "text layouts",
+    "checkpoints": "checkpoints",
+    "parallel": "work files",
+    "streaming": "work files",
+    "contact_sheets": "work files",
+    "alpha": "work files",
+    "lectures": "work files",
+}
+# .cache/ files that are state rather than cache: the render queue (and its SQLite journals)
+_PROTECTED_CACHE_FILES = ("render_queue.sqlite3*", "startup_times.json")
+
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_size(value: str) -> int:
+    """`500M`, `20G`, `1.5GB`, `1048576` -> bytes"""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?)I?B?\s*", value.upper())
+    if not match:
+        raise ValueError(f"Invalid size: {value} (e.g. 500M, 20G)")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class CacheEntry:
+    """A unit of eviction: a file, or a whole streaming package"""
+
+    def __init__(self, path: Path, category: str, size: int, last_access: float, protected: bool = False):
+        self.path = path
+        self.category = category
+        self.size = size
+        self.last_access = last_access
+        self.protected = protected
+
+
+def _category(path: Path, media_dir: Path) -> str:
+    parts = path.relative_to(media_dir).parts
+    if PARTIAL_MOVIES_DIR in parts:
+        return "partial movies"
+    return _TOP_LEVEL_CATEGORIES.get(parts[0], "other") if len(parts) > 1 else "other"
+
+
+def _cache_category(path: Path, cache_dir: Path) -> str:
+    parts = path.relative_to(cache_dir).parts
+    return _CACHE_CATEGORIES.get(parts[0], "other cache") if len(parts) > 1 else "other cache"
+
+
+def _last_access(stat) -> float:
+    # with noatime/relatime mounts the access time lags, a write is an access too
+    return max(stat.st_atime, stat.st_mtime)
+
+
+def _current_partial_movies(media_dir: Path) -> set[Path]:
+    """The partial movie files the last render of every scene was combined from"""
+    current = set()
+    for file_list in media_dir.glob(f"videos/*/*/{PARTIAL_MOVIES_DIR}/*/{PARTIAL_MOVIE_LIST}"):
+        current.add(file_list)
+        for line in file_list.read_text(encoding="utf-8").splitlines():
+            match = re.fullmatch(r"file '(?:file:)?(.+)'", line.strip())
+            if match:
+                # written inside the render container (/manim/...): match by name in the same folder
+                current.add(file_list.parent / Path(match.group(1)).name)
+    return current
+
+
+def _lecture_files(media_dir: Path) -> set[Path]:
+    """Videos of the scenes of the lecture manifests, and the assembled lectures"""
+    protected = set()
+    for lecture_id in lecture_ids():
+        try:
+            lecture = load_lecture(lecture_id)
+        except LectureError:
+            continue
+        for scene in lecture.scenes:
+            protected.update(media_dir.glob(f"videos/*/*/{scene}.*"))
+        protected.update(media_dir.glob(f"lectures/*/{lecture.id}.*"))
+    return protected
+
+
+def _current_packages(media_dir: Path) -> set[Path]:
+    """Streaming packages up to date with their source video"""
+    current = set()
+    for package_file in media_dir.glob(f"streaming/**/{PACKAGE_FILE}"):
+        source = BASE_DIR / json.loads(package_file.read_text(encoding="utf-8")).get("source", "")
+        if source.is_file() and is_packaged(package_file.parent, package_key(source)):
+            current.add(package_file.parent)
+    return current
+
+
+def scan(media_dir: Path = MEDIA_DIR, cache_dir: Path = CACHE_DIR) -> list[CacheEntry]:
+    """
+    List the eviction units of the media and cache trees.
+
+    Args:
+        media_dir (Path, optional): The media directory. Defaults to MEDIA_DIR.
+        cache_dir (Path, optional): The cache directory. Defaults to CACHE_DIR.
+
+    Returns:
+        list[CacheEntry]: Files and streaming packages, with their category and protection.
+    """
+    entries = _scan_cache(cache_dir) if cache_dir.exists() else []
+    if not media_dir.exists():
+        return entries
+    protected_files = _current_partial_movies(media_dir) | _lecture_files(media_dir)
+    current_packages = _current_packages(media_dir)
+    packages = {package_file.parent for package_file in media_dir.glob(f"streaming/**/{PACKAGE_FILE}")}
+    package_entries: dict[Path, CacheEntry] = {}
+    for path in media_dir.rglob("*"):
+        if not path.is_file():
+            continue
+        stat = path.stat()
+        package = next((parent for parent in path.parents if parent in packages), None)
+        if package is not None:
+            entry = package_entries.get(package)
+            if entry is None:
+                entry = package_entries[package] = CacheEntry(package, "streaming", 0, 0.0, package in current_packages)
+                entries.append(entry)
+            entry.size += stat.st_size
+            entry.last_access = max(entry.last_access, _last_access(stat))
+            continue
+        entries.append(CacheEntry(path, _category(path, media_dir), stat.st_size, _last_access(stat), path in protected_files))
+    return entries
+
+
+def _scan_cache(cache_dir: Path) -> list[CacheEntry]:
+    protected = {path for pattern in _PROTECTED_CACHE_FILES for path in cache_dir.glob(pattern)}
+    entries = []
+    for path in cache_dir.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            entries.append(CacheEntry(path, _cache_category(path, cache_dir), stat.st_size, _last_access(stat), path in protected))
+    return entries
+
+
+def stats(entries: list[CacheEntry]) -> dict[str, dict[str, int]]:
+    """Per category: bytes, protected bytes and number of entries"""
+    totals = {category: {"size": 0, "protected": 0, "entries": 0} for category in CATEGORIES}
+    for entry in entries:
+        total = totals[entry.category]
+        total["size"] += entry.size
+        total["entries"] += 1
+        if entry.protected:
+            total["protected"] += entry.size
+    return totals
+
+
+def prune(
+    entries: list[CacheEntry],
+    max_size: int,
+    dry_run: bool = False,
+    media_dir: Path = MEDIA_DIR,
+    cache_dir: Path = CACHE_DIR,
+) -> dict[str, int]:
+    """
+    Evict unprotected entries, least recently used first, until the trees fit in `max_size`.
+
+    Args:
+        entries (list[CacheEntry]): The media and cache trees (see `scan`).
+        max_size (int): Size budget in bytes.
+        dry_run (bool, optional): Only report what would be evicted. Defaults to False.
+        media_dir (Path, optional): The media directory (empty folders are removed). Defaults to MEDIA_DIR.
+        cache_dir (Path, optional): The cache directory (empty folders are removed). Defaults to CACHE_DIR.
+
+    Returns:
+        dict[str, int]: Reclaimed bytes per category.
+    """
+    reclaimed = dict.fromkeys(CATEGORIES, 0)
+    total = sum(entry.size for entry in entries)
+    for entry in sorted((entry for entry in entries if not entry.protected), key=lambda entry: entry.last_access):
+        if total <= max_size:
+            break
+        if not dry_run:
+            if entry.path.is_dir():
+                shutil.rmtree(entry.path)
+            else:
+                entry.path.unlink(missing_ok=True)
+        total -= entry.size
+        reclaimed[entry.category] += entry.size
+
+    if not dry_run:
+        directories = [path for root in (media_dir, cache_dir) if root.exists() for path in root.rglob("*") if path.is_dir()]
+        for directory in sorted(directories, key=lambda path: -len(path.parts)):
+            if not any(directory.iterdir()):
+                directory.rmdir()
+    return reclaimed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="render.py cache", description="Manage the size of the media and cache directories")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="Usage per category")
+    prune_parser = commands.add_parser("prune", help="Evict the least recently used files down to a size budget")
+    prune_parser.add_argument("--max-size", required=True, help="Size budget of media/ and .cache/ together (e.g. 20G, 500M)")
+    prune_parser.add_argument("--dry-run", action="store_true", help="Only report what would be evicted")
+    args = parser.parse_args(argv)
+
+    entries = scan()
+    totals = stats(entries)
+    total = sum(category["size"] for category in totals.values())
+    if args.command == "stats":
+        print(f"📦 {MEDIA_DIR.name}/ and {CACHE_DIR.name}/: {format_size(total)}")
+        for name, category in totals.items():
+            if category["entries"]:
+                print(
+                    f"  {name:<15} {format_size(category['size']):>10}  ({category['entries']} entries, "
+                    f"{format_size(category['protected'])} protected)"
+                )
+        return 0
+
+    try:
+        max_size = parse_size(args.max_size)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    if total <= max_size:
+        print(f"✅ {MEDIA_DIR.name}/ and {CACHE_DIR.name}/ use {format_size(total)}, within {format_size(max_size)}")
+        return 0
+
+    reclaimed = prune(entries, max_size, args.dry_run)
+    freed = sum(reclaimed.values())
+    verb = "Would reclaim" if args.dry_run else "Reclaimed"
+    print(f"🧹 {verb} {format_size(freed)} ({format_size(total)} -> {format_size(total - freed)}, budget {format_size(max_size)})")
+    for name, size in reclaimed.items():
+        if size:
+            print(f"  {name:<15} {format_size(size):>10}")
+    if total - freed > max_size:
+        protected = sum(category["protected"] for category in totals.values())
+        print(f"⚠️  Still over budget: {format_size(protected)} is protected (current renders, packages, lectures and the render queue)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
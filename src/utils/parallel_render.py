@@ -0,0 +1,237 @@
+import os
+import json
+import time
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.config import CACHE_DIR
+from src.utils.ffmpeg import run_ffmpeg, to_project_path
+from src.utils.render_backend import render_command, render_env
+from src.utils.render_process import run_render_process
+
+PARALLEL_DIR = CACHE_DIR / "parallel"
+PROBE_ERROR_LINES = 40  # output lines of a failed probe kept for the error message
+
+
+class ReplayMismatchError(RuntimeError):
+    """Raised when a worker's replay of `construct` diverges from the reference run"""
+
+
+def split_ranges(durations: list[float], workers: int) -> list[tuple[int, int]]:
+    """
+    Split the plays of a scene into contiguous ranges of about equal run time.
+
+    Args:
+        durations (list[float]): Run time of every play (waits included).
+        workers (int): Number of ranges wanted.
+
+    Returns:
+        list[tuple[int, int]]: Inclusive (start, end) play indices of every range.
+    """
+    n = len(durations)
+    workers = max(1, min(workers, n))
+    weights = [max(d, 1e-3) for d in durations]
+    total = sum(weights)
+
+    ranges = []
+    start = 0
+    acc = 0.0
+    for i, weight in enumerate(weights):
+        acc += weight
+        cuts_left = workers - len(ranges) - 1
+        if cuts_left > 0 and acc >= total * (len(ranges) + 1) / workers and n - (i + 1) >= cuts_left:
+            ranges.append((start, i))
+            start = i + 1
+    ranges.append((start, n - 1))
+    return ranges
+
+
+def _run_probe(
+    project_dir: Path,
+    image: str | None,
+    file_name: str,
+    class_name: str,
+    result_path: Path,
+    args: list[str],
+    container_name: str | None = None,
+    deadline: float | None = None,
+    cancel_event: threading.Event | None = None,
+    output: Callable[[str], None] | None = None,
+) -> dict:
+    """
+    Run the scene probe in the render environment and return its JSON result
+    (killed at `deadline` or when `cancel_event` is set, see `run_render_process`)
+    """
+    command = render_command(
+        project_dir,
+        image,
+        ["python", "-m", "src.utils.scene_probe", file_name, class_name,
+         "--result", to_project_path(result_path, project_dir), *args],
+        name=container_name,
+    )
+    tail = deque(maxlen=PROBE_ERROR_LINES)
+
+    def on_line(line: str) -> None:
+        tail.append(line)
+        if output is not None:
+            output(line)
+
+    exit_code = run_render_process(
+        command,
+        container_name if image else None,
+        max(deadline - time.monotonic(), 1.0) if deadline is not None else None,
+        cancel_event,
+        env=render_env(project_dir, image),
+        cwd=str(project_dir),
+        output=on_line,
+    )
+    if exit_code != 0:
+        raise RuntimeError(f"Scene probe failed ({' '.join(args)}):\n" + "\n".join(tail))
+    return json.loads(result_path.read_text(encoding="utf-8"))
+
+
+def _check_replay(reference: list[str], part: list[str], start: int, end: int) -> None:
+    """Every worker replays plays 0..end, their states must match the reference run"""
+    expected = reference[: end + 1]
+    if part == expected:
+        return
+    for i, (a, b) in enumerate(zip(part, expected)):
+        if a != b:
+            raise ReplayMismatchError(
+                f"Worker for plays {start}-{end} diverged from the reference run at play {i}. "
+                "The scene is not deterministic (random numbers, time-based updaters, ...), render it serially."
+            )
+    raise ReplayMismatchError(
+        f"Worker for plays {start}-{end} ran {len(part)} plays, expected {len(expected)}."
+    )
+
+
+def render_in_ranges(
+    file_name: str,
+    class_name: str,
+    quality: str,
+    output_path: Path,
+    project_dir: Path,
+    image: str | None,
+    workers: int = os.cpu_count() or 2,
+    transparent: bool = False,
+    timeout: float | None = None,
+    cancel_event: threading.Event | None = None,
+    container_name: str | None = None,
+    output: Callable[[str], None] | None = None,
+) -> Path:
+    """
+    Render one scene with several workers, each rendering a contiguous range of plays.
+
+    A reference run replays `construct` without producing frames to count the plays and
+    fingerprint the scene state after each of them. Every worker replays `construct`
+    skipping the frames up to its range, renders the range and must reproduce the same
+    fingerprints; the partial movies are then concatenated without re-encoding. The workers
+    share the project's TeX and Text caches, only their movies go to a folder of their own.
+
+    Args:
+        file_name (str): Scene source file, relative to the project root.
+        class_name (str): Scene class name.
+        quality (str): Quality flag (e.g. "qh").
+        output_path (Path): Final movie path (the suffix is taken from the partial movies).
+        project_dir (Path): The project root.
+        image (str | None): The render image, None for the local backend.
+        workers (int, optional): Number of parallel workers. Defaults to the CPU count.
+        transparent (bool, optional): Render with alpha channel. Defaults to False.
+        timeout (float | None, optional): Time limit of the whole render in seconds. Defaults to None.
+        cancel_event (threading.Event | None, optional): Set it to stop the render. Defaults to None.
+        container_name (str | None, optional): Prefix of the names of the render containers
+            (Docker only), killed on timeout/cancel. Defaults to None.
+        output (Callable[[str], None] | None, optional): Receives the output lines of the
+            workers (see `run_render_process`). Defaults to None.
+
+    Raises:
+        ReplayMismatchError: If a worker's replay is not identical to the reference run.
+        RenderTimeoutError: If the render exceeds the timeout.
+        RenderCancelledError: If the cancel event is set.
+        RuntimeError: If a worker or the concatenation fails.
+
+    Returns:
+        Path: The concatenated movie.
+    """
+    work_dir = PARALLEL_DIR / class_name
+    shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    flags = [f"-{quality}"] + (["-t"] if transparent else [])
+    deadline = time.monotonic() + timeout if timeout else None
+
+    def probe(result_path: Path, args: list[str], name: str) -> dict:
+        return _run_probe(
+            project_dir, image, file_name, class_name, result_path, args,
+            container_name=f"{container_name}-{name}" if container_name else None,
+            deadline=deadline,
+            cancel_event=cancel_event,
+            output=output,
+        )
+
+    start_time = time.perf_counter()
+    reference = probe(work_dir / "reference.json", ["--count", *flags], "reference")
+    num_plays = len(reference["fingerprints"])
+    if num_plays == 0:
+        raise RuntimeError(f"Scene {class_name} has no animations")
+
+    ranges = split_ranges(reference["durations"], workers)
+    print(
+        f"🔀 {class_name}: {num_plays} plays ({sum(reference['durations']):.1f}s of animation) "
+        f"split into {len(ranges)} ranges: {', '.join(f'{a}-{b}' for a, b in ranges)} "
+        f"(reference replay took {time.perf_counter() - start_time:.1f}s)"
+    )
+
+    def render_part(index: int) -> dict:
+        start, end = ranges[index]
+        part_dir = work_dir / f"part_{index:03d}"
+        return probe(
+            part_dir / "result.json",
+            [
+                "--range", f"{start},{end}",
+                "--video-dir", to_project_path(part_dir / "videos", project_dir),
+                "--output-file", f"{class_name}_part_{index:03d}",
+                *flags,
+            ],
+            f"part{index:03d}",
+        )
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+        parts = list(pool.map(render_part, range(len(ranges))))
+
+    for (start, end), part in zip(ranges, parts):
+        _check_replay(reference["fingerprints"], part["fingerprints"], start, end)
+        if not part["movie"]:
+            raise RuntimeError(f"Worker for plays {start}-{end} produced no movie")
+
+    movies = [project_dir / part["movie"] for part in parts]
+    output_path = output_path.with_suffix(movies[0].suffix)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # paths in a concat list are relative to the list file
+    list_file = work_dir / "concat.txt"
+    list_file.write_text(
+        "".join(f"file '{Path(os.path.relpath(movie, work_dir)).as_posix()}'\n" for movie in movies),
+        encoding="utf-8",
+    )
+    result = run_ffmpeg(
+        [
+            "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0",
+            "-i", to_project_path(list_file, project_dir),
+            "-c", "copy",
+            to_project_path(output_path, project_dir),
+        ],
+        project_dir,
+        image=image,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Concatenation failed:\n{result.stderr[-2000:]}")
+
+    print(f"🔀 {class_name}: {len(ranges)} ranges rendered and joined in {time.perf_counter() - start_time:.1f}s")
+    return output_path
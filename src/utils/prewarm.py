@@ -0,0 +1,198 @@
+"""
+Warm-up steps for the prewarmed render image (see the `prewarmed` stage of the Dockerfile)
+and a startup probe used by `render.py` to measure how much container startup they save.
+
+Usage (inside the image):
+    python -m src.utils.prewarm [--precrop-sprites]
+    python -m src.utils.prewarm --probe
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+import compileall
+import py_compile
+from pathlib import Path
+
+from src.utils.config import (
+    BASE_DIR,
+    PREBUILT_SPRITES_POSES_DIR,
+    SOURCES_DIR,
+    SPRITES_SHEETS_DIR,
+    TEX_FORMATS_DIR,
+    UKRAINIAN_TEX_FORMAT,
+)
+
+WARMUP_TEXT = "Привіт, світ! sin cos"
+WARMUP_TEX = r"$\sin(\alpha) = \frac{\text{протилежний}}{\text{гіпотенуза}}$"
+
+
+def warm_font_caches() -> None:
+    """Build the fontconfig cache and lay out some text with Pango (DejaVu Serif + default font)"""
+    subprocess.run(["fc-cache", "-f"], check=False)
+
+    from manim import Text, tempconfig
+
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({"media_dir": media_dir}):
+        Text(WARMUP_TEXT)
+        Text(WARMUP_TEXT, font="DejaVu Serif")
+
+
+def build_tex_format(formats_dir: Path) -> Path:
+    """
+    Precompile the Ukrainian TeX preamble (up to `\\endofdump`) into a xelatex format.
+
+    Args:
+        formats_dir (Path): Directory where the `.fmt` file is written (must be on TEXFORMATS).
+
+    Raises:
+        RuntimeError: If xelatex fails to dump the format.
+
+    Returns:
+        Path: The path to the created format file.
+    """
+    from src.utils.manim_config import TEX_DOCUMENTCLASS, UKRAINIAN_TEX_PREAMBLE
+
+    formats_dir.mkdir(parents=True, exist_ok=True)
+    preamble_file = formats_dir / f"{UKRAINIAN_TEX_FORMAT}.tex"
+    preamble_file.write_text(
+        f"{TEX_DOCUMENTCLASS}\n{UKRAINIAN_TEX_PREAMBLE}\n\\begin{{document}}\n\\end{{document}}\n",
+        encoding="utf-8",
+    )
+
+    result = subprocess.run(
+        [
+            "xelatex", "-ini", "-interaction=nonstopmode",
+            f"-jobname={UKRAINIAN_TEX_FORMAT}",
+            "&xelatex", "mylatexformat.ltx", preamble_file.name,
+        ],
+        cwd=formats_dir,
+        capture_output=True,
+        text=True,
+    )
+    format_file = formats_dir / f"{UKRAINIAN_TEX_FORMAT}.fmt"
+    if result.returncode != 0 or not format_file.exists():
+        raise RuntimeError(f"xelatex failed to dump the format:\n{result.stdout[-2000:]}")
+    return format_file
+
+
+def warm_tex() -> None:
+    """Compile a formula with the Ukrainian template (loads the format and the fonts once)"""
+    from manim import Tex, tempconfig
+    from src.utils.manim_config import UkrainianTexTemplate, _ukrainian_documentclass
+
+    # the template was created before the format existed, pick it up now
+    tex_template = UkrainianTexTemplate.copy()
+    tex_template.documentclass = _ukrainian_documentclass()
+
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({"media_dir": media_dir}):
+        Tex(WARMUP_TEX, tex_template=tex_template)
+
+
+def compile_sources(sources_dir: Path = SOURCES_DIR) -> bool:
+    """
+    Byte-compile the project modules.
+
+    The image is run with the project bind-mounted over /manim, so the bytecode
+    is written to PYTHONPYCACHEPREFIX and validated by source hash (not mtime).
+    """
+    return compileall.compile_dir(
+        sources_dir,
+        quiet=1,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
+
+
+def compile_libraries() -> None:
+    """
+    Byte-compile the standard library and site-packages (manim, numpy, scipy, ...).
+
+    With PYTHONPYCACHEPREFIX set, Python reads bytecode from the prefix only and ignores
+    the `.pyc` files shipped next to the library sources: without this step every module
+    not imported during the build would be compiled again in each render container.
+    """
+    project_dir = BASE_DIR.resolve()
+    for entry in sys.path:
+        path = Path(entry or ".").resolve()
+        if path.is_dir() and path != project_dir and project_dir not in path.parents:
+            compileall.compile_dir(path, quiet=2, workers=0)
+
+
+def precrop_sprites(poses_dir: Path) -> list[Path]:
+    """Crop all sprite sheets into poses baked into the image"""
+    from src.animations_sprites.crop_svg_sprite import get_all_cropped_poses
+
+    return get_all_cropped_poses(SPRITES_SHEETS_DIR, poses_dir)
+
+
+def prewarm(precrop: bool = False) -> bool:
+    """Run all the warm-up steps, reporting (but not failing on) the ones that can't be done"""
+    steps = [
+        ("byte-compile project modules", compile_sources),
+        ("byte-compile Python libraries", compile_libraries),
+        ("fontconfig / Pango caches", warm_font_caches),
+    ]
+    if TEX_FORMATS_DIR is not None:
+        steps.append(("Ukrainian TeX preamble format", lambda: build_tex_format(TEX_FORMATS_DIR)))
+    steps.append(("TeX warm-up", warm_tex))
+    if precrop and PREBUILT_SPRITES_POSES_DIR is not None:
+        steps.append(("pre-crop sprite poses", lambda: precrop_sprites(PREBUILT_SPRITES_POSES_DIR)))
+
+    ok = True
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+            print(f"✅ {name} ({time.perf_counter() - start:.1f}s)")
+        except Exception as e:
+            ok = False
+            print(f"⚠️  {name} failed: {e}")
+    return ok
+
+
+def probe() -> dict[str, float]:
+    """Measure the cold-start costs a render pays in a fresh container"""
+    timings = {}
+
+    start = time.perf_counter()
+    import manim  # noqa: F401
+    timings["import"] = time.perf_counter() - start
+
+    from manim import Tex, Text, tempconfig
+    from src.utils.manim_config import UkrainianTexTemplate
+
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({"media_dir": media_dir}):
+        start = time.perf_counter()
+        Text(WARMUP_TEXT, font="DejaVu Serif")
+        timings["text"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if shutil.which("xelatex"):
+            Tex(WARMUP_TEX, tex_template=UkrainianTexTemplate)
+        timings["tex"] = time.perf_counter() - start
+
+    # project modules: compiled from source in a cold container, loaded from bytecode when prewarmed
+    start = time.perf_counter()
+    import src.animations_sprites.ManimSprite  # noqa: F401
+    import src.utils.asset_cache  # noqa: F401
+    timings["project_import"] = time.perf_counter() - start
+
+    timings["total"] = sum(timings.values())
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm up the render image caches")
+    parser.add_argument("--precrop-sprites", action="store_true", help="Also crop the sprite sheets into poses")
+    parser.add_argument("--probe", action="store_true", help="Print the cold-start timings as JSON and exit")
+    args = parser.parse_args()
+
+    if args.probe:
+        print(json.dumps(probe()))
+    else:
+        # never fail the image build because of an optional warm-up step
+        prewarm(precrop=args.precrop_sprites or os.environ.get("PRECROP_SPRITES") == "1")
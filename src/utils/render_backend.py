@@ -0,0 +1,106 @@
+import os
+import sys
+import shutil
+import subprocess
+import importlib.util
+from pathlib import Path
+
+from src.utils.render_image import docker_run_command
+
+# Where manim runs: in the project venv on the host, or in a render container
+LOCAL_BACKEND = "local"
+DOCKER_BACKEND = "docker"
+BACKENDS = (LOCAL_BACKEND, DOCKER_BACKEND)
+
+# Host programs manim needs: Tex/MathTex (latex + dvisvgm), the Ukrainian TeX template
+# (xelatex, packaged separately from latex on Debian/Ubuntu) and video encoding (ffmpeg)
+LOCAL_TOOLS = ("latex", "xelatex", "dvisvgm", "ffmpeg")
+
+# Fonts the Ukrainian TeX template sets with fontspec (`\setmainfont` in manim_config.py)
+LOCAL_FONTS = ("DejaVu Serif",)
+
+
+def _missing_fonts() -> list[str]:
+    """The LOCAL_FONTS fontconfig does not know (none if fontconfig is not there to ask)"""
+    if shutil.which("fc-list") is None:
+        return []
+    missing = []
+    for font in LOCAL_FONTS:
+        result = subprocess.run(["fc-list", font, "family"], capture_output=True, text=True)
+        if result.returncode == 0 and not result.stdout.strip():
+            missing.append(f"font {font}")
+    return missing
+
+
+def missing_local_tools() -> list[str]:
+    """What the host lacks to render without Docker (manim in the venv, LaTeX, fonts, ffmpeg)"""
+    missing = [] if importlib.util.find_spec("manim") is not None else ["manim (uv sync)"]
+    missing += [tool for tool in LOCAL_TOOLS if shutil.which(tool) is None]
+    return missing + (_missing_fonts() if not missing else [])
+
+
+def pick_backend(requested: str | None = None) -> str:
+    """
+    Return the requested backend, or the local one when the host toolchain is complete.
+
+    Args:
+        requested (str | None, optional): `--backend` value. Defaults to None (auto-detect).
+
+    Returns:
+        str: LOCAL_BACKEND or DOCKER_BACKEND.
+    """
+    missing = missing_local_tools()
+    if requested == LOCAL_BACKEND:
+        if missing:
+            print(f"⚠️  Local backend requested but missing: {', '.join(missing)}")
+        return LOCAL_BACKEND
+    if requested == DOCKER_BACKEND:
+        return DOCKER_BACKEND
+    if not missing:
+        print("🖥️  Host toolchain found (manim, LaTeX, ffmpeg), rendering locally (--backend docker to use Docker)")
+        return LOCAL_BACKEND
+    print(f"🐳 Rendering with Docker (local backend missing: {', '.join(missing)})")
+    return DOCKER_BACKEND
+
+
+def render_command(
+    project_dir: Path,
+    image: str | None,
+    command: list[str],
+    env: dict[str, str] | None = None,
+    name: str | None = None,
+    tty: bool = False,
+) -> list[str]:
+    """
+    Build the command running `manim ...`/`python ...` in the render environment.
+
+    Args:
+        project_dir (Path): The project root (working directory of the command).
+        image (str | None): The render image, or None to run in the project venv (local backend).
+        command (list[str]): The command, starting with `manim` or `python`.
+        env (dict[str, str] | None, optional): Extra environment variables (for the local
+            backend pass them with `render_env` as well). Defaults to None.
+        name (str | None, optional): Container name (Docker only). Defaults to None.
+        tty (bool, optional): Allocate an interactive TTY (Docker only). Defaults to False.
+
+    Returns:
+        list[str]: The command, ready for subprocess (run it from `project_dir`).
+    """
+    if image is not None:
+        return docker_run_command(project_dir, image, command, env=env, name=name, tty=tty)
+
+    program, *args = command
+    if program == "manim":
+        return [sys.executable, "-m", "manim", *args]
+    if program == "python":
+        return [sys.executable, *args]
+    return command
+
+
+def render_env(project_dir: Path, image: str | None, env: dict[str, str] | None = None) -> dict[str, str] | None:
+    """Environment of a `render_command` process: None (inherited) for Docker, where it is in the command"""
+    if image is not None:
+        return None
+    # same imports as in the container, where the project is on PYTHONPATH
+    python_path = os.pathsep.join(filter(None, [str(project_dir), os.environ.get("PYTHONPATH")]))
+    return {**os.environ, "PYTHONPATH": python_path, **(env or {})}
@@ -0,0 +1,157 @@
+import json
+import time
+import subprocess
+from pathlib import Path
+
+from src.utils.config import CACHE_DIR, MANIM_DOCKER_IMAGE, PREWARMED_DOCKER_IMAGE
+
+STARTUP_TIMES_FILE = CACHE_DIR / "startup_times.json"
+
+
+def docker_run_command(
+    project_dir: Path,
+    image: str,
+    command: list[str],
+    env: dict[str, str] | None = None,
+    name: str | None = None,
+    tty: bool = False,
+) -> list[str]:
+    """
+    Build a `docker run` command with the project mounted at /manim.
+
+    Args:
+        project_dir (Path): The project root, mounted at /manim (the working directory).
+        image (str): The render image.
+        command (list[str]): The command to run in the container.
+        env (dict[str, str] | None, optional): Extra environment variables. Defaults to None.
+        name (str | None, optional): Container name (so it can be killed). Defaults to None.
+        tty (bool, optional): Allocate an interactive TTY (progress bars). Defaults to False.
+
+    Returns:
+        list[str]: The command, ready for subprocess.
+    """
+    docker_command = ["docker", "run", "--rm"]
+    if tty:
+        docker_command.append("-it")
+    if name:
+        docker_command += ["--name", name]
+    docker_command += ["-v", f"{project_dir}:/manim", "-w", "/manim", "-e", "PYTHONPATH=/manim"]
+    for key, value in (env or {}).items():
+        docker_command += ["-e", f"{key}={value}"]
+    return docker_command + [image] + command
+
+
+def get_image_id(image: str) -> str | None:
+    """Return the local image id, or None if the image is not present"""
+    from src.utils.docker_client import DockerAPIError, get_docker_client
+
+    client = get_docker_client()
+    if client is not None and client.is_healthy():
+        try:
+            details = client.inspect_image(image)
+            return details["Id"] if details else None
+        except (DockerAPIError, OSError):
+            pass
+
+    result = subprocess.run(
+        ["docker", "image", "inspect", "--format", "{{.Id}}", image],
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def get_render_image() -> str:
+    """Use the prewarmed image if it was built, else the stock manim image"""
+    if get_image_id(PREWARMED_DOCKER_IMAGE) is not None:
+        return PREWARMED_DOCKER_IMAGE
+    return MANIM_DOCKER_IMAGE
+
+
+def build_prewarmed_image(project_dir: Path, precrop_sprites: bool = False) -> bool:
+    """
+    Build the prewarmed render image from the `prewarmed` stage of the Dockerfile.
+
+    Args:
+        project_dir (Path): The project root (Docker build context).
+        precrop_sprites (bool, optional): Bake pre-cropped sprite poses into the image. Defaults to False.
+
+    Returns:
+        bool: True if the image was built.
+    """
+    command = [
+        "docker", "build",
+        "--target", "prewarmed",
+        "--build-arg", f"PRECROP_SPRITES={int(precrop_sprites)}",
+        "-t", PREWARMED_DOCKER_IMAGE,
+        str(project_dir),
+    ]
+    print(f"🐳 Building prewarmed image: {' '.join(command)}")
+    return subprocess.run(command).returncode == 0
+
+
+def measure_startup(image: str, project_dir: Path) -> dict[str, float] | None:
+    """
+    Measure the cold-start cost of a render container (container start, manim import,
+    first Text/Tex, project imports) by running the startup probe in it.
+
+    Returns:
+        dict[str, float] | None: The probe timings plus the container wall time ("wall"),
+            or None if the probe failed.
+    """
+    command = docker_run_command(project_dir, image, ["python", "-m", "src.utils.prewarm", "--probe"])
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        print(f"⚠️  Startup probe failed in {image}:\n{result.stderr[-1000:]}")
+        return None
+
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["wall"] = wall
+    return timings
+
+
+def _load_startup_times() -> dict[str, dict[str, float]]:
+    if STARTUP_TIMES_FILE.exists():
+        try:
+            return json.loads(STARTUP_TIMES_FILE.read_text(encoding="utf-8"))
+        except ValueError:
+            pass
+    return {}
+
+
+def get_startup_times(image: str, project_dir: Path, measure: bool = False) -> dict[str, float] | None:
+    """Return the startup timings of the image, cached per image id (measured only if asked)"""
+    image_id = get_image_id(image)
+    if image_id is None:
+        return None
+
+    startup_times = _load_startup_times()
+    if image_id not in startup_times and measure:
+        timings = measure_startup(image, project_dir)
+        if timings is None:
+            return None
+        startup_times[image_id] = timings
+        STARTUP_TIMES_FILE.parent.mkdir(parents=True, exist_ok=True)
+        STARTUP_TIMES_FILE.write_text(json.dumps(startup_times, indent=2), encoding="utf-8")
+    return startup_times.get(image_id)
+
+
+def report_startup_saving(project_dir: Path, measure: bool = False) -> None:
+    """Print how much startup time the prewarmed image saves per render container"""
+    base = get_startup_times(MANIM_DOCKER_IMAGE, project_dir, measure)
+    prewarmed = get_startup_times(PREWARMED_DOCKER_IMAGE, project_dir, measure)
+    if base is None or prewarmed is None:
+        if measure:
+            print("⚠️  Cannot compare startup times (is the stock manim image present?)")
+        return
+
+    saved = base["wall"] - prewarmed["wall"]
+    print(
+        f"⏱️  Prewarmed image saves ~{saved:.1f}s of startup per render "
+        f"({base['wall']:.1f}s → {prewarmed['wall']:.1f}s)"
+    )
+    for key in ("import", "text", "tex", "project_import"):
+        if key in base and key in prewarmed:
+            print(f"    {key:<15} {base[key]:6.2f}s → {prewarmed[key]:6.2f}s")
@@ -0,0 +1,97 @@
+import time
+import codecs
+import threading
+import subprocess
+from typing import Callable
+
+
+class RenderCancelledError(Exception):
+    """Raised when a render is cancelled (Ctrl+C, stale watch render, ...)"""
+
+
+class RenderTimeoutError(Exception):
+    """Raised when a render exceeds its time limit"""
+
+
+def kill_container(name: str) -> None:
+    """Kill a named render container (the docker client process alone may leave it running)"""
+    subprocess.run(["docker", "kill", name], capture_output=True, check=False)
+
+
+def run_render_process(
+    command: list[str],
+    container_name: str | None = None,
+    timeout: float | None = None,
+    cancel_event: threading.Event | None = None,
+    poll_interval: float = 0.5,
+    env: dict[str, str] | None = None,
+    cwd: str | None = None,
+    output: Callable[[str], None] | None = None,
+) -> int:
+    """
+    Run a render command, honouring a timeout and a cancel event.
+
+    Args:
+        command (list[str]): The command to run (output goes to the terminal, or to `output`).
+        container_name (str | None, optional): Name of the container started by the
+            command, killed on timeout/cancel. Defaults to None.
+        timeout (float | None, optional): Time limit in seconds. Defaults to None.
+        cancel_event (threading.Event | None, optional): Set it to stop the render. Defaults to None.
+        poll_interval (float, optional): How often to check the timeout/cancel event. Defaults to 0.5.
+        env (dict[str, str] | None, optional): Environment of the command. Defaults to the current one.
+        cwd (str | None, optional): Working directory of the command. Defaults to the current one.
+        output (Callable[[str], None] | None, optional): Called with every line of the command's
+            stdout and stderr (progress bar updates, separated by carriage returns, included)
+            instead of printing them. Defaults to None.
+
+    Raises:
+        RenderTimeoutError: If the render exceeds the timeout.
+        RenderCancelledError: If the cancel event is set.
+
+    Returns:
+        int: The exit code of the command.
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    if output is None:
+        process = subprocess.Popen(command, env=env, cwd=cwd)
+        reader = None
+    else:
+        process = subprocess.Popen(command, env=env, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+        reader = threading.Thread(target=_read_lines, args=(process.stdout, output), daemon=True)
+        reader.start()
+    while True:
+        try:
+            exit_code = process.wait(timeout=poll_interval)
+            if reader is not None:
+                reader.join()
+            return exit_code
+        except subprocess.TimeoutExpired:
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            timed_out = deadline is not None and time.monotonic() > deadline
+            if not (cancelled or timed_out):
+                continue
+
+            if container_name:
+                kill_container(container_name)
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+            if cancelled:
+                raise RenderCancelledError("Render cancelled")
+            raise RenderTimeoutError(f"Render exceeded the time limit of {timeout:.0f}s")
+
+
+def _read_lines(pipe, output: Callable[[str], None]) -> None:
+    """Split a process output into lines as it comes (tqdm rewrites its bar with bare carriage returns)"""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    while chunk := pipe.read(4096):
+        *lines, pending = (pending + decoder.decode(chunk)).replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        for line in lines:
+            output(line)
+    if pending:
+        output(pending)
@@ -0,0 +1,376 @@
+"""
+Progress of concurrent renders: manim's output parsed into events, a dashboard and an ETA.
+
+Every render's output (manim's tqdm bars, `Animation 3: Write(Text('x')):  45%|... | 27/60 [...]`
+or `Waiting 4:  50%|... | 30/60 [...]`, and its "Using cached data" lines) is captured instead of
+going to the terminal, turned into structured events appended to `.cache/render_events.jsonl`, and
+summarized as one line per running scene under a header with the aggregate ETA of the batch:
+
+    ⏳ 3/8 done · 2 running · 3 queued · ETA 4m10s
+      LogosIntro         [######----]  61%  anim 14 Write(Text('KSE'))     ETA 1m05s
+      CosineSimilarity   [#---------]  12%  anim 2 Create(Axes)            ETA 3m40s
+
+The ETA of a scene is its past render time (queue history) minus the time spent; without
+history it is extrapolated from the frames rendered so far and the scene's animation time
+(see `scene_cost`). The batch ETA places the remaining work on the workers like the queue does.
+
+Manim numbers every `play` and `wait`, but prints no bar for the animations reused from the
+cache nor for the waits without updaters (a frozen frame): those are counted as done, with the
+average frames of an animation of the scene, when a later number shows up.
+"""
+import re
+import sys
+import json
+import time
+import shutil
+import threading
+from pathlib import Path
+
+from src.utils.config import CACHE_DIR
+from src.utils.render_queue import DONE, FAILED, PENDING, RUNNING, RenderJob, format_seconds, predict_makespan
+
+EVENTS_LOG = CACHE_DIR / "render_events.jsonl"
+
+REFRESH_SECONDS = 0.5
+PLAIN_REFRESH_SECONDS = 30.0  # summary line interval when the output is not a terminal
+PROGRESS_EVENT_SECONDS = 1.0  # at most one "progress" event per job and interval in the log
+OUTPUT_TAIL_LINES = 20  # manim's other output kept per job, printed if the render fails
+BAR_WIDTH = 10
+
+_PROGRESS_LINE = re.compile(
+    r"(?P<kind>Animation|Waiting) (?P<animation>\d+)(?:: (?P<name>.*?))?:\s+(?P<percent>\d+)%\|.*?\|\s*(?P<frame>\d+)/(?P<frames>\d+)"
+    r"(?: \[(?P<elapsed>[\d:]+)<(?P<remaining>[\d:?]+))?"
+)
+_CACHED_LINE = re.compile(r"Animation (?P<animation>\d+) : Using cached data")
+
+
+def parse_progress_line(line: str) -> dict | None:
+    """
+    Parse a line of manim's output into a progress event.
+
+    Args:
+        line (str): A line (or a carriage-return separated update) of the render output.
+
+    Returns:
+        dict | None: {"event": "progress", "animation", "name", "frame", "frames"} for a
+            progress bar update (of an animation or a wait with updaters, named "Wait"),
+            {"event": "cached", "animation"} for an animation reused from the cache, None for
+            any other line.
+    """
+    match = _PROGRESS_LINE.search(line)
+    if match:
+        return {
+            "event": "progress",
+            "animation": int(match.group("animation")),
+            "name": "Wait" if match.group("kind") == "Waiting" else match.group("name").strip(),
+            "frame": int(match.group("frame")),
+            "frames": int(match.group("frames")),
+        }
+    match = _CACHED_LINE.search(line)
+    if match:
+        return {"event": "cached", "animation": int(match.group("animation"))}
+    return None
+
+
+def _static_frames(scene: str, quality: str) -> tuple[int | None, float | None, int]:
+    """
+    Frames of a scene, rough render time and number of play/wait calls, from its source
+    (None, None, 0 if unknown)
+    """
+    from src.utils.scene_cost import analyze_scene, estimate_render_times, frame_counts, scene_source
+
+    source = scene_source(scene)
+    if source is None:
+        return None, None, 0
+    try:
+        cost = analyze_scene(*source)
+    except (OSError, SyntaxError):
+        return None, None, 0
+    if not cost.animation_time:
+        return None, None, 0
+    animation_time = cost.animation_time
+    return frame_counts(animation_time)[quality], estimate_render_times(animation_time, {})[quality][0], cost.plays + cost.waits
+
+
+class _JobProgress:
+    """Live state of a job of the batch"""
+
+    def __init__(self, job: RenderJob):
+        self.job = job
+        self.total_frames, self.rough_estimate, animations = _static_frames(job.scene, job.quality)
+        # frames of an animation without a bar (cached, or a frozen wait): the scene's average
+        self.skipped_frames = self.total_frames / animations if self.total_frames and animations else 0.0
+        self.started_at: float | None = None
+        self.animation: int | None = None  # of the last bar update, and its name
+        self.name = ""
+        # per animation with a bar: [frame, frames]; the workers of a `--parallel` render
+        # print the bars of their ranges at the same time, so several can be in progress
+        self.animations: dict[int, list[int]] = {}
+        self.finished: set[int] = set()
+        self.next_animation = 0  # manim's number of the first animation not accounted for yet
+        self.skipped: set[int] = set()  # animations done without a bar
+        self.last_event_at = 0.0
+        self.tail: list[str] = []
+
+    def reset(self, job: RenderJob) -> None:
+        """A new attempt of the job"""
+        self.job = job
+        self.started_at = time.monotonic()
+        self.animation, self.name, self.next_animation = None, "", 0
+        self.animations, self.finished, self.skipped = {}, set(), set()
+        self.tail = []
+
+    def reach(self, animation: int) -> None:
+        """
+        Animation number `animation` started: the numbers before it without a bar are done
+        (until a bar shows up for one of them, from another worker)
+        """
+        self.skipped.update(range(self.next_animation, animation))
+        self.skipped.discard(animation)
+        self.next_animation = max(self.next_animation, animation + 1)
+
+    @property
+    def rendered_frames(self) -> int:
+        return sum(frames if animation in self.finished else frame for animation, (frame, frames) in self.animations.items())
+
+    @property
+    def frames_done(self) -> float:
+        return self.rendered_frames + len(self.skipped) * self.skipped_frames
+
+    def expected(self) -> float | None:
+        """Expected duration of the whole job"""
+        return self.job.estimate if self.job.estimate is not None else self.rough_estimate
+
+    def remaining(self) -> float | None:
+        """Seconds left, None if unknown"""
+        elapsed = time.monotonic() - self.started_at if self.started_at is not None else 0.0
+        if self.job.estimate is None and self.total_frames and self.rendered_frames and elapsed:
+            # no history: extrapolate the frame rate of this render (skipped frames took no time)
+            return max(self.total_frames - self.frames_done, 0) * elapsed / self.rendered_frames
+        expected = self.expected()
+        return None if expected is None else max(expected - elapsed, 0.0)
+
+    def fraction(self) -> float | None:
+        if self.total_frames:
+            return min(self.frames_done / self.total_frames, 1.0)
+        expected = self.expected()
+        if expected and self.started_at is not None:
+            return min((time.monotonic() - self.started_at) / expected, 0.99)
+        return None
+
+
+class RenderDashboard:
+    """
+    Collects the output of the renders of a batch: events log, dashboard and aggregate ETA.
+
+    Usage:
+        dashboard = RenderDashboard(batch, queue.jobs(batch), workers)
+        with dashboard:
+            # in every render: dashboard.started(job), run the render with
+            # output=dashboard.output(job), then dashboard.finished(job, ok)
+    """
+
+    def __init__(
+        self,
+        batch: str,
+        jobs: list[RenderJob],
+        workers: int,
+        log_path: Path = EVENTS_LOG,
+        stream=None,
+    ):
+        self.batch = batch
+        self.workers = workers
+        self.log_path = log_path
+        self.stream = stream or sys.stdout
+        self.interactive = self.stream.isatty()
+        self.progress = {job.id: _JobProgress(job) for job in jobs}
+        self.status = {job.id: job.status for job in jobs}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._shown_lines = 0  # dashboard lines currently on the terminal
+        self._log = None
+        self._thread = None
+        self._original_stdout = None
+
+    # -- events
+
+    def _emit(self, job: RenderJob | None, event: dict) -> None:
+        record = {"time": round(time.time(), 3), "batch": self.batch, **event}
+        if job is not None:
+            record = {**record, "job": job.id, "scene": job.scene, "quality": job.quality}
+        with self._lock:
+            self._log.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._log.flush()
+
+    def started(self, job: RenderJob) -> None:
+        with self._lock:
+            self.status[job.id] = RUNNING
+            progress = self.progress.setdefault(job.id, _JobProgress(job))
+            progress.reset(job)
+        self._emit(job, {"event": "start", "attempt": job.attempts, "estimate": progress.expected(), "frames": progress.total_frames})
+
+    def finished(self, job: RenderJob, ok: bool) -> None:
+        """The attempt of `job` ended (a failed job with attempts left goes back to the queue)"""
+        progress = self.progress[job.id]
+        retried = not ok and job.attempts < job.max_attempts
+        with self._lock:
+            self.status[job.id] = DONE if ok else PENDING if retried else FAILED
+        if ok:
+            for animation in sorted(progress.animations):
+                self._animation_done(job, progress, animation)
+        duration = time.monotonic() - progress.started_at if progress.started_at is not None else None
+        event = "done" if ok else "retry" if retried else "failed"
+        self._emit(job, {"event": event, "seconds": duration and round(duration, 2), "frames": progress.rendered_frames, "skipped": len(progress.skipped)})
+        if not ok and progress.tail:
+            print(f"❌ {job.scene} failed, last output:\n" + "\n".join(f"    {line}" for line in progress.tail))
+
+    def _animation_done(self, job: RenderJob, progress: _JobProgress, animation: int) -> None:
+        if animation in progress.animations and animation not in progress.finished:
+            progress.finished.add(animation)
+            self._emit(job, {"event": "animation_done", "animation": animation, "frames": progress.animations[animation][1]})
+
+    def output(self, job: RenderJob):
+        """A callback receiving the output lines of the render of `job`"""
+        progress = self.progress[job.id]
+
+        def on_line(line: str) -> None:
+            event = parse_progress_line(line)
+            if event is None:
+                line = line.strip()
+                if line:
+                    progress.tail = (progress.tail + [line])[-OUTPUT_TAIL_LINES:]
+                return
+            with self._lock:
+                animation = event["animation"]
+                if event["event"] == "cached":
+                    progress.reach(animation)
+                    progress.skipped.add(animation)
+                    self._emit(job, event)
+                    return
+                if animation not in progress.animations:
+                    progress.reach(animation)
+                    # the previous animation of the same worker (workers render contiguous ranges)
+                    self._animation_done(job, progress, animation - 1)
+                    self._emit(job, {"event": "animation", "animation": animation, "name": event["name"], "frames": event["frames"]})
+                    progress.animations[animation] = [0, event["frames"]]
+                counts = progress.animations[animation]
+                counts[0], counts[1] = max(counts[0], event["frame"]), event["frames"]
+                progress.animation, progress.name = animation, event["name"]
+                now = time.monotonic()
+                if now - progress.last_event_at >= PROGRESS_EVENT_SECONDS:
+                    progress.last_event_at = now
+                    remaining = progress.remaining()
+                    self._emit(job, {**event, "eta": remaining and round(remaining, 1)})
+
+        return on_line
+
+    # -- ETA
+
+    def eta(self) -> tuple[float | None, int]:
+        """
+        Aggregate ETA of the batch.
+
+        Returns:
+            tuple[float | None, int]: Seconds left (None if nothing is known), and the number
+                of remaining jobs without any estimate (not included).
+        """
+        with self._lock:
+            running, queued, unknown = [], [], 0
+            for job_id, status in self.status.items():
+                progress = self.progress[job_id]
+                if status == RUNNING:
+                    remaining = progress.remaining()
+                elif status == PENDING:
+                    remaining = progress.expected()
+                else:
+                    continue
+                if remaining is None:
+                    unknown += 1
+                else:
+                    (running if status == RUNNING else queued).append(remaining)
+        if not running and not queued:
+            return None, unknown
+        # the running jobs hold a worker each, the queued ones go longest first
+        return predict_makespan(running + sorted(queued, reverse=True), self.workers), unknown
+
+    # -- display
+
+    def _lines(self) -> list[str]:
+        with self._lock:
+            counts = {status: list(self.status.values()).count(status) for status in (DONE, FAILED, RUNNING, PENDING)}
+            running = [self.progress[job_id] for job_id, status in self.status.items() if status == RUNNING]
+        eta, unknown = self.eta()
+        header = f"⏳ {counts[DONE]}/{len(self.status)} done · {counts[RUNNING]} running · {counts[PENDING]} queued"
+        if counts[FAILED]:
+            header += f" · {counts[FAILED]} failed"
+        if eta is not None:
+            header += f" · ETA {format_seconds(eta)}" + (f" (+{unknown} without estimate)" if unknown else "")
+        lines = [header]
+        for progress in running:
+            fraction = progress.fraction()
+            bar = "#" * round((fraction or 0) * BAR_WIDTH)
+            percent = f"{fraction:4.0%}" if fraction is not None else "   ?"
+            remaining = progress.remaining()
+            animation = f"anim {progress.animation} {progress.name}" if progress.animation is not None else "starting"
+            lines.append(
+                f"  {progress.job.scene:<22.22} [{bar:-<{BAR_WIDTH}}] {percent}  {animation:<32.32}"
+                + (f"  ETA {format_seconds(remaining)}" if remaining is not None else "")
+            )
+        return lines
+
+    def _clear(self) -> None:
+        if self._shown_lines:
+            up = f"\x1b[{self._shown_lines - 1}A" if self._shown_lines > 1 else ""
+            self.stream.write(f"\r{up}\x1b[J")
+            self._shown_lines = 0
+
+    def _draw(self) -> None:
+        width = shutil.get_terminal_size().columns - 1
+        lines = [line[:width] for line in self._lines()]
+        with self._lock:
+            self._clear()
+            self.stream.write("\n".join(lines))
+            self.stream.flush()
+            self._shown_lines = len(lines)
+
+    def _refresh(self) -> None:
+        while not self._stop.wait(REFRESH_SECONDS if self.interactive else PLAIN_REFRESH_SECONDS):
+            if self.interactive:
+                self._draw()
+            else:
+                print(self._lines()[0])
+
+    def write(self, text: str) -> int:
+        """Print other output above the dashboard (stands in for sys.stdout while it is shown)"""
+        with self._lock:
+            self._clear()
+            return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def isatty(self) -> bool:
+        return self.interactive
+
+    def __enter__(self) -> "RenderDashboard":
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        eta, unknown = self.eta()
+        self._emit(None, {"event": "batch_start", "jobs": len(self.status), "workers": self.workers, "eta": eta, "unestimated": unknown})
+        if self.interactive:
+            self._original_stdout, sys.stdout = sys.stdout, self
+        self._thread = threading.Thread(target=self._refresh, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        if self._original_stdout is not None:
+            with self._lock:
+                self._clear()
+                self.stream.flush()
+            sys.stdout = self._original_stdout
+        counts = list(self.status.values())
+        self._emit(None, {"event": "batch_end", "done": counts.count(DONE), "failed": counts.count(FAILED)})
+        self._log.close()
@@ -0,0 +1,407 @@
+import json
+import time
+import uuid
+import heapq
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable
+
+from src.utils.config import CACHE_DIR
+from src.utils.render_process import RenderCancelledError
+
+RENDER_QUEUE_DB = CACHE_DIR / "render_queue.sqlite3"
+
+# Job statuses
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF = 5.0  # seconds, doubled after every failed attempt
+HISTORY_SIZE = 5  # past renders of a scene its duration estimate is the median of
+
+# render options that change how long a render takes, with their default: a duration is
+# only compared with those of renders made with the same ones
+_TIMED_OPTIONS = {"derive": [], "parallel": 1, "checkpoints": False, "alpha_profile": None, "alpha_report": False}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    scene TEXT NOT NULL,
+    quality TEXT NOT NULL,
+    transparent INTEGER NOT NULL DEFAULT 0,
+    options TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    duration REAL,
+    estimate REAL,
+    output_path TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_batch_status ON jobs (batch, status);
+"""
+
+
+def _timing_key(options: dict | None) -> str:
+    options = options or {}
+    return json.dumps({name: options.get(name) or default for name, default in _TIMED_OPTIONS.items()}, sort_keys=True)
+
+
+class RenderJob:
+    """A row of the render queue (a plain class: dataclasses is too slow to import for the CLI)"""
+
+    def __init__(
+        self,
+        id: int,
+        batch: str,
+        scene: str,
+        quality: str,
+        transparent: bool,
+        options: dict | None = None,
+        status: str = PENDING,
+        attempts: int = 0,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        duration: float | None = None,
+        output_path: str | None = None,
+        error: str | None = None,
+        estimate: float | None = None,
+    ):
+        self.id = id
+        self.batch = batch
+        self.scene = scene
+        self.quality = quality
+        self.transparent = transparent
+        self.options = options or {}
+        self.status = status
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.duration = duration
+        self.output_path = output_path
+        self.error = error
+        self.estimate = estimate  # expected duration, from the past renders of the scene
+
+    def __repr__(self) -> str:
+        return f"RenderJob(id={self.id}, scene={self.scene!r}, quality={self.quality!r}, status={self.status!r})"
+
+
+class RenderQueue:
+    """
+    SQLite-backed render job queue, so that an interrupted batch can be resumed.
+
+    One connection is shared by the worker threads of a process (guarded by a lock);
+    every state change is committed immediately, so the file always reflects which
+    jobs finished even if the process dies.
+    """
+
+    def __init__(self, db_path: Path = RENDER_QUEUE_DB):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "estimate" not in columns:  # queue files created before the column existed
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN estimate REAL")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> RenderJob:
+        return RenderJob(
+            id=row["id"],
+            batch=row["batch"],
+            scene=row["scene"],
+            quality=row["quality"],
+            transparent=bool(row["transparent"]),
+            options=json.loads(row["options"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            duration=row["duration"],
+            output_path=row["output_path"],
+            error=row["error"],
+            estimate=row["estimate"],
+        )
+
+    def estimate_duration(
+        self, scene: str, quality: str, transparent: bool = False, options: dict | None = None
+    ) -> float | None:
+        """
+        Expected render time of a scene: the median of its last full renders at that quality,
+        made with the same timing-relevant options (derive, parallel, checkpoints, alpha profile
+        and report).
+
+        Returns:
+            float | None: Seconds, or None if the scene was never rendered completely that way.
+        """
+        wanted = _timing_key(options)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT duration, options FROM jobs WHERE scene = ? AND quality = ? AND transparent = ? AND status = ? "
+                "AND duration IS NOT NULL AND json_extract(options, '$.sections') IS NULL "
+                "ORDER BY finished_at DESC LIMIT ?",
+                (scene, quality, int(transparent), DONE, HISTORY_SIZE * 10),
+            ).fetchall()
+        durations = [row["duration"] for row in rows if _timing_key(json.loads(row["options"])) == wanted][:HISTORY_SIZE]
+        if not durations:
+            return None
+        durations.sort()
+        middle = len(durations) // 2
+        return durations[middle] if len(durations) % 2 else (durations[middle - 1] + durations[middle]) / 2
+
+    def create_batch(
+        self,
+        scenes: list[str],
+        quality: str,
+        transparent: bool = False,
+        options: dict | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> str:
+        """
+        Add one job per scene under a new batch id, with its expected duration.
+
+        Args:
+            scenes (list[str]): Scene names.
+            quality (str): Quality flag (e.g. "ql").
+            transparent (bool, optional): Render with alpha channel. Defaults to False.
+            options (dict | None, optional): Extra render options (derive, parallel, ...). Defaults to None.
+            max_attempts (int, optional): Attempts per job before it is marked failed. Defaults to 3.
+
+        Returns:
+            str: The batch id.
+        """
+        batch = time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:6]
+        now = time.time()
+        # a partial render says nothing about the full one
+        partial = bool((options or {}).get("sections"))
+        estimates = [None if partial else self.estimate_duration(scene, quality, transparent, options) for scene in scenes]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO jobs (batch, scene, quality, transparent, options, max_attempts, created_at, estimate) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (batch, scene, quality, int(transparent), json.dumps(options or {}), max_attempts, now, estimate)
+                    for scene, estimate in zip(scenes, estimates)
+                ],
+            )
+        return batch
+
+    def latest_batch(self) -> str | None:
+        """Return the most recent batch (that of the last render command)"""
+        with self._lock:
+            row = self._conn.execute("SELECT batch FROM jobs ORDER BY id DESC LIMIT 1").fetchone()
+        return row["batch"] if row else None
+
+    def unfinished_batches(self, limit: int = 5) -> list[tuple[str, int, int, float]]:
+        """The most recent batches that still have jobs to render: (batch, done, total, created_at)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT batch, SUM(status = ?) AS done, COUNT(*) AS total, MIN(created_at) AS created_at "
+                "FROM jobs GROUP BY batch HAVING done < total ORDER BY MAX(id) DESC LIMIT ?",
+                (DONE, limit),
+            ).fetchall()
+        return [(row["batch"], row["done"], row["total"], row["created_at"]) for row in rows]
+
+    def prepare_resume(self, batch: str) -> None:
+        """
+        Requeue the unfinished jobs of a batch: jobs left `running` by a dead process
+        and failed jobs (with a fresh set of attempts). Completed jobs are kept.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, next_attempt_at = 0 WHERE batch = ? AND status = ?",
+                (PENDING, batch, RUNNING),
+            )
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, next_attempt_at = 0 WHERE batch = ? AND status = ?",
+                (PENDING, batch, FAILED),
+            )
+
+    def claim(self, batch: str) -> RenderJob | None:
+        """
+        Atomically take the next pending job whose backoff has elapsed.
+
+        Longest expected job first (LPT): a long scene started last would leave the other
+        workers idle while it renders. Scenes without history may be long, they go first.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE batch = ? AND status = ? AND next_attempt_at <= ? "
+                    "ORDER BY estimate IS NULL DESC, estimate DESC, id LIMIT 1",
+                    (batch, PENDING, time.time()),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ? WHERE id = ?",
+                        (RUNNING, time.time(), row["id"]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job = self._to_job(row)
+        job.status = RUNNING
+        job.attempts += 1
+        return job
+
+    def complete(self, job: RenderJob, output_path: Path | None, duration: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, duration = ?, output_path = ?, error = NULL "
+                "WHERE id = ?",
+                (DONE, time.time(), duration, str(output_path) if output_path else None, job.id),
+            )
+
+    def fail(self, job: RenderJob, error: str, backoff: float = DEFAULT_BACKOFF) -> bool:
+        """
+        Record a failed attempt: the job is retried after an exponential backoff
+        until it runs out of attempts.
+
+        Returns:
+            bool: True if the job will be retried.
+        """
+        retry = job.attempts < job.max_attempts
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, next_attempt_at = ?, finished_at = ?, error = ? WHERE id = ?",
+                (
+                    PENDING if retry else FAILED,
+                    time.time() + backoff * 2 ** (job.attempts - 1),
+                    time.time(),
+                    error,
+                    job.id,
+                ),
+            )
+        return retry
+
+    def release(self, job: RenderJob) -> None:
+        """Put a cancelled job back without counting the attempt"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), next_attempt_at = 0 WHERE id = ?",
+                (PENDING, job.id),
+            )
+
+    def next_attempt_in(self, batch: str) -> float | None:
+        """
+        Seconds until the next pending job can be claimed, 0 if jobs are still running
+        (they may fail and come back), or None if the batch has nothing left to do.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) AS next_at FROM jobs WHERE batch = ? AND status IN (?, ?)",
+                (batch, PENDING, RUNNING),
+            ).fetchone()
+        if row["next_at"] is None:
+            return None
+        return max(row["next_at"] - time.time(), 0.0)
+
+    def jobs(self, batch: str) -> list[RenderJob]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM jobs WHERE batch = ? ORDER BY id", (batch,)).fetchall()
+        return [self._to_job(row) for row in rows]
+
+
+def format_seconds(seconds: float) -> str:
+    """`42s`, `3m05s`, `1h20m`"""
+    hours, rest = divmod(round(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def predict_makespan(durations: list[float], workers: int) -> float:
+    """
+    Wall time of rendering jobs of the given durations, in that order, on `workers` workers
+    (each job goes to the first free worker, as in `drain_queue`).
+    """
+    loads = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
+
+
+def drain_queue(
+    queue: RenderQueue,
+    batch: str,
+    render_job: Callable[[RenderJob, threading.Event], Path | None],
+    workers: int = 1,
+    backoff: float = DEFAULT_BACKOFF,
+    poll_interval: float = 1.0,
+) -> bool:
+    """
+    Render the jobs of a batch with `workers` threads until none are left.
+
+    `render_job(job, cancel_event)` renders one job and returns its output path; it
+    raises on failure (the job is retried with backoff) or RenderCancelledError once
+    `cancel_event` is set. Ctrl+C sets the event, the running jobs are put back in the
+    queue untouched so that `--resume` picks them up.
+
+    Args:
+        queue (RenderQueue): The queue.
+        batch (str): The batch to drain.
+        render_job (Callable[[RenderJob, threading.Event], Path | None]): Renders a job.
+        workers (int, optional): Number of concurrent renders. Defaults to 1.
+        backoff (float, optional): Base retry delay in seconds. Defaults to 5.0.
+        poll_interval (float, optional): Max sleep while waiting for a retry. Defaults to 1.0.
+
+    Returns:
+        bool: False if the batch was cancelled.
+    """
+    cancel_event = threading.Event()
+
+    def worker():
+        while not cancel_event.is_set():
+            job = queue.claim(batch)
+            if job is None:
+                wait = queue.next_attempt_in(batch)
+                if wait is None:
+                    return
+                # 0 means other jobs are still running
+                cancel_event.wait(min(wait, poll_interval) or poll_interval)
+                continue
+
+            start = time.perf_counter()
+            try:
+                output_path = render_job(job, cancel_event)
+            except RenderCancelledError:
+                queue.release(job)
+            except Exception as e:
+                if queue.fail(job, str(e), backoff):
+                    delay = backoff * 2 ** (job.attempts - 1)
+                    print(f"🔁 {job.scene}: attempt {job.attempts}/{job.max_attempts} failed ({e}), retrying in {delay:.0f}s")
+                else:
+                    print(f"❌ {job.scene}: giving up after {job.attempts} attempts ({e})")
+            else:
+                queue.complete(job, output_path, time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, workers))]
+    for thread in threads:
+        thread.start()
+    try:
+        # join with a timeout, a bare join() would not let Ctrl+C through
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=0.2)
+    except KeyboardInterrupt:
+        print("\n🛑 Cancelling running renders...")
+        cancel_event.set()
+        for thread in threads:
+            thread.join()
+        return False
+    return True
@@ -0,0 +1,393 @@
+"""
+Estimate what rendering scenes will cost before rendering them.
+
+The static analysis (no manim needed) follows `construct` through the scene's own methods
+and adds up the `run_time`s of the `play`/`wait` calls, counting `always_redraw` updaters
+and TeX/Text constructions on the way. The dry run replays `construct` in the render
+environment without writing frames, for the exact animation time, the peak number of
+mobjects and the TeX/Text actually built (cached texts are not rebuilt). Frame counts and
+render times are then given per quality, calibrated on the past render times of the queue.
+
+    python render.py --estimate IntroToTrigonometry --dry-run
+    python -m src.utils.scene_cost --json            # static report of every scene, for CI
+"""
+import ast
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+from src.utils.config import BASE_DIR, CACHE_DIR, QUALITIES, SOURCES_DIR
+from src.utils.manim_scenes_finder import find_scene_by_name, get_all_scenes
+
+COST_DIR = CACHE_DIR / "cost"
+
+DEFAULT_RUN_TIME = 1.0  # manim's default for play and wait
+# render speed assumed without any render history (Cairo, a lecture scene of average complexity)
+DEFAULT_SECONDS_PER_MEGAPIXEL_FRAME = 0.02
+
+_TEX_CLASSES = {"Tex", "MathTex", "SingleStringMathTex"}
+_TEXT_CLASSES = {"Text", "MarkupText", "Paragraph", "cached_text"}
+
+
+def _literal_number(node: ast.expr | None) -> float | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        return float(node.value)
+    return None
+
+
+def _keyword(call: ast.Call, name: str) -> ast.expr | None:
+    return next((keyword.value for keyword in call.keywords if keyword.arg == name), None)
+
+
+def _called_name(call: ast.Call) -> str | None:
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _play_run_time(call: ast.Call) -> float:
+    """`run_time` of a play: its own, else the longest literal one of its animations"""
+    run_time = _literal_number(_keyword(call, "run_time"))
+    if run_time is not None:
+        return run_time
+    run_times = [
+        _literal_number(_keyword(arg, "run_time")) for arg in call.args if isinstance(arg, ast.Call)
+    ]
+    return max((value for value in run_times if value is not None), default=DEFAULT_RUN_TIME)
+
+
+class StaticCost:
+    """What the AST of a scene says about its cost (calls in loops are counted once)"""
+
+    def __init__(self):
+        self.plays = 0
+        self.waits = 0
+        self.animation_time = 0.0
+        self.always_redraw = 0
+        self.tex = 0
+        self.text = 0
+        self.in_loops = 0  # play/wait calls inside loops, repeated an unknown number of times
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+
+class _ConstructVisitor(ast.NodeVisitor):
+    """Walk `construct` and the methods it calls on `self`"""
+
+    def __init__(self, methods: dict[str, ast.FunctionDef]):
+        self.methods = methods
+        self.cost = StaticCost()
+        self._stack: list[str] = []
+        self._loops = 0
+
+    def visit_method(self, name: str) -> None:
+        if name not in self.methods or name in self._stack:  # recursion is not followed
+            return
+        self._stack.append(name)
+        for statement in self.methods[name].body:
+            self.visit(statement)
+        self._stack.pop()
+
+    def _visit_loop(self, node: ast.AST) -> None:
+        self._loops += 1
+        self.generic_visit(node)
+        self._loops -= 1
+
+    visit_For = visit_While = visit_ListComp = visit_GeneratorExp = visit_SetComp = visit_DictComp = _visit_loop
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        # `always_redraw(lambda: MathTex(...))` rebuilds on every frame, don't count it as one
+        pass
+
+    def visit_Call(self, node: ast.Call) -> None:
+        name = _called_name(node)
+        on_self = isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name) and node.func.value.id == "self"
+        cost = self.cost
+        if on_self and name == "play":
+            cost.plays += 1
+            cost.animation_time += _play_run_time(node)
+            cost.in_loops += bool(self._loops)
+        elif on_self and name == "wait":
+            cost.waits += 1
+            argument = node.args[0] if node.args else _keyword(node, "duration")
+            duration = _literal_number(argument)
+            cost.animation_time += DEFAULT_RUN_TIME if duration is None else duration
+            cost.in_loops += bool(self._loops)
+        elif name == "always_redraw":
+            cost.always_redraw += 1
+        elif name in _TEX_CLASSES:
+            cost.tex += 1
+        elif name in _TEXT_CLASSES:
+            cost.text += 1
+        self.generic_visit(node)
+        if on_self and name in self.methods:
+            self.visit_method(name)
+
+
+def analyze_scene(source_file: Path, class_name: str) -> StaticCost:
+    """
+    Statically estimate the cost of a scene from its source.
+
+    Args:
+        source_file (Path): The module defining the scene.
+        class_name (str): The scene class name.
+
+    Returns:
+        StaticCost: Plays, waits, animation time, updaters and TeX/Text constructions.
+    """
+    tree = ast.parse(source_file.read_text(encoding="utf-8"), filename=str(source_file))
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    methods: dict[str, ast.FunctionDef] = {}
+    # the scene's methods override those of its project base classes (same module)
+    lineage, klass = [], classes.get(class_name)
+    while klass is not None and klass not in lineage:
+        lineage.append(klass)
+        bases = [base.id for base in klass.bases if isinstance(base, ast.Name)]
+        klass = next((classes[base] for base in bases if base in classes), None)
+    for klass in reversed(lineage):
+        methods.update({node.name: node for node in klass.body if isinstance(node, ast.FunctionDef)})
+
+    visitor = _ConstructVisitor(methods)
+    visitor.visit_method("construct")
+    return visitor.cost
+
+
+def dry_run(file_name: str, class_name: str) -> dict:
+    """
+    Replay `construct` without writing frames and measure the scene (runs in the render environment).
+
+    Returns:
+        dict: animation_time, plays, peak_family, peak_updaters, tex, text, always_redraw.
+    """
+    import threading
+
+    import manim
+    from manim import MarkupText, MathTex, SingleStringMathTex, Text
+
+    from src.utils.scene_probe import PlayRecorder, configure, load_scene_class, run_scene
+
+    counts = {"tex": 0, "text": 0, "always_redraw": 0}
+    state = threading.local()
+
+    def counting(method, key):
+        def wrapper(self, *args, **kwargs):
+            depth = getattr(state, "depth", 0)
+            if not depth:  # count what the scene builds, not the pieces a MathTex builds for its substrings
+                counts[key] += 1
+            state.depth = depth + 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                state.depth = depth
+
+        return wrapper
+
+    original_always_redraw = manim.always_redraw
+
+    def always_redraw(*args, **kwargs):
+        counts["always_redraw"] += 1
+        return original_always_redraw(*args, **kwargs)
+
+    peaks = {"family": 0, "updaters": 0}
+
+    def measure(scene, _index):
+        family = scene.get_mobject_family_members()
+        peaks["family"] = max(peaks["family"], len(family))
+        peaks["updaters"] = max(peaks["updaters"], sum(1 for mobject in family if mobject.updaters))
+
+    patched = [(SingleStringMathTex, "tex"), (MathTex, "tex"), (Text, "text"), (MarkupText, "text")]
+    originals = [(klass, klass.__init__) for klass, _ in patched]
+    for klass, key in patched:
+        klass.__init__ = counting(klass.__init__, key)
+    manim.always_redraw = always_redraw  # before the scene module runs `from manim import *`
+    try:
+        configure(file_name)
+        recorder = PlayRecorder()
+        recorder.callbacks.append(measure)
+        recorder.install()
+        run_scene(load_scene_class(file_name, class_name), skip_all=True)
+    finally:
+        for klass, init in originals:
+            klass.__init__ = init
+        manim.always_redraw = original_always_redraw
+
+    return {
+        "animation_time": sum(recorder.durations),
+        "plays": len(recorder.durations),
+        "peak_family": peaks["family"],
+        "peak_updaters": peaks["updaters"],
+        **counts,
+    }
+
+
+def frame_counts(animation_time: float) -> dict[str, int]:
+    """Frames of every quality for an animation time"""
+    return {quality: round(animation_time * fps) for quality, (_, _, fps) in QUALITIES.items()}
+
+
+def estimate_render_times(
+    animation_time: float,
+    history: dict[str, float],
+    seconds_per_megapixel_frame: float = DEFAULT_SECONDS_PER_MEGAPIXEL_FRAME,
+) -> dict[str, tuple[float, str]]:
+    """
+    Render time of every quality, from the scene's history when there is one.
+
+    Args:
+        animation_time (float): Seconds of animation.
+        history (dict[str, float]): Past render times of the scene, by quality.
+        seconds_per_megapixel_frame (float, optional): Render speed used without history.
+
+    Returns:
+        dict[str, tuple[float, str]]: quality -> (seconds, where the number comes from).
+    """
+    def work(quality: str) -> float:
+        width, height, fps = QUALITIES[quality]
+        return animation_time * fps * width * height / 1e6
+
+    estimates = {}
+    for quality in QUALITIES:
+        if quality in history:
+            estimates[quality] = (history[quality], "history")
+        elif history:
+            # the same scene at another quality: scale by the pixels to draw
+            known = max(history, key=lambda q: QUALITIES[q][1])
+            ratio = work(quality) / work(known) if work(known) else 0.0
+            estimates[quality] = (history[known] * ratio, f"scaled from -{known}")
+        else:
+            estimates[quality] = (work(quality) * seconds_per_megapixel_frame, "rough")
+    return estimates
+
+
+def scene_source(scene_name: str) -> tuple[Path, str] | None:
+    module_path, class_name = find_scene_by_name(scene_name)
+    if not class_name:
+        return None
+    return (SOURCES_DIR / module_path.replace(".", "/")).with_suffix(".py"), class_name
+
+
+def all_scene_names() -> list[str]:
+    return [class_name for _, class_name in get_all_scenes()]
+
+
+def run_dry(project_dir: Path, image: str | None, file_name: str, class_name: str) -> dict | None:
+    """Run `dry_run` in the render environment (`image` None: the project venv), None if it fails"""
+    from src.utils.render_backend import render_command, render_env
+
+    result_path = COST_DIR / f"{class_name}.json"
+    command = render_command(
+        project_dir, image,
+        ["python", "-m", "src.utils.scene_cost", "--dry-run", file_name, class_name,
+         result_path.relative_to(BASE_DIR).as_posix()],
+    )
+    result = subprocess.run(command, capture_output=True, text=True, cwd=project_dir, env=render_env(project_dir, image))
+    if result.returncode != 0:
+        print(f"⚠️  Dry run of {class_name} failed:\n{result.stderr.strip()[-1000:]}")
+        return None
+    return json.loads(result_path.read_text(encoding="utf-8"))
+
+
+def report_costs(
+    scene_names: list[str],
+    history=None,
+    transparent: bool = False,
+    project_dir: Path = BASE_DIR,
+    image: str | None = None,
+    dry: bool = False,
+    verbose: bool = True,
+) -> dict[str, dict]:
+    """
+    Print the expected frames and render time of scenes at every quality, and their totals.
+
+    Args:
+        scene_names (list[str]): Scene names.
+        history (RenderQueue | None, optional): Queue whose past renders calibrate the times. Defaults to None.
+        transparent (bool, optional): Look up the history of transparent renders. Defaults to False.
+        project_dir (Path, optional): The project root. Defaults to BASE_DIR.
+        image (str | None, optional): Render image of the dry runs, None for the local backend.
+        dry (bool, optional): Also replay `construct` (exact times, peak mobjects). Defaults to False.
+        verbose (bool, optional): Print the report. Defaults to True.
+
+    Returns:
+        dict[str, dict]: Per scene: the static cost, the dry run (or None), frames and times per quality.
+    """
+    from src.utils.render_queue import format_seconds
+
+    report = {}
+    totals = dict.fromkeys(QUALITIES, 0.0)
+    for name in scene_names:
+        source = scene_source(name)
+        if source is None:
+            print(f"❌ Scene '{name}' not found")
+            continue
+        source_file, class_name = source
+        static = analyze_scene(source_file, class_name)
+        measured = run_dry(project_dir, image, source_file.relative_to(project_dir).as_posix(), class_name) if dry else None
+        animation_time = measured["animation_time"] if measured else static.animation_time
+
+        past = {}
+        if history is not None:
+            for quality in QUALITIES:
+                seconds = history.estimate_duration(class_name, quality, transparent)
+                if seconds is not None:
+                    past[quality] = seconds
+        times = estimate_render_times(animation_time, past)
+        frames = frame_counts(animation_time)
+        for quality, (seconds, _) in times.items():
+            totals[quality] += seconds
+        report[class_name] = {
+            "static": static.to_dict(),
+            "dry_run": measured, "frames": frames,
+            "seconds": {quality: {"seconds": round(seconds, 1), "from": kind} for quality, (seconds, kind) in times.items()},
+        }
+        if not verbose:
+            continue
+
+        loops = f", {static.in_loops} in loops counted once" if static.in_loops and not measured else ""
+        print(f"\n📐 {class_name} ({source_file.relative_to(project_dir).as_posix()})")
+        print(
+            f"   {static.plays} plays, {static.waits} waits{loops}: {animation_time:.1f}s of animation"
+            + (f" (dry run, static: {static.animation_time:.1f}s)" if measured else " (static)")
+        )
+        if measured:
+            print(
+                f"   {measured['always_redraw']} always_redraw, {measured['tex']} TeX and {measured['text']} Text built, "
+                f"peak {measured['peak_family']} mobjects ({measured['peak_updaters']} with updaters)"
+            )
+        else:
+            print(f"   {static.always_redraw} always_redraw, {static.tex} TeX and {static.text} Text in the source")
+        for quality, (seconds, source_kind) in times.items():
+            print(f"   -{quality}: {frames[quality]:>6} frames, ~{format_seconds(seconds)} ({source_kind})")
+
+    if verbose and len(report) > 1:
+        print("\n⏱️  Total: " + ", ".join(f"-{quality} ~{format_seconds(seconds)}" for quality, seconds in totals.items()))
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Expected render cost of scenes (static, no manim needed)")
+    parser.add_argument("scenes", nargs="?", help="Comma-separated scene names (default: all)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--dry-run", nargs=3, metavar=("FILE", "SCENE", "RESULT"),
+                        help="(render environment) replay a scene without frames, write the JSON result")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        file_name, class_name, result_path = args.dry_run
+        Path(result_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(result_path).write_text(json.dumps(dry_run(file_name, class_name)), encoding="utf-8")
+        raise SystemExit(0)
+
+    from src.utils.render_queue import RenderQueue
+
+    names = [name.strip() for name in args.scenes.split(",")] if args.scenes else all_scene_names()
+    queue = RenderQueue()
+    report = report_costs(names, queue, verbose=not args.json)
+    queue.close()
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
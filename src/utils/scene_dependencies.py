@@ -0,0 +1,227 @@
+import os
+import ast
+import hashlib
+from pathlib import Path
+from dataclasses import dataclass, field
+
+from src.utils import config
+from src.utils.config import ASSETS_DIR, BASE_DIR, SOURCES_DIR
+from src.utils.manim_scenes_finder import _iter_source_files, get_all_scenes
+
+
+@dataclass
+class ModuleInfo:
+    """What a project module depends on, and hashes to tell which part of it changed"""
+
+    path: Path
+    imports: set[Path] = field(default_factory=set)  # project modules imported directly
+    assets: set[Path] = field(default_factory=set)  # asset files and directories referenced
+    top_level_hash: str = ""  # everything but the class definitions
+    class_hashes: dict[str, str] = field(default_factory=dict)
+    class_refs: dict[str, set[str]] = field(default_factory=dict)  # names used by each class
+
+
+def _hash_nodes(nodes: list[ast.AST]) -> str:
+    # ast.dump ignores formatting and comments, saving a file unchanged triggers nothing
+    return hashlib.sha1("\n".join(ast.dump(node) for node in nodes).encode("utf-8")).hexdigest()
+
+
+def _resolve_module(name: str) -> Path | None:
+    """Map a dotted module name to a project source file (None for third-party modules)"""
+    path = BASE_DIR / Path(*name.split("."))
+    if path.with_suffix(".py").is_file():
+        return path.with_suffix(".py")
+    return None
+
+
+def _asset_path(value: object, must_exist: bool = True) -> Path | None:
+    """Return the asset path a config constant or string literal points to, if any"""
+    if not isinstance(value, (str, Path)) or not str(value).strip():
+        return None
+    path = Path(value)
+    if not path.is_absolute():
+        path = BASE_DIR / path
+    try:
+        path.resolve().relative_to(ASSETS_DIR.resolve())
+    except (ValueError, OSError):
+        return None
+    if must_exist and not path.exists():
+        return None
+    return path
+
+
+def parse_module(path: Path) -> ModuleInfo | None:
+    """
+    Statically extract the dependencies of a module.
+
+    Assets are the `*_DIR` constants imported from `src.utils.config` that point into the
+    assets folder, and string literals naming an existing file under it.
+
+    Returns:
+        ModuleInfo | None: The module info, or None if the file can't be parsed.
+    """
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+
+    info = ModuleInfo(path=path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if (module := _resolve_module(alias.name)) is not None:
+                    info.imports.add(module)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            if (module := _resolve_module(node.module)) is not None:
+                info.imports.add(module)
+            for alias in node.names:  # `from src.utils import config`
+                if (module := _resolve_module(f"{node.module}.{alias.name}")) is not None:
+                    info.imports.add(module)
+            if node.module == config.__name__:
+                for alias in node.names:
+                    # generated folders (sprite poses) may not exist yet
+                    value = getattr(config, alias.name, None)
+                    if (asset := _asset_path(value, must_exist=False)) is not None:
+                        info.assets.add(asset)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) and len(node.value) < 256:
+            # the assets folder itself is only named by config.py
+            if (asset := _asset_path(node.value)) is not None and asset.resolve() != ASSETS_DIR.resolve():
+                info.assets.add(asset)
+
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    info.top_level_hash = _hash_nodes([node for node in tree.body if not isinstance(node, ast.ClassDef)])
+    for node in classes:
+        info.class_hashes[node.name] = _hash_nodes([node])
+        info.class_refs[node.name] = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+    return info
+
+
+def _changed_classes(old: ModuleInfo, new: ModuleInfo) -> set[str]:
+    """Classes that changed, plus the classes of the module using them (bases, helpers)"""
+    changed = {
+        name
+        for name in old.class_hashes.keys() | new.class_hashes.keys()
+        if old.class_hashes.get(name) != new.class_hashes.get(name)
+    }
+    grown = True
+    while grown:
+        grown = False
+        for name, refs in new.class_refs.items():
+            if name not in changed and refs & changed:
+                changed.add(name)
+                grown = True
+    return changed
+
+
+class DependencyGraph:
+    """
+    Dependency graph from every scene to its module, the project modules it imports
+    (transitively) and the asset files they reference.
+    """
+
+    def __init__(self, sources_dir: Path = SOURCES_DIR):
+        self.sources_dir = sources_dir
+        self.modules: dict[Path, ModuleInfo] = {}
+        self.scenes: dict[str, Path] = {}  # scene name -> module path
+
+    def build(self) -> "DependencyGraph":
+        self.modules = {}
+        for path in _iter_source_files(self.sources_dir):
+            self._load(path.resolve())
+        self._load_scenes()
+        return self
+
+    def _load(self, path: Path) -> None:
+        info = parse_module(path)
+        if info is None:
+            return
+        self.modules[path] = info
+        for module in info.imports:  # modules outside the sources folder
+            if module.resolve() not in self.modules:
+                self._load(module.resolve())
+
+    def _load_scenes(self) -> None:
+        self.scenes = {
+            class_name: Path(module_path.split("#")[0]).resolve() for module_path, class_name in get_all_scenes()
+        }
+
+    def dependencies(self, path: Path) -> set[Path]:
+        """All the project modules a module imports, directly or not (itself excluded)"""
+        seen = set()
+        stack = [path]
+        while stack:
+            info = self.modules.get(stack.pop())
+            if info is None:
+                continue
+            for module in info.imports:
+                module = module.resolve()
+                if module not in seen and module != path:
+                    seen.add(module)
+                    stack.append(module)
+        return seen
+
+    def watched_files(self) -> set[Path]:
+        """Every module the scenes depend on and every file of the assets they reference"""
+        files = set()
+        for path in set(self.scenes.values()):
+            files.add(path)
+            files.update(self.dependencies(path))
+        for info in [self.modules[path] for path in files if path in self.modules]:
+            for asset in info.assets:
+                if asset.is_dir():
+                    for root, _, names in os.walk(asset):
+                        files.update(Path(root, name).resolve() for name in names)
+                else:
+                    files.add(asset.resolve())
+        return files
+
+    def update(self, changed_files: set[Path]) -> set[str]:
+        """
+        Re-parse the changed files and return the scenes they affect.
+
+        A scene is affected if its class (or a class of its module it uses) changed, if
+        the rest of its module changed, or if any module it imports or any asset those
+        modules reference changed.
+
+        Args:
+            changed_files (set[Path]): Files created, modified or deleted.
+
+        Returns:
+            set[str]: Names of the affected scenes.
+        """
+        changed_files = {path.resolve() for path in changed_files}
+        whole_modules = set()  # modules whose every scene is affected
+        changed_classes: dict[Path, set[str]] = {}
+
+        for path in changed_files:
+            if path.suffix != ".py":
+                continue
+            old = self.modules.pop(path, None)
+            if path.exists():
+                self._load(path)
+            new = self.modules.get(path)
+            if old is None or new is None or old.top_level_hash != new.top_level_hash or old.imports != new.imports:
+                whole_modules.add(path)
+            else:
+                changed_classes[path] = _changed_classes(old, new)
+                # a non-scene module (helpers like ManimSprite) affects its importers
+                if changed_classes[path] and path not in self.scenes.values():
+                    whole_modules.add(path)
+
+        for path, info in self.modules.items():
+            for asset in info.assets:
+                asset = asset.resolve()
+                if any(file == asset or asset in file.parents for file in changed_files):
+                    whole_modules.add(path)
+
+        self._load_scenes()
+
+        affected = set()
+        for scene, path in self.scenes.items():
+            if (
+                path in whole_modules
+                or scene in changed_classes.get(path, ())
+                or self.dependencies(path) & whole_modules
+            ):
+                affected.add(scene)
+        return affected
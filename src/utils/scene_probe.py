@@ -0,0 +1,165 @@
+"""
+Run a scene in-process with hooks on every `play` call.
+
+This is executed inside the render environment (it imports manim), e.g.:
+    python -m src.utils.scene_probe src/animations_lectures/24_1.py IntroToTrigonometry --count --result out.json
+    python -m src.utils.scene_probe src/animations_lectures/24_1.py IntroToTrigonometry --range 10,19 -qh --result out.json
+
+Every play is fingerprinted (hash of the scene state after it), so runs that replay
+`construct` can be checked to be deterministic against each other.
+"""
+import sys
+import json
+import hashlib
+import argparse
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+from manim import Scene, config
+
+from src.utils.config import BASE_DIR
+
+MANIM_QUALITIES = {
+    "ql": "low_quality",
+    "qm": "medium_quality",
+    "qh": "high_quality",
+    "qp": "production_quality",
+    "qk": "fourk_quality",
+}
+
+# fixed seed, so that every replay of `construct` makes the same random choices
+RANDOM_SEED = 0
+
+
+def load_module(file_name: str | Path) -> ModuleType:
+    """Import a project module from its file (under its dotted name, like the project imports it)"""
+    path = Path(file_name).resolve()
+    try:
+        module_name = ".".join(path.relative_to(BASE_DIR).with_suffix("").parts)
+    except ValueError:
+        module_name = path.stem
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_scene_class(file_name: str | Path, class_name: str) -> type[Scene]:
+    """Import the scene module from its file and return the scene class"""
+    return getattr(load_module(file_name), class_name)
+
+
+def fingerprint(scene: Scene) -> str:
+    """Hash of the current scene state (mobject types, points and colors)"""
+    digest = hashlib.sha1()
+    for mobject in scene.mobjects:
+        for sub in mobject.get_family():
+            digest.update(type(sub).__name__.encode())
+            # rounding (and +0.0 for -0.0) hides float noise between skipped and rendered plays
+            digest.update((np.round(sub.points, 4) + 0.0).tobytes())
+            for attr in ("fill_rgbas", "stroke_rgbas"):
+                rgbas = getattr(sub, attr, None)
+                if rgbas is not None:
+                    digest.update((np.round(rgbas, 4) + 0.0).tobytes())
+    return digest.hexdigest()
+
+
+class PlayRecorder:
+    """Wraps `Scene.play` to record a fingerprint and the run time of every play"""
+
+    def __init__(self):
+        self.fingerprints: list[str] = []
+        self.durations: list[float] = []
+        self.callbacks = []
+
+    def install(self):
+        original_play = Scene.play
+        recorder = self
+
+        def play(scene: Scene, *args, **kwargs):
+            original_play(scene, *args, **kwargs)
+            recorder.fingerprints.append(fingerprint(scene))
+            recorder.durations.append(float(scene.duration))
+            for callback in recorder.callbacks:
+                callback(scene, len(recorder.fingerprints) - 1)
+
+        Scene.play = play
+
+
+def configure(file_name: str | Path, quality: str = "ql", transparent: bool = False, video_dir: str | None = None):
+    """
+    Apply the render settings that `manim <file> <Scene> -<quality>` would apply
+    (`video_dir` moves the movie and its partial movie files, TeX and Text stay in the shared media dir)
+    """
+    config.quality = MANIM_QUALITIES[quality]
+    config.input_file = str(Path(file_name).resolve())
+    if transparent:
+        config.transparent = True
+    if video_dir is not None:
+        config.video_dir = video_dir
+
+
+def run_scene(scene_class: type[Scene], skip_all: bool = False) -> Scene:
+    """Render the scene; with `skip_all` every animation is fast-forwarded and nothing is written"""
+    scene_class.random_seed = RANDOM_SEED
+    if skip_all:
+        config.write_to_movie = False
+        config.save_last_frame = False
+    scene = scene_class()
+    if skip_all:
+        scene.renderer._original_skipping_status = True
+        scene.renderer.skip_animations = True
+    scene.render()
+    return scene
+
+
+def main(argv: list[str] | None = None) -> dict:
+    parser = argparse.ArgumentParser(description="Run a scene with play hooks")
+    parser.add_argument("file", help="Scene source file (relative to the project root)")
+    parser.add_argument("scene", help="Scene class name")
+    parser.add_argument("--result", required=True, help="Where to write the JSON result")
+    parser.add_argument("--count", action="store_true", help="Only replay construct (no frames) and count plays")
+    parser.add_argument("--range", help="Render only plays START,END (inclusive)")
+    parser.add_argument("--output-file", help="Name of the output movie (without extension)")
+    parser.add_argument("--video-dir", help="Video directory for this run (TeX and Text stay shared)")
+    parser.add_argument("-t", "--transparent", action="store_true")
+    for quality in MANIM_QUALITIES:
+        parser.add_argument(f"-{quality}", action="store_const", const=quality, dest="quality")
+    parser.set_defaults(quality="ql")
+    args = parser.parse_args(argv)
+
+    configure(args.file, args.quality, args.transparent, args.video_dir)
+    if args.range:
+        start, end = (int(x) for x in args.range.split(","))
+        config.from_animation_number = start
+        config.upto_animation_number = end
+    if args.output_file:
+        config.output_file = args.output_file
+
+    recorder = PlayRecorder()
+    recorder.install()
+    scene = run_scene(load_scene_class(args.file, args.scene), skip_all=args.count)
+
+    result = {
+        "fingerprints": recorder.fingerprints,
+        "durations": recorder.durations,
+        "movie": None,
+    }
+    if not args.count:
+        movie_path = getattr(scene.renderer.file_writer, "movie_file_path", None)
+        if movie_path:
+            result["movie"] = Path(movie_path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+
+    Path(args.result).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.result).write_text(json.dumps(result), encoding="utf-8")
+    return result
+
+
+if __name__ == "__main__":
+    main()
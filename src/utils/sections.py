@@ -0,0 +1,199 @@
+import os
+import ast
+import functools
+from pathlib import Path
+from typing import Callable
+
+# Comma-separated section names to render, set by `render.py --sections` (all if unset)
+SECTIONS_ENV = "KSE_SECTIONS"
+# Save/restore scene state checkpoints at section boundaries, set by `render.py --checkpoints`
+CHECKPOINTS_ENV = "KSE_CHECKPOINTS"
+
+_ANIMATE_PREFIX = "animate_"
+
+# A `--sections` render is written next to the full render as `<Scene>_sections_<a>_<b>`,
+# so it never replaces (and is never taken for) the video of the whole scene
+SECTIONS_OUTPUT_MARKER = "_sections_"
+
+
+def sections_output_name(class_name: str, sections: list[str]) -> str:
+    """Output name (manim's `-o`) of a render of the given sections of a scene"""
+    return f"{class_name}{SECTIONS_OUTPUT_MARKER}{'_'.join(sections)}"
+
+
+def is_sections_output(name: str) -> bool:
+    """Is `name` (a video stem) the output of a `--sections` render"""
+    return SECTIONS_OUTPUT_MARKER in name
+
+
+def section_name_of(method_name: str) -> str:
+    """Default section name of a method: `animate_sides_labels` -> `sides_labels`"""
+    return method_name.removeprefix(_ANIMATE_PREFIX)
+
+
+def selected_sections() -> set[str] | None:
+    """Return the sections selected with KSE_SECTIONS, or None to render them all"""
+    value = os.environ.get(SECTIONS_ENV, "")
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    return names or None
+
+
+def is_section_selected(name: str) -> bool:
+    selected = selected_sections()
+    return selected is None or name in selected
+
+
+def checkpoints_enabled() -> bool:
+    return os.environ.get(CHECKPOINTS_ENV, "") not in ("", "0")
+
+
+class _SectionRun:
+    """The sections a scene instance ran so far, and the checkpoint it resumes from"""
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.names: list[str] = []
+        self.methods: list[str] = []
+        self.returns: list = []
+        self.digest = None
+        self.resume = None
+        self.state = None
+        if checkpoints_enabled():
+            self._plan_resume()
+
+    @classmethod
+    def of(cls, scene) -> "_SectionRun":
+        run = scene.__dict__.get("_kse_sections")
+        if run is None:
+            run = scene._kse_sections = cls(scene)
+        return run
+
+    def _plan_resume(self) -> None:
+        # imported lazily: it imports manim, this module is also used by the host-side CLI
+        from src.utils.checkpoints import Checkpoint, CodeDigest
+
+        self.digest = CodeDigest(type(self.scene))
+        selected = selected_sections()
+        if not selected:
+            return
+        # resume at a selected section, without skipping another selected one
+        candidates = [
+            checkpoint
+            for checkpoint in Checkpoint.find(type(self.scene), self.digest)
+            if checkpoint.section in selected and not selected & set(checkpoint.path)
+        ]
+        if candidates:
+            self.resume = max(candidates, key=lambda checkpoint: len(checkpoint.path))
+            self.state = self.resume.load()
+
+    def _record(self, name: str, method: Callable, result):
+        self.names.append(name)
+        self.methods.append(method.__name__)
+        self.returns.append(result)
+        return result
+
+    def run(self, name: str, method: Callable, args: tuple, kwargs: dict):
+        if self.resume is not None:
+            from src.utils.checkpoints import Checkpoint
+
+            index = len(self.names)
+            if index < len(self.resume.path):
+                if name != self.resume.path[index]:
+                    raise RuntimeError(
+                        f"Section '{name}' was called where the checkpoint expects '{self.resume.path[index]}' "
+                        f"(non-deterministic construct?), delete {self.resume.file} and render again"
+                    )
+                # replaced by the checkpoint, the section is not executed at all
+                self.scene.next_section(name, skip_animations=True)
+                return self._record(name, method, self.state["returns"][index])
+
+            Checkpoint.restore(self.scene, self.state)
+            args, kwargs = self.state["args"], self.state["kwargs"]
+            self.returns = list(self.state["returns"])
+            print(f"⏩ {type(self.scene).__name__}: resumed at section '{name}' from a checkpoint, skipping {index} section(s)")
+            self.resume = self.state = None
+        elif self.digest is not None:
+            from src.utils.checkpoints import Checkpoint
+
+            key = self.digest.key(self.methods)
+            Checkpoint(type(self.scene), name, list(self.names), list(self.methods), key).save(
+                self.scene, self.returns, args, kwargs
+            )
+
+        self.scene.next_section(name, skip_animations=not is_section_selected(name))
+        return self._record(name, method, method(self.scene, *args, **kwargs))
+
+
+def section(name: str | None = None) -> Callable:
+    """
+    Mark a scene method as a named section.
+
+    Calling the method starts a new Manim section (`Scene.next_section`). Sections that
+    are not selected (see `render.py --sections`) are skipped: their animations are
+    fast-forwarded to the end state and nothing of them is encoded (manim still draws one
+    static frame per play), so the next section starts exactly where it would in a full render. With checkpoints on,
+    the scene state is saved at every section start and a partial render resumes from
+    the checkpoint of its first selected section (see `src/utils/checkpoints.py`).
+
+    Args:
+        name (str | None, optional): Section name. Defaults to the method name
+            without the `animate_` prefix.
+
+    Returns:
+        Callable: The decorator.
+
+    Example:
+        >>> class MyScene(Scene):
+        ...     @section()
+        ...     def animate_intro(self): ...
+    """
+
+    def decorator(method: Callable) -> Callable:
+        section_name = name or section_name_of(method.__name__)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return _SectionRun.of(self).run(section_name, method, args, kwargs)
+
+        wrapper.section_name = section_name
+        return wrapper
+
+    return decorator
+
+
+def _section_decorator_name(decorator: ast.expr, method_name: str) -> str | None:
+    """Return the section name if `decorator` is `@section(...)`"""
+    if not isinstance(decorator, ast.Call):
+        return None
+    func = decorator.func
+    func_name = func.id if isinstance(func, ast.Name) else func.attr if isinstance(func, ast.Attribute) else None
+    if func_name != "section":
+        return None
+    args = [*decorator.args, *(keyword.value for keyword in decorator.keywords if keyword.arg == "name")]
+    if args and isinstance(args[0], ast.Constant) and isinstance(args[0].value, str):
+        return args[0].value
+    return section_name_of(method_name)
+
+
+def get_scene_sections(source_file: Path, class_name: str) -> list[str]:
+    """
+    Statically list the sections of a scene (no manim import), in definition order.
+
+    Args:
+        source_file (Path): The module defining the scene.
+        class_name (str): The scene class name.
+
+    Returns:
+        list[str]: The section names.
+    """
+    tree = ast.parse(source_file.read_text(encoding="utf-8"), filename=str(source_file))
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            sections = []
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    for decorator in item.decorator_list:
+                        if (name := _section_decorator_name(decorator, item.name)) is not None:
+                            sections.append(name)
+            return sections
+    return []
@@ -0,0 +1,256 @@
+"""
+Adaptive streaming (HLS and DASH) packages of the rendered scenes and lectures.
+
+Every video is encoded once per rendition of the ladder (at most its own height), all
+the renditions of all the videos in parallel with ffmpeg, with keyframes on segment
+boundaries. The renditions are then segmented by stream copy into an HLS playlist each
+(fMP4 segments) with a master playlist, and into a DASH manifest from the same encodes.
+Packages are keyed by the source video content and the packaging settings:
+only videos that changed since their last packaging are re-encoded.
+
+    media/streaming/<module>/<Scene>/master.m3u8, manifest.mpd
+    media/streaming/lectures/<id>/master.m3u8, manifest.mpd
+"""
+import os
+import json
+import shutil
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.config import CACHE_DIR, LECTURES_OUTPUT_DIR, MANIM_DOCKER_IMAGE, MEDIA_DIR
+from src.utils.ffmpeg import run_ffmpeg, to_project_path
+from src.utils.lectures import probe_video
+from src.utils.sections import is_sections_output
+
+STREAMING_DIR = MEDIA_DIR / "streaming"
+STREAMING_WORK_DIR = CACHE_DIR / "streaming"
+PACKAGE_FILE = "package.json"  # what a package was built from (its key) and its renditions
+
+SEGMENT_SECONDS = 4
+AUDIO_BITRATE = 128_000
+
+# (height, video bitrate in bits/s): slow connections get 360p at 0.8 Mbit/s
+RENDITIONS = [
+    (1080, 5_000_000),
+    (720, 2_800_000),
+    (480, 1_400_000),
+    (360, 800_000),
+]
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def package_key(video: Path) -> str:
+    """Key of a package: the source video content and the packaging settings"""
+    settings = json.dumps([RENDITIONS, SEGMENT_SECONDS, AUDIO_BITRATE])
+    return hashlib.sha1(f"{_file_digest(video)}:{settings}".encode()).hexdigest()
+
+
+def streaming_sources(quality_folder: str, scenes: list[str] | None = None) -> dict[Path, Path]:
+    """
+    The videos to package at a quality: scene videos and assembled lectures.
+
+    Args:
+        quality_folder (str): The quality folder (e.g. "1080p60").
+        scenes (list[str] | None, optional): Only these scenes (and no lectures). Defaults to all.
+
+    Returns:
+        dict[Path, Path]: Source video -> its package directory.
+    """
+    sources = {}
+    for video in sorted((MEDIA_DIR / "videos").glob(f"*/{quality_folder}/*.mp4")):
+        if is_sections_output(video.stem):
+            continue  # a render of a few sections, not the scene
+        if scenes is None or video.stem in scenes:
+            module = video.parent.parent.name
+            sources[video] = STREAMING_DIR / module / video.stem
+    if scenes is None:
+        for video in sorted((LECTURES_OUTPUT_DIR / quality_folder).glob("*.mp4")):
+            sources[video] = STREAMING_DIR / "lectures" / video.stem
+    return sources
+
+
+def is_packaged(package_dir: Path, key: str) -> bool:
+    package_file = package_dir / PACKAGE_FILE
+    if not package_file.exists():
+        return False
+    return json.loads(package_file.read_text(encoding="utf-8")).get("key") == key
+
+
+def _renditions_for(height: int) -> list[tuple[int, int]]:
+    """The ladder renditions not taller than the source (the smallest one at least)"""
+    return [rendition for rendition in RENDITIONS if rendition[0] <= height] or [RENDITIONS[-1]]
+
+
+def _encode_rendition(
+    source: Path, target: Path, height: int, bitrate: int, has_audio: bool, project_dir: Path, image: str | None
+) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    args = [
+        "-y", "-loglevel", "error",
+        "-i", to_project_path(source, project_dir),
+        "-vf", f"scale=-2:{height}:flags=lanczos",
+        "-c:v", "libx264", "-profile:v", "high", "-pix_fmt", "yuv420p",
+        "-b:v", str(bitrate), "-maxrate", str(int(bitrate * 1.07)), "-bufsize", str(int(bitrate * 1.5)),
+        # a keyframe at every segment boundary, and only there, so all renditions switch cleanly
+        "-force_key_frames", f"expr:gte(t,n_forced*{SEGMENT_SECONDS})", "-sc_threshold", "0",
+        *(["-c:a", "aac", "-b:a", str(AUDIO_BITRATE), "-ac", "2"] if has_audio else ["-an"]),
+        to_project_path(target, project_dir),
+    ]
+    result = run_ffmpeg(args, project_dir, image=image)
+    if result.returncode != 0:
+        raise RuntimeError(f"Encoding {target.name} of {source} failed:\n{result.stderr[-2000:]}")
+
+
+def _segment_hls(rendition: Path, playlist: Path, project_dir: Path, image: str | None) -> None:
+    playlist.parent.mkdir(parents=True, exist_ok=True)
+    args = [
+        "-y", "-loglevel", "error",
+        "-i", to_project_path(rendition, project_dir),
+        "-c", "copy",
+        "-f", "hls", "-hls_time", str(SEGMENT_SECONDS), "-hls_playlist_type", "vod",
+        "-hls_segment_type", "fmp4", "-hls_fmp4_init_filename", "init.mp4",
+        "-hls_segment_filename", to_project_path(playlist.parent / "segment_%05d.m4s", project_dir),
+        to_project_path(playlist, project_dir),
+    ]
+    result = run_ffmpeg(args, project_dir, image=image)
+    if result.returncode != 0:
+        raise RuntimeError(f"HLS segmenting of {rendition.name} failed:\n{result.stderr[-2000:]}")
+
+
+def _segment_dash(renditions: list[Path], manifest: Path, has_audio: bool, project_dir: Path, image: str | None) -> None:
+    args = ["-y", "-loglevel", "error"]
+    for rendition in renditions:
+        args += ["-i", to_project_path(rendition, project_dir)]
+    for index in range(len(renditions)):
+        args += ["-map", f"{index}:v"]
+    if has_audio:
+        args += ["-map", "0:a"]
+    args += [
+        "-c", "copy",
+        "-f", "dash", "-seg_duration", str(SEGMENT_SECONDS), "-use_template", "1", "-use_timeline", "1",
+        "-init_seg_name", "dash/init-$RepresentationID$.m4s",
+        "-media_seg_name", "dash/chunk-$RepresentationID$-$Number%05d$.m4s",
+        "-adaptation_sets", "id=0,streams=v" + (" id=1,streams=a" if has_audio else ""),
+        to_project_path(manifest, project_dir),
+    ]
+    result = run_ffmpeg(args, project_dir, image=image)
+    if result.returncode != 0:
+        raise RuntimeError(f"DASH packaging of {manifest.parent} failed:\n{result.stderr[-2000:]}")
+
+
+def master_playlist(variants: list[tuple[str, int, int, int, float]]) -> str:
+    """
+    The HLS master playlist of the renditions.
+
+    Args:
+        variants (list[tuple[str, int, int, int, float]]): (playlist URI, peak bits/s, width, height, fps).
+
+    Returns:
+        str: The playlist, best rendition first.
+    """
+    lines = ["#EXTM3U", "#EXT-X-VERSION:7", "#EXT-X-INDEPENDENT-SEGMENTS"]
+    for uri, bandwidth, width, height, fps in variants:
+        lines.append(f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={width}x{height},FRAME-RATE={fps:.3f}")
+        lines.append(uri)
+    return "\n".join(lines) + "\n"
+
+
+def _fps(rate: str) -> float:
+    numerator, _, denominator = rate.partition("/")
+    return float(numerator) / float(denominator or 1)
+
+
+def package_videos(
+    sources: dict[Path, Path],
+    project_dir: Path,
+    image: str | None = MANIM_DOCKER_IMAGE,
+    workers: int = os.cpu_count() or 2,
+    force: bool = False,
+) -> list[Path]:
+    """
+    Build the HLS and DASH packages of videos whose package is missing or stale.
+
+    Args:
+        sources (dict[Path, Path]): Source video -> its package directory (see `streaming_sources`).
+        project_dir (Path): The project root (all the files must be inside it).
+        image (str | None, optional): Render image used when ffmpeg is not installed locally.
+        workers (int, optional): Concurrent ffmpeg processes. Defaults to the CPU count.
+        force (bool, optional): Re-package up-to-date videos too. Defaults to False.
+
+    Raises:
+        RuntimeError: If ffmpeg fails.
+
+    Returns:
+        list[Path]: The package directories that were (re)built.
+    """
+    stale = {}
+    for video, package_dir in sources.items():
+        key = package_key(video)
+        if force or not is_packaged(package_dir, key):
+            stale[video] = (package_dir, key)
+        else:
+            print(f"✅ {to_project_path(package_dir, project_dir)} is up to date")
+    if not stale:
+        return []
+
+    plans = {}
+    for video, (package_dir, key) in stale.items():
+        probe = probe_video(video, project_dir, image)
+        work_dir = STREAMING_WORK_DIR / package_dir.relative_to(STREAMING_DIR)
+        renditions = {
+            height: (work_dir / f"{height}p.mp4", bitrate) for height, bitrate in _renditions_for(probe["video"]["height"])
+        }
+        plans[video] = (package_dir, key, probe, renditions)
+    total = sum(len(plan[3]) for plan in plans.values())
+    print(f"📡 Packaging {len(plans)} video(s): {total} renditions on {workers} worker(s)")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # the encodes (the expensive part) of all the videos at once
+        encodes = [
+            pool.submit(_encode_rendition, video, path, height, bitrate, probe["audio"] is not None, project_dir, image)
+            for video, (_, _, probe, renditions) in plans.items()
+            for height, (path, bitrate) in renditions.items()
+        ]
+        for future in encodes:
+            future.result()
+
+        # then segmenting, by stream copy
+        segments = []
+        for video, (package_dir, _, probe, renditions) in plans.items():
+            shutil.rmtree(package_dir, ignore_errors=True)
+            package_dir.mkdir(parents=True)
+            for height, (path, _) in renditions.items():
+                segments.append(pool.submit(_segment_hls, path, package_dir / f"{height}p" / "index.m3u8", project_dir, image))
+            segments.append(pool.submit(
+                _segment_dash, [path for path, _ in renditions.values()], package_dir / "manifest.mpd",
+                probe["audio"] is not None, project_dir, image,
+            ))
+        for future in segments:
+            future.result()
+
+    for video, (package_dir, key, probe, renditions) in plans.items():
+        source_width, source_height = probe["video"]["width"], probe["video"]["height"]
+        fps = _fps(probe["video"]["r_frame_rate"])
+        audio = AUDIO_BITRATE if probe["audio"] is not None else 0
+        variants = [
+            # scaled with `-2`: even width, same aspect ratio
+            (f"{height}p/index.m3u8", int(bitrate * 1.07) + audio, round(source_width * height / source_height / 2) * 2, height, fps)
+            for height, (_, bitrate) in renditions.items()
+        ]
+        (package_dir / "master.m3u8").write_text(master_playlist(variants), encoding="utf-8")
+        (package_dir / PACKAGE_FILE).write_text(
+            json.dumps({"key": key, "source": to_project_path(video, project_dir), "renditions": list(renditions)}, indent=2),
+            encoding="utf-8",
+        )
+        for path, _ in renditions.values():
+            path.unlink(missing_ok=True)
+        print(f"📡 {to_project_path(package_dir, project_dir)}: {', '.join(f'{h}p' for h in renditions)} (HLS + DASH)")
+    return [package_dir for package_dir, *_ in plans.values()]
@@ -0,0 +1,232 @@
+"""
+Scene-wide opacity and color changes as single numpy operations.
+
+`set_fill`/`set_stroke`/`set_opacity` recurse through a mobject family in Python, and
+animating them per submobject (`obj.animate.set_fill(...)` for every glyph of every Tex)
+builds a copy of each family and conflicts as soon as a group and its children are both
+animated. `StyleBuffer` gathers the RGBA arrays of many mobjects into one array instead,
+changes them all at once and lets the mobjects read the result through views of it.
+"""
+from typing import Callable, Iterable
+
+import numpy as np
+from manim import Animation, Mobject, Scene, VMobject, ManimColor, ParsableManimColor
+
+# the per-point RGBA arrays the Cairo camera draws a VMobject with
+_RGBA_ATTRIBUTES = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+def _family_members(mobjects: Iterable[Mobject], exclude: Iterable[Mobject] = ()) -> tuple[list[Mobject], list[Mobject]]:
+    """
+    Unique family members of `mobjects` minus the families of `exclude`, split into the
+    static ones and the mobjects with updaters (`always_redraw` replaces their arrays, and
+    their style, every frame: their families are restyled after every update instead).
+    """
+    skipped = {id(member) for mobject in exclude for member in mobject.get_family()}
+    members: list[Mobject] = []
+    redrawn: list[Mobject] = []
+    stack = list(reversed(list(mobjects)))
+    while stack:
+        mobject = stack.pop()
+        if id(mobject) in skipped:
+            continue
+        skipped.add(id(mobject))
+        if mobject.updaters:
+            skipped.update(id(member) for member in mobject.get_family())
+            redrawn.append(mobject)
+            continue
+        members.append(mobject)
+        stack.extend(reversed(mobject.submobjects))
+    return members, redrawn
+
+
+class StyleBuffer:
+    """
+    The fill and stroke RGBA data of many mobjects, in one array.
+
+    The operations are relative to the style captured at construction (so they can be
+    applied every frame of an animation) and change only the buffer, until `write` makes
+    every mobject read its style from it. Mobjects that are not VMobjects (images) have
+    no RGBA arrays and are faded one by one with `set_opacity`. Mobjects with updaters
+    (`always_redraw`) get new arrays every frame: `write` gives them one more updater that
+    applies the current operations to whatever their previous updaters built, and they
+    keep it (and the style) after `release`, until `reset`.
+
+    Example:
+        >>> buffer = StyleBuffer(self.mobjects, exclude=[triangle])
+        >>> buffer.scale_opacity(0.1).write()
+    """
+
+    def __init__(self, mobjects: Iterable[Mobject], exclude: Iterable[Mobject] = ()):
+        self.mobjects, self.redrawn = _family_members(mobjects, exclude)
+        self._slices: list[tuple[VMobject, str, slice]] = []
+        self.images: list[tuple[Mobject, float]] = []
+
+        arrays = []
+        size = 0
+        for mobject in self.mobjects:
+            if not isinstance(mobject, VMobject):
+                if hasattr(mobject, "pixel_array"):
+                    self.images.append((mobject, mobject.fill_opacity))
+                continue
+            for attribute in _RGBA_ATTRIBUTES:
+                rgbas = getattr(mobject, attribute, None)
+                if rgbas is None or not len(rgbas):
+                    continue
+                self._slices.append((mobject, attribute, slice(size, size + len(rgbas))))
+                arrays.append(rgbas)
+                size += len(rgbas)
+
+        self.start = np.concatenate(arrays) if arrays else np.zeros((0, 4))
+        self.rgbas = self.start.copy()
+        self._bound = False
+        self._image_opacity = None  # captured opacity -> opacity of the images, set by the operations
+        # the operations, as (start, out) -> None, for the arrays the updaters rebuild
+        self._redrawn_ops: dict[str, Callable[[np.ndarray, np.ndarray], None]] = {}
+        self._redrawn_starts: dict[int, dict[int, tuple[np.ndarray, np.ndarray]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rgbas)
+
+    def scale_opacity(self, factor: float) -> "StyleBuffer":
+        """Multiply the captured opacities by `factor` (transparent parts stay transparent)"""
+        self.rgbas[:, 3] = self.start[:, 3] * factor
+        self._image_opacity = lambda opacity: opacity * factor
+
+        def scale(start: np.ndarray, out: np.ndarray) -> None:
+            out[:, 3] = start[:, 3] * factor
+
+        self._redrawn_ops["alpha"] = scale
+        return self
+
+    def set_opacity(self, opacity: float) -> "StyleBuffer":
+        """Set every opacity to `opacity`"""
+        self.rgbas[:, 3] = opacity
+        self._image_opacity = lambda _: opacity
+
+        def set_alpha(start: np.ndarray, out: np.ndarray) -> None:
+            out[:, 3] = opacity
+
+        self._redrawn_ops["alpha"] = set_alpha
+        return self
+
+    def set_color(self, color: ParsableManimColor, alpha: float = 1.0) -> "StyleBuffer":
+        """
+        Move the captured colors towards `color`, keeping the opacities.
+
+        Args:
+            color (ParsableManimColor): The target color.
+            alpha (float, optional): 0 keeps the captured colors, 1 sets `color`. Defaults to 1.0.
+
+        Returns:
+            StyleBuffer: self.
+        """
+        rgb = ManimColor(color).to_rgb()
+        self.rgbas[:, :3] = self.start[:, :3] + alpha * (rgb - self.start[:, :3])
+
+        def blend(start: np.ndarray, out: np.ndarray) -> None:
+            out[:, :3] = start[:, :3] + alpha * (rgb - start[:, :3])
+
+        self._redrawn_ops["rgb"] = blend
+        return self
+
+    def reset(self) -> "StyleBuffer":
+        """Go back to the captured style"""
+        self.rgbas[:] = self.start
+        self._image_opacity = lambda opacity: opacity
+        self._redrawn_ops.clear()
+        return self
+
+    def _restyle(self, mobject: Mobject) -> None:
+        """Updater of the redrawn mobjects: apply the operations to the arrays they were just given"""
+        if not self._redrawn_ops:
+            return
+        # an array seen before (an updater that does not rebuild the style) is restyled from
+        # its captured start, not from the already restyled values
+        previous = self._redrawn_starts.get(id(mobject), {})
+        current = {}
+        for member in mobject.get_family():
+            for attribute in _RGBA_ATTRIBUTES:
+                rgbas = getattr(member, attribute, None)
+                if rgbas is None or not len(rgbas):
+                    continue
+                seen = previous.get(id(rgbas))
+                start = seen[1] if seen is not None and seen[0] is rgbas else rgbas.copy()
+                current[id(rgbas)] = (rgbas, start)
+                for operation in self._redrawn_ops.values():
+                    operation(start, rgbas)
+        self._redrawn_starts[id(mobject)] = current
+
+    def write(self) -> "StyleBuffer":
+        """
+        Apply the buffer to the mobjects.
+
+        The first call replaces their RGBA arrays with views of the buffer, so later
+        operations are visible right away and `write` only has to fade the images.
+        """
+        if not self._bound:
+            for mobject, attribute, span in self._slices:
+                setattr(mobject, attribute, self.rgbas[span])
+            for mobject in self.redrawn:
+                if self._restyle not in mobject.updaters:
+                    mobject.add_updater(self._restyle)  # after theirs: runs on the rebuilt arrays
+            self._bound = True
+        for mobject in self.redrawn:
+            self._restyle(mobject)
+        if self._image_opacity is not None:
+            for mobject, opacity in self.images:
+                mobject.set_opacity(self._image_opacity(opacity))
+        return self
+
+    def release(self) -> None:
+        """
+        Give the mobjects their own copy of the current style, detached from the buffer
+        (the redrawn mobjects keep restyling themselves with the current operations).
+        """
+        if self._bound:
+            for mobject, attribute, span in self._slices:
+                setattr(mobject, attribute, self.rgbas[span].copy())
+            self._bound = False
+
+
+class FadeAllExcept(Animation):
+    """
+    Fade every mobject of a scene but the given ones, as a single animation.
+
+    The opacities of all the faded submobjects (every glyph of every Tex included) are
+    interpolated with one numpy operation per frame, relative to their current values.
+    Mobjects redrawn by updaters (`always_redraw`) rebuild their style every frame: they are
+    faded right after every redraw, and stay faded once the animation is over.
+
+    Args:
+        scene (Scene): The scene whose mobjects are faded.
+        *keep (Mobject): The mobjects (and their families) left untouched.
+        opacity (float, optional): Final opacity, relative to the current one. Defaults to 0.1.
+
+    Example:
+        >>> self.play(FadeAllExcept(self, triangle, opacity=0.2), FadeIn(question_mark))
+    """
+
+    def __init__(self, scene: Scene, *keep: Mobject, opacity: float = 0.1, **kwargs):
+        self.opacity = opacity
+        self.buffer = StyleBuffer(scene.mobjects, exclude=keep)
+        # the scene redraws every mobject after the first animated one, so animating the
+        # first faded member of the scene redraws them all, without adding anything to it
+        faded = {id(mobject) for mobject in self.buffer.mobjects + self.buffer.redrawn}
+        first = next((mobject for mobject in scene.get_mobject_family_members() if id(mobject) in faded), None)
+        super().__init__(first, suspend_mobject_updating=False, **kwargs)
+
+    def begin(self) -> None:
+        self.starting_mobject = self.mobject
+        self.buffer.write()
+        self.interpolate(0)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        self.buffer.scale_opacity(1 + (self.opacity - 1) * self.rate_func(min(alpha, 1.0))).write()
+
+    def get_all_mobjects(self) -> list[Mobject]:
+        return [self.mobject]
+
+    def finish(self) -> None:
+        super().finish()
+        self.buffer.release()
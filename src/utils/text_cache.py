@@ -0,0 +1,143 @@
+import os
+import atexit
+import pickle
+import hashlib
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+
+from manim import Text, __version__ as manim_version
+
+from src.utils.config import CACHE_DIR
+
+TEXT_CACHE_DIR = CACHE_DIR / "texts"
+
+_font_fingerprints: dict[str, str] = {}
+
+
+def font_fingerprint(font: str = "") -> str:
+    """
+    The text rendering stack a layout depends on: the Pango version and the font file
+    fontconfig resolves `font` to (with its size and mtime).
+
+    Host renders (local backend) and Docker renders share the cache but not their Pango,
+    fontconfig or font files, so a layout made by one must not be reused by the other.
+    """
+    fingerprint = _font_fingerprints.get(font)
+    if fingerprint is None:
+        import manimpango
+
+        pango = getattr(manimpango, "pango_version", lambda: "")()
+        try:
+            result = subprocess.run(
+                ["fc-match", "--format=%{file}", font or "sans-serif"], capture_output=True, text=True, timeout=10
+            )
+            font_file = result.stdout.strip() if result.returncode == 0 else ""
+        except (OSError, subprocess.TimeoutExpired):
+            font_file = ""
+        try:
+            stat = os.stat(font_file) if font_file else None
+        except OSError:
+            stat = None
+        font_id = f"{font_file}:{stat.st_size}:{stat.st_mtime_ns}" if stat else font_file
+        fingerprint = _font_fingerprints[font] = f"{manimpango.__version__}:{pango}:{font_id}"
+    return fingerprint
+
+
+class TextCache:
+    """
+    Persistent cache of laid out `Text` mobjects, shared by every run and render container.
+
+    Manim keeps the SVG files Pango renders, but every run still lays the text out and parses
+    that SVG into paths again. Here the parsed mobject is pickled, keyed by the string,
+    every constructor argument (font, size, line spacing, weight, colors, ...) and the
+    Pango/font files in use (see `font_fingerprint`), and each call returns a fresh copy. Hits and misses are printed when the process exits.
+
+    Example:
+        >>> TEXTS = TextCache()
+        >>> heading = TEXTS.text("ChatGPT", font_size=52).to_edge(UL)
+    """
+
+    def __init__(self, cache_dir: str | Path = TEXT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._memory: dict[str, Text] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.report)
+
+    @staticmethod
+    def _key(text: str, kwargs: dict) -> str:
+        parts = [manim_version, font_fingerprint(kwargs.get("font", "")), text]
+        parts += [f"{name}={value!r}" for name, value in sorted(kwargs.items())]
+        return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _load(self, path: Path) -> Text | None:
+        try:
+            with open(path, "rb") as file:
+                mobject = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        return mobject if isinstance(mobject, Text) else None
+
+    def _store(self, path: Path, mobject: Text) -> None:
+        try:
+            data = pickle.dumps(mobject, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return  # kept in memory only
+        # parallel workers, contact sheet workers and concurrent renders (other processes and
+        # containers) may write the same entry: each through a temporary file of its own
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as file:
+                tmp_path = Path(file.name)
+                file.write(data)
+            tmp_path.replace(path)
+        except OSError as e:
+            # a cache write must never fail the render
+            print(f"⚠️  Text cache entry not saved: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def text(self, text: str, **kwargs) -> Text:
+        """
+        Return a copy of `Text(text, **kwargs)`, built only if it is not cached yet.
+
+        Args:
+            text (str): The text.
+            **kwargs: `Text` keyword arguments.
+
+        Returns:
+            Text: A fresh copy, free to be mutated.
+        """
+        key = self._key(text, kwargs)
+        with self._lock:
+            mobject = self._memory.get(key)
+        if mobject is None:
+            path = self.cache_dir / f"{key}.pkl"
+            mobject = self._load(path)
+            if mobject is None:
+                mobject = Text(text, **kwargs)
+                self._store(path, mobject)
+                self.misses += 1
+            else:
+                self.hits += 1
+            with self._lock:
+                self._memory[key] = mobject
+        else:
+            self.hits += 1
+        return mobject.copy()
+
+    def report(self) -> None:
+        if self.hits or self.misses:
+            print(f"🔤 Text cache: {self.hits} hits, {self.misses} misses ({self.cache_dir})")
+
+
+TEXTS = TextCache()
+
+
+def cached_text(text: str, **kwargs) -> Text:
+    """Drop-in replacement for `Text(...)` backed by the persistent text cache"""
+    return TEXTS.text(text, **kwargs)
@@ -0,0 +1,113 @@
+import os
+import time
+import threading
+from pathlib import Path
+from typing import Callable
+
+from src.utils.config import SOURCES_DIR
+from src.utils.manim_scenes_finder import _iter_source_files
+from src.utils.render_process import RenderCancelledError
+from src.utils.scene_dependencies import DependencyGraph
+
+POLL_INTERVAL = 0.5  # seconds
+DEBOUNCE = 0.3  # seconds without changes before rendering (editors save in several writes)
+
+
+def _snapshot(files: set[Path]) -> dict[Path, int]:
+    snapshot = {}
+    for path in files:
+        try:
+            snapshot[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            pass  # deleted, shows up as a change
+    return snapshot
+
+
+def _diff(old: dict[Path, int], new: dict[Path, int]) -> set[Path]:
+    return {path for path in old.keys() | new.keys() if old.get(path) != new.get(path)}
+
+
+class _Render:
+    """A render running in a background thread, cancellable when it becomes stale"""
+
+    def __init__(self, scene: str, render: Callable[[str, threading.Event], bool]):
+        self.scene = scene
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(render,), daemon=True)
+        self.thread.start()
+
+    def _run(self, render: Callable[[str, threading.Event], bool]) -> None:
+        try:
+            render(self.scene, self.cancel_event)
+        except RenderCancelledError:
+            pass
+
+
+def watch_scenes(
+    render: Callable[[str, threading.Event], bool],
+    scenes: list[str] | None = None,
+    poll_interval: float = POLL_INTERVAL,
+    debounce: float = DEBOUNCE,
+) -> None:
+    """
+    Watch the project and re-render the scenes affected by every change, until Ctrl+C.
+
+    Renders run one at a time in the background; a render whose scene is affected by a
+    newer change is stale, it is cancelled and queued again.
+
+    Args:
+        render (Callable[[str, threading.Event], bool]): Renders a scene, stops when the event is set.
+        scenes (list[str] | None, optional): Only re-render these scenes. Defaults to all.
+        poll_interval (float, optional): Seconds between two scans of the files. Defaults to 0.5.
+        debounce (float, optional): Seconds without changes before rendering. Defaults to 0.3.
+    """
+    graph = DependencyGraph().build()
+
+    def watched() -> set[Path]:
+        # new modules show up in the sources folder before anything imports them
+        return graph.watched_files() | {path.resolve() for path in _iter_source_files(SOURCES_DIR)}
+
+    snapshot = _snapshot(watched())
+    pending: list[str] = []
+    current: _Render | None = None
+
+    watched_scenes = sorted(set(scenes) & graph.scenes.keys()) if scenes else sorted(graph.scenes)
+    print(f"👀 Watching {len(snapshot)} files for {len(watched_scenes)} scenes (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(poll_interval)
+            new_snapshot = _snapshot(watched())
+            changed = _diff(snapshot, new_snapshot)
+            if changed:
+                while True:
+                    time.sleep(debounce)
+                    settled = _snapshot(watched())
+                    if settled == new_snapshot:
+                        break
+                    changed |= _diff(new_snapshot, settled)
+                    new_snapshot = settled
+                snapshot = new_snapshot
+
+                affected = graph.update(changed)
+                if scenes:
+                    affected &= set(scenes)
+                names = ", ".join(sorted(path.name for path in changed))
+                print(f"\n📝 Changed: {names} → {', '.join(sorted(affected)) or 'no scene affected'}")
+
+                for scene in sorted(affected):
+                    if scene not in pending:
+                        pending.append(scene)
+                if current is not None and current.scene in affected and current.thread.is_alive():
+                    print(f"🛑 {current.scene} is stale, cancelling its render")
+                    current.cancel_event.set()
+
+            if current is not None and not current.thread.is_alive():
+                current = None
+            if current is None and pending:
+                current = _Render(pending.pop(0), render)
+    except KeyboardInterrupt:
+        print("\n👋 Stopping watch mode")
+        if current is not None and current.thread.is_alive():
+            current.cancel_event.set()
+            current.thread.join()
@@ -18,7 +18,7 @@ if __name__ == "__main__":
 
     project_dir = Path(__file__).resolve().parent
     file_name = Path(__file__).name
-    command = f'docker run -it --rm -v "{project_dir}:/manim" -w /manim manimcommunity/manim manim {file_name} {scene_to_render} -ql'
+    command = f'docker run -it --rm -v "{project_dir}:/manim" -w /manim manimcommunity/manim:v0.19.0 manim {file_name} {scene_to_render} -ql'
     print(f"Running command: {command}")
 
     os.system(command)